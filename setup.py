@@ -111,8 +111,11 @@ class TestWithPytest(setuptools.Command):
         pyargs += ['tests/script_pfu_simscrub.py']
         pyargs += ['tests/script_pfu_create_checksum.py']
         pyargs += ['tests/script_pfu_check_checksum.py']
+        pyargs += ['tests/script_pfu_check_checksum_large_trees.py']
+        pyargs += ['tests/script_pfu_check_checksum_scrubbing.py']
         pyargs += ['tests/script_pfu_replicate.py']
         pyargs += ['tests/script_pfu_speed_test.py']
+        pyargs += ['tests/module_pfu_module.py']
         if self.src == 'installed':
             pyargs += ['tests/main.py']
         pyplugins = []
@@ -186,6 +189,7 @@ class TestWithUnittest(setuptools.Command):
         loader = unittest.defaultTestLoader
         suite.addTest(loader.loadTestsFromTestCase(
             TestRequiredModuleImport))
+        tests.modules(suite)
         if self.src == 'installed':
             tests.scripts(suite)
         res = unittest.TextTestRunner(verbosity=2).run(suite)
@@ -195,6 +199,69 @@ class TestWithUnittest(setuptools.Command):
             sys.exit(1)
 
 
+class RunBenchmark(setuptools.Command):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    running the benchmarks with unittest
+
+    The benchmarks are not part of the automatic tests (run_unittest and
+    run_pytest), since they need more time and resources.
+    """
+    description = "running the benchmarks with unittest"
+    user_options = [
+        ("src=",
+         None,
+         'Choose what should be tested; installed: ' +
+         'test installed package (default); ' +
+         'local: test package direct from sources ' +
+         '(installing is not necessary). ' +
+         'default: installed')]
+
+    def initialize_options(self):
+        """
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        # pylint: disable=attribute-defined-outside-init
+        self.src = 'installed'
+
+    def finalize_options(self):
+        """
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+
+    def run(self):
+        """
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        # env python3 setup.py run_benchmark
+        if self.src == 'installed':
+            pass
+        elif self.src == 'local':
+            sys.path.insert(0, os.path.abspath('src'))
+        else:
+            raise argparse.ArgumentTypeError(
+                "error in command line: " +
+                "value for option 'src' is not 'installed' or 'local'")
+        sys.path.append(os.path.abspath('.'))
+        # pylint: disable=bad-option-value,import-outside-toplevel
+        import unittest
+        suite = unittest.TestSuite()
+        import tests
+        tests.benchmarks(suite)
+        res = unittest.TextTestRunner(verbosity=2).run(suite)
+        if res.wasSuccessful():
+            sys.exit(0)
+        else:
+            sys.exit(1)
+
+
 class CheckModules(setuptools.Command):
     """
     :Author: Daniel Mohr
@@ -252,6 +319,7 @@ setuptools.setup(
     version='2023.04.23',
     cmdclass={
         'check_modules': CheckModules,
+        'run_benchmark': RunBenchmark,
         'run_unittest': TestWithUnittest,
         'run_pytest': TestWithPytest},
     description='Software to read every file regular (scrubbing).',
@@ -302,19 +370,33 @@ setuptools.setup(
         'Programming Language :: Python :: 3'],
     requires=[
         'argparse',
+        'array',
         'base64',
-        'copy',
+        'binascii',
+        'collections',
+        'collections.abc',
+        'concurrent.futures',
         'datetime',
+        'functools',
         'hashlib',
+        'io',
+        'itertools',
+        'json',
         'logging',
         'logging.handlers',
+        'math',
+        'mmap',
+        'operator',
         'os',
         'os.path',
         'pickle',
+        'queue',
         'platform',
         'random',
         're',
+        'shutil',
         'signal',
+        'stat',
         'subprocess',
         'sys',
         'threading',
@@ -1,12 +1,21 @@
 """
 Author: Daniel Mohr.
 
-Date: 2017-02-13 (last change).
+Date: 2017-02-13, 2026-10-18 (last change).
 
 License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 """
 
 
 from .check_checksum import CheckChecksumsClass
+from .chunk_sweep import ChunkSweep
+from .hash_entries import HashEntries
+from .hash_file_index import HashFileIndex
+from .hash_file_reader import HashFileReader
+from .json_lines_sink import JsonLinesSink
+from .sample import ChunkSample
+from .verification_ledger import VerificationLedger
 
-__all__ = ['CheckChecksumsClass']
+__all__ = ['CheckChecksumsClass', 'ChunkSample', 'ChunkSweep',
+           'HashEntries', 'HashFileIndex', 'HashFileReader',
+           'JsonLinesSink', 'VerificationLedger']
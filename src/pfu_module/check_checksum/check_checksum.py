@@ -1,29 +1,54 @@
 """
 Author: Daniel Mohr.
 
-Date: 2017-03-07, 2021-05-25, 2023-04-25 (last change).
+Date: 2017-03-07, 2021-05-25, 2023-04-25, 2026-10-18 (last change).
 
 License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 """
+# pylint: disable=too-many-lines
 
 import base64
-import copy
+import functools
 import hashlib
+import heapq
+import itertools
 import logging
+import operator
 import os
-import re
+import stat
+import threading
+import time
 
 # own_logger:
 import pfu_module.checksum_tools  # pylint: disable=unused-import
 
+from pfu_module.checksum_tools import map_data_file
+from pfu_module.checksum_tools import open_data_file
+from pfu_module.checksum_tools import HASH_FUNCTIONS
+from pfu_module.checksum_tools import InodeCache
+from pfu_module.checksum_tools import MANIFEST_EXTENSION
 from pfu_module.checksum_tools import read_data_from_file
+from pfu_module.checksum_tools import TEMPORARY_EXTENSION
+
+from .chunk_sweep import chunk_ranges
+from .chunk_sweep import ChunkSweep
+from .chunk_sweep import encode_digest
+from .hash_file_index import HashFileIndex
+from .compare_parallel import compare_parallel
+from .hash_file_reader import HashFileReader
+from .json_lines_sink import JsonLinesSink
+from .json_lines_sink import result_record
+from .repair import copy_chunks
+from .repair import find_replica
+from .sample import ChunkSample
+from .verification_ledger import VerificationLedger
 
 
 class CheckChecksumsClass():
     """
     :Author: Daniel Mohr
     :Email: daniel.mohr@dlr.de
-    :Date: 2017-03-07, 2021-05-25, 2023-04-25 (last change).
+    :Date: 2017-03-07, 2021-05-25, 2023-04-25, 2026-10-18 (last change).
     :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
     class to check checksums in directory or directories
@@ -34,7 +59,13 @@ class CheckChecksumsClass():
                 'md5': hashlib.md5,
                 'sha1': hashlib.sha1,
                 'sha224': hashlib.sha224,
-                'sha384': hashlib.sha384}
+                'sha384': hashlib.sha384,
+                'blake2b': hashlib.blake2b,
+                'blake2s': hashlib.blake2s,
+                'sha3_224': hashlib.sha3_224,
+                'sha3_256': hashlib.sha3_256,
+                'sha3_384': hashlib.sha3_384,
+                'sha3_512': hashlib.sha3_512}
     encodes = {'hex': base64.b16encode,
                'base16': base64.b16encode,
                'Base16': base64.b16encode,
@@ -42,33 +73,32 @@ class CheckChecksumsClass():
                'Base32': base64.b32encode,
                'base64': base64.b64encode,
                'Base64': base64.b64encode}
-    hashtype = {128: ('sha512', 'base16'),
-                104: ('sha512', 'base32'),
-                88: ('sha512', 'base64'),
-                64: ('sha256', 'base16'),
-                56: ('sha256', 'base32'),
-                44: ('sha256', 'base64'),
-                32: ('md5', 'base16 or base32'),
-                24: ('md5', 'base64')}
-    regexps = [
-        re.compile(
-            r"(?P<hash>[0-9a-zA-Z/+=]+) [ \*]{1}(?P<filename>.+) "
-            r"\(bytes (?P<start>[0-9]+) - (?P<stop>[0-9]+)\)$"),
-        re.compile(r"(?P<hash>[0-9a-zA-Z/+=]+) [ \*]{1}(?P<filename>.+)$"),
-        re.compile(r"(?P<type>MD5|SHA256|SHA512|SHA1|SHA224|SHA384)[ ]{0,1}"
-                   r"\((?P<filename>.+)\)[ ]{0,1}= (?P<hash>[0-9a-zA-Z/+=]+)$")
-    ]
 
     def __init__(self,
                  directories=None,
                  hash_extension=None,
                  ignore_extension=None,
                  buf_size=524288,  # 1024*512 Bytes = 512 kB
-                 level=20):
+                 level=20,
+                 *,
+                 use_mmap=0,
+                 io_mode='buffered',
+                 jobs=1,
+                 stream=0,
+                 index=None,
+                 sample=None,
+                 sample_bytes=None,
+                 seed=None,
+                 ledger=None,
+                 reverify_days=30,
+                 hash_files=None,
+                 list_data_files=0,
+                 jsonl=None,
+                 repair=None):
         """
         :Author: Daniel Mohr
         :Email: daniel.mohr@dlr.de
-        :Date: 2017-02-25 (last change).
+        :Date: 2017-02-25, 2026-10-18 (last change).
         :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
         class to create checksums in directory or directories
@@ -77,7 +107,8 @@ class CheckChecksumsClass():
                             Symbolic links in given directories are ignored.
         :param hash_extension: Files with the given extension(s) are
                                interpreted as hash files.
-                               default: [".md5", ".sha256", ".sha512"]
+                               default: the algorithms as extensions,
+                               e. g. [".sha512", ".sha256", ".md5", ...]
         :param ignore_extension: Files with the given extension(s) are ignored
                                  default: ["~", ".tmp", ".bak"]
         :param buf_size: Files will be read in chunks of the given amount of
@@ -87,13 +118,56 @@ class CheckChecksumsClass():
         :param level: Set how verbose should be the output. This is the level
                       of logging. Lower numbers give more output. The parameter
                       is a number between 1 and 50.
+
+        The following parameters are keyword-only.
+
+        :param use_mmap: If set to 1 files larger than buf_size are mapped
+                         to memory (mmap) instead of reading them into a
+                         buffer.
+        :param io_mode: Set the usage of the page cache (see
+                        pfu_module.checksum_tools.IO_MODES).
+                        Set to \"direct\" to check the data on the storage
+                        and not in the page cache (O_DIRECT, use_mmap is
+                        ignored).
+        :param jobs: Number of files checked in parallel. If set to 0 the
+                     number of CPUs is used. The largest files are checked
+                     first.
+        :param stream: If set to 1 the directory trees are checked one
+                       directory after the other
+                       (see check_directory_streaming).
+        :param index: If not None, the parsed hash files are stored in this
+                      file and unchanged hash files are not parsed again
+                      (see HashFileIndex).
+        :param sample: If not None, only a random sample of this fraction
+                       of the Bytes in chunks is checked (see check_sample).
+        :param sample_bytes: If not None, only a random sample of about this
+                             amount of Bytes in chunks is checked
+                             (see check_sample).
+        :param seed: seed for the random sample (None for a random seed)
+        :param ledger: If not None, the verified data files are stored in
+                       this file and only the data files due are verified
+                       (see VerificationLedger).
+        :param reverify_days: Verify every data file at least every
+                              reverify_days days (only used with ledger).
+        :param hash_files: If not None, check the data files referenced by
+                           this list of hash files without listing
+                           directories (see find_files_by_hash_files).
+        :param list_data_files: If set to 1 and hash_files is given, the
+                                directory trees of the hash files are
+                                listed to find data files without hash.
+        :param jsonl: If not None, a record for every file is written to
+                      this file as JSON lines ("-" for stdout,
+                      see write_record).
+        :param repair: If not None, data files with not matching hashes of
+                       chunks are repaired from the replica in this
+                       directory (see repair_file).
         """
-        # pylint: disable=too-many-arguments
+        # pylint: disable=too-many-arguments,too-many-locals
         self.directories = directories
         if directories is None:
             self.directories = ()
         if hash_extension is None:
-            hash_extension = [".md5", ".sha256", ".sha512"]
+            hash_extension = ['.' + alg for alg in HASH_FUNCTIONS]
         hash_extension = set(hash_extension)
         if ignore_extension is None:
             ignore_extension = ["~", ".tmp", ".bak"]
@@ -101,28 +175,75 @@ class CheckChecksumsClass():
         self.accept_hash_extension = hash_extension - self.ignore_extension
         self.not_file_extension = hash_extension & self.ignore_extension
         self.buf_size = buf_size
+        self.use_mmap = use_mmap
+        self.io_mode = io_mode
+        self.jobs = jobs
+        if jobs == 0:
+            self.jobs = os.cpu_count()
+        self.stream = stream
+        self.hash_file_index = None
+        if index is not None:
+            self.hash_file_index = HashFileIndex(index)
+        self.hash_file_reader = HashFileReader(self.hashfcts,
+                                               self.hash_file_index)
+        self.sample = sample
+        self.sample_bytes = sample_bytes
+        self.seed = seed
+        self.sample_number = {}  # results of check_sample
+        self.ledger = None
+        if ledger is not None:
+            self.ledger = VerificationLedger(ledger, reverify_days)
+        self.given_hash_files = hash_files
+        self.list_data_files = list_data_files
+        self.jsonl = jsonl
+        self.result_sink = None  # JsonLinesSink while check_all runs
+        self.repair = repair
+        # the checked directory tree (for the path in the replica)
+        self._tree_root = '.'
         self.level = level
         self.log = logging.getLogger("pfu.check")
         self.log.setLevel(1)
         self.hash_files = []
         self.data_files = []
-        self.hash_dicts = [{}, {}]
+        # stats of the data files from find_files_by_hash_files
+        self._data_file_stats = {}
+        # hashes of chunks and of complete files
+        self.hash_dicts = self.hash_file_reader.new_hash_dicts()
+        # computed hashes of hardlinked files, every inode is read only once
+        self._inode_cache = InodeCache()
+        # for counting in compare_hashes_for_file, which can run in threads
+        self._result_lock = threading.Lock()
+        self.result_number = {}
+        self.reset_result_number()
+
+    def reset_result_number(self):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        set the counters of the results (self.result_number) to 0
+        """
         self.result_number = {'data file without hash': 0,
                               'hash without data file': 0,
                               'data file with matching hash(es)': 0,
                               'data file with not matching hash(es)': 0,
                               'hash for ignored file': 0,
-                              'data file not handled': 0}
+                              'data file not handled': 0,
+                              'reads saved by hardlinks': 0,
+                              'data file verified recently': 0,
+                              'data file repaired': 0}
 
     def determine_hash_encode(self, hash_string, hashfilename=None):
         """
         :Author: Daniel Mohr
         :Email: daniel.mohr@dlr.de
-        :Date: 2017-03-02 (last change).
+        :Date: 2017-03-02, 2026-10-18 (last change).
         :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
-        Try to determine hash function and encode from hash.
-        If this is not possible assume the file extension gives the hash type.
+        Try to determine hash function and encode from hash
+        (see HashFileReader.determine_hash_encode).
 
         :param hash_string: the hash to analyse
         :param hashfilename: file name of the hash
@@ -131,28 +252,8 @@ class CheckChecksumsClass():
         :return: tuple of hash algorithm and encoding
                  or None on error
         """
-        hash_encode = None
-        if len(hash_string) in self.hashtype:
-            hash_encode = self.hashtype[len(hash_string)]
-            if hash_encode[1] == 'base16 or base32':
-                if hash_string[-6:] == '======':
-                    hash_encode = (hash_encode[0], 'base32')
-                else:
-                    hash_encode = (hash_encode[0], 'base16')
-        if (hash_encode is None) and (hashfilename is not None):
-            extension = os.path.splitext(hashfilename)[1][1:].strip().lower()
-            if extension in self.hashfcts:
-                # assume file extension gives the hash type
-                # the coding is really hard to detect, therefore assume base16
-                # RFC 3548 defines the following alphabets:
-                # base64: ABCDEFGHIJKLMNOPQRSTUVWXYZ
-                #         abcdefghijklmnopqrstuvwxyz0123456789-_
-                # base32: abcdefghijklmnopqrstuvwxyz234567
-                # base16: 0123456789ABCDEF
-                # Unfortunately typical used tools like *sum (e. g. md5sum)
-                # gives the output as base16 in lower letters.
-                hash_encode = (extension, 'base16')
-        return hash_encode
+        return self.hash_file_reader.determine_hash_encode(hash_string,
+                                                           hashfilename)
 
     def is_accept_hash_file(self, filename):
         """
@@ -193,16 +294,17 @@ class CheckChecksumsClass():
         """
         :Author: Daniel Mohr
         :Email: daniel.mohr@dlr.de
-        :Date: 2016-12-03 (last change).
+        :Date: 2016-12-03, 2026-10-18 (last change).
         :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
         It is assumed the file is not a hash file.
+        Manifests and temporary files of the hash files are no data files.
 
         :param filename: filename to analyse
 
         :return: True, if file extension indicates a data file
         """
-        ret = True
+        ret = not filename.endswith((MANIFEST_EXTENSION, TEMPORARY_EXTENSION))
         for file_extention in self.ignore_extension:
             if filename.endswith(file_extention):
                 ret = False
@@ -212,7 +314,7 @@ class CheckChecksumsClass():
         """
         :Author: Daniel Mohr
         :Email: daniel.mohr@dlr.de
-        :Date: 2016-12-08 (last change).
+        :Date: 2016-12-08, 2026-10-18 (last change).
         :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
         go to the directory tree and analyse the files
@@ -224,394 +326,731 @@ class CheckChecksumsClass():
         self.hash_files = []
         self.data_files = []
         for (dirpath, _, filenames) in os.walk(name):
-            for filename in filenames:
-                absfilename = os.path.normpath(os.path.join(dirpath, filename))
-                if self.is_accept_hash_file(absfilename):
-                    self.hash_files += [absfilename]
-                elif self.is_accept_data_file2(absfilename):
-                    self.data_files += [absfilename]
+            self._find_files(dirpath, filenames)
 
-    def _analyse_hashline_of_chunk(self, sres, hashfilename):
+    def _find_files(self, dirpath, filenames):
         """
         :Author: Daniel Mohr
         :Email: daniel.mohr@dlr.de
-        :Date: 2017-03-02 (last change).
+        :Date: 2026-10-18 (last change).
         :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
-        Analyse line of a hash file describing hash of a chunk.
+        Add the files in the directory to self.hash_files and
+        self.data_files.
         This method should not be called from outside.
 
-        :param sres: re instance
-        :param hashfilename: file name of the hash
-                             (normaly only path is used, if hash is not unique
-                             the file extension is used)
-        """
-        hash_encode = self.determine_hash_encode(sres.group('hash'),
-                                                 hashfilename)
-        if hash_encode is not None:
-            relfilename = os.path.normpath(
-                os.path.join(os.path.dirname(hashfilename),
-                             sres.group('filename')))
-            if hash_encode[1] == 'base64':
-                hash_string = sres.group('hash')
-            else:
-                hash_string = sres.group('hash').lower()
-            if relfilename in self.hash_dicts[0]:
-                self.hash_dicts[0][relfilename] += [(
-                    hash_string,
-                    hash_encode,
-                    hashfilename,
-                    int(sres.group('start')),
-                    int(sres.group('stop')))]
-            else:
-                self.hash_dicts[0][relfilename] = [(
-                    hash_string,
-                    hash_encode,
-                    hashfilename,
-                    int(sres.group('start')),
-                    int(sres.group('stop')))]
+        :param dirpath: name of the directory
+        :param filenames: names of the files in the directory
+        """
+        for filename in filenames:
+            absfilename = os.path.normpath(os.path.join(dirpath, filename))
+            if self.is_accept_hash_file(absfilename):
+                self.hash_files += [absfilename]
+            elif self.is_accept_data_file2(absfilename):
+                self.data_files += [absfilename]
 
-    def _analyse_hashline_of_file(self, sres, hashfilename):
+    def parse_hash_lines(self, lines, hashfilename):
         """
         :Author: Daniel Mohr
         :Email: daniel.mohr@dlr.de
-        :Date: 2017-03-02 (last change).
+        :Date: 2026-10-18 (last change).
         :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
-        Analyse line of a hash file describing hash of complete file.
-        This method should not be called from outside.
+        Parse the lines of the hash file hashfilename and store the hashes
+        in self.hash_dicts (see HashFileReader.parse_hash_lines).
 
-        :param sres: re instance
+        :param lines: iterable of the lines of the hash file
         :param hashfilename: file name of the hash
-                             (normaly only path is used, if hash is not unique
-                             the file extension is used)
-        """
-        hash_encode = self.determine_hash_encode(sres.group('hash'),
-                                                 hashfilename)
-        if hash_encode is not None:
-            relfilename = os.path.normpath(
-                os.path.join(
-                    os.path.dirname(hashfilename),
-                    sres.group('filename')))
-            if hash_encode[1] == 'base64':
-                hash_string = sres.group('hash')
-            else:
-                hash_string = sres.group('hash').lower()
-            if relfilename in self.hash_dicts[1]:
-                self.hash_dicts[1][relfilename] += [(
-                    hash_string,
-                    hash_encode,
-                    hashfilename)]
-            else:
-                self.hash_dicts[1][relfilename] = [(
-                    hash_string,
-                    hash_encode,
-                    hashfilename)]
-
-    def _analyse_hashline_of_file_bsd(self, sres, hashfilename):
         """
-        :Author: Daniel Mohr
-        :Email: daniel.mohr@dlr.de
-        :Date: 2017-03-01 (last change).
-        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
-
-        Analyse line of a hash file describing hash of complete file in
-        BSD-style.
-        This method should not be called from outside.
-
-        :param sres: re instance
-        :param hashfilename: file name of the hash (here only path is used)
-        """
-        relfilename = os.path.normpath(
-            os.path.join(
-                os.path.dirname(hashfilename),
-                sres.group('filename')))
-        if relfilename in self.hash_dicts[1]:
-            self.hash_dicts[1][relfilename] += [(
-                sres.group('hash').lower(),
-                (sres.group('type').lower(), 'base16'),
-                hashfilename)]
-        else:
-            self.hash_dicts[1][relfilename] = [(
-                sres.group('hash').lower(),
-                (sres.group('type').lower(), 'base16'),
-                hashfilename)]
+        self.hash_file_reader.parse_hash_lines(lines, hashfilename,
+                                               self.hash_dicts)
 
     def read_hash_file(self, hashfilename):
         """
         :Author: Daniel Mohr
         :Email: daniel.mohr@dlr.de
-        :Date: 2017-02-25, 2023-04-25 (last change).
+        :Date: 2017-02-25, 2023-04-25, 2026-10-18 (last change).
         :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
-        read hash file
+        read hash file into self.hash_dicts
+        (see HashFileReader.read_hash_file)
 
         :param hashfilename: read this file
         """
-        if (os.path.isfile(hashfilename) and
-                os.access(hashfilename, os.R_OK)):
-            self.log.debug("read hash file \"%s\"", hashfilename)
-            with open(hashfilename, mode='r', encoding='utf-8') as hash_file:
-                for line in hash_file:
-                    sres = self.regexps[0].search(line)
-                    if sres:  # hash of a chunk
-                        self._analyse_hashline_of_chunk(
-                            sres, hashfilename)
-                    else:
-                        sres = self.regexps[1].search(line)
-                        if sres:  # hash of a complete file
-                            self._analyse_hashline_of_file(
-                                sres, hashfilename)
-                        else:
-                            sres = self.regexps[2].search(line)
-                            if sres:  # hash of a complete file (BSD-style)
-                                self._analyse_hashline_of_file_bsd(
-                                    sres, hashfilename)
-                            else:
-                                self.log.warning(
-                                    "do not understand line in hash file "
-                                    "\"%s\": %s", hashfilename, line)
-        elif not os.access(hashfilename, os.R_OK):
-            self.log.warning('hash file "%s" is not readable', hashfilename)
-        else:
-            self.log.warning('hash file "%s" not existing (anymore?)',
-                             hashfilename)
+        self.hash_file_reader.read_hash_file(hashfilename, self.hash_dicts)
 
     def read_all_hash_files(self):
         """
         :Author: Daniel Mohr
         :Email: daniel.mohr@dlr.de
-        :Date: 2016-12-03 (last change).
+        :Date: 2016-12-03, 2026-10-18 (last change).
         :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
         read all hash files already found by the class
         """
         self.log.debug("read_all_hash_files")
-        self.hash_dicts = [{}, {}]
+        self.hash_dicts = self.hash_file_reader.new_hash_dicts()
         # self.hash_dicts[0][filename]...
         for filename in self.hash_files:
             self.read_hash_file(filename)
-        for filename in self.hash_dicts[0]:
-            self.hash_dicts[0][filename].sort(key=lambda x: x[3])
 
-    def compare_hashes_for_file(self, filename):
+    def compare_hashes_for_file(self, filename, file_stat=None):
         """
         :Author: Daniel Mohr
         :Email: daniel.mohr@dlr.de
-        :Date: 2017-03-07, 2021-05-25 (last change).
+        :Date: 2017-03-07, 2021-05-25, 2026-10-18 (last change).
         :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
         compare hashes for the given filename
 
+        Hardlinked files are read only once: The computed hashes are cached
+        by the inode and used for the other hardlinks, if these need no
+        other hashes (see pfu_module.checksum_tools.InodeCache).
+
         :param filename: string of the filename
+        :param file_stat: result of os.stat for the file
+                          (None to call os.stat)
+
+        :return: tuple of: True if all hashes match, the number of hashes,
+                 the number of hashes of chunks, the size of the file, the
+                 Bytes read, the time to read and hash in seconds and the
+                 list of the ranges (start, stop) of not matching chunks
         """
         # pylint: disable=too-many-locals,too-many-branches,too-many-statements
         match = True
-        number_hashes = 0
-        if filename in self.hash_dicts[1]:
-            number_hashes = len(self.hash_dicts[1][filename])
-        hash_objects = [None] * number_hashes  # global hash objects
-        for i in range(number_hashes):
-            hash_objects[i] = self.hashfcts[
-                self.hash_dicts[1][filename][i][1][0]]()
-        number_chunk_hashes = 0
-        chunks = []
-        if filename in self.hash_dicts[0]:
-            number_chunk_hashes = len(self.hash_dicts[0][filename])
-            chunks = copy.deepcopy(self.hash_dicts[0][filename])
-            # chunks is list of: (hash, (alg, encode), hashfile, start, stop)
-        chunk_objects = []
-        chunk_objects_index = []
-        filesize = os.path.getsize(filename)
-        with open(filename, 'rb') as data_file:
-            next_pos = None
-            while data_file.tell() < filesize:
-                act_pos = data_file.tell()
-                for (i, chunk) in enumerate(chunks):
-                    if act_pos == chunk[3]:
-                        if next_pos is None:
-                            next_pos = chunk[4]
-                        else:
-                            next_pos = min(next_pos, chunk[4])
-                        chunk_objects += [self.hashfcts[chunk[1][0]]()]
-                        chunk_objects_index += [i]
-                if next_pos is None:
-                    for chunk in chunks:
-                        if act_pos < chunk[3]:
-                            if next_pos is None:
-                                next_pos = chunk[3]
-                            else:
-                                next_pos = min(next_pos, chunk[3])
-                    if next_pos is None:
-                        next_pos = filesize-1
-                read_data_from_file(
-                    self.buf_size,
-                    data_file,
-                    next_pos + 1 - act_pos,
-                    hash_objects + chunk_objects)
-                next_pos = None
-                # we need one before up to end of while:
-                act_pos = data_file.tell()-1
-                i = 0
-                while i < len(chunk_objects):
-                    if act_pos == chunks[chunk_objects_index[i]][4]:
-                        # compare hash
-                        encode = self.encodes[
-                            chunks[chunk_objects_index[i]][1][1]]
-                        cal_hash = encode(
-                            chunk_objects[chunk_objects_index[i]].digest())
-                        if chunks[chunk_objects_index[i]][1][1] != 'base64':
-                            cal_hash = cal_hash.lower()
-                        if (cal_hash.decode() !=
-                                chunks[chunk_objects_index[i]][0]):
-                            match = False
-                            break
-                        del chunks[chunk_objects_index[i]]
-                        del chunk_objects[chunk_objects_index[i]]
-                        del chunk_objects_index[i]
-                        for (j, _) in enumerate(chunk_objects_index):
-                            if chunk_objects_index[j] >= i:
-                                chunk_objects_index[j] -= 1
-                    else:
-                        if next_pos is None:
-                            next_pos = chunks[chunk_objects_index[i]][4]
-                        else:
-                            next_pos = min(
-                                next_pos, chunks[chunk_objects_index[i]][4])
-                        i += 1
-                if next_pos is not None:
-                    act_pos += 1  # it was wrong before
-                    for chunk in chunks:
-                        if act_pos < chunk[3]:
-                            next_pos = min(next_pos, chunk[3])
-                if not match:
-                    break
+        # the stored hashes are created on access, therefore only once
+        file_hashes = self.hash_dicts[1].get(filename, [])
+        chunks = self.hash_dicts[0].get(filename, [])
+        number_hashes = len(file_hashes)
+        number_chunk_hashes = len(chunks)
+        dt0 = time.perf_counter()
+        if file_stat is None:
+            file_stat = os.stat(filename)
+        filesize = file_stat.st_size
+        cached = self._inode_cache.get(file_stat)
+        if cached is not None:
+            expected = [((hash_entry[1][0], hash_entry[1][1], None, None),
+                         hash_entry[0])
+                        for hash_entry in file_hashes]
+            expected += [((chunk[1][0], chunk[1][1], chunk[3], chunk[4]),
+                          chunk[0])
+                         for chunk in chunks]
+            if all(key in cached for (key, _) in expected):
+                with self._result_lock:
+                    self.result_number['reads saved by hardlinks'] += 1
+                match = all(cached[key] == hash_string
+                            for (key, hash_string) in expected)
+                return (match, number_hashes, number_chunk_hashes, filesize,
+                        0, time.perf_counter() - dt0, [])
+        # global hash objects
+        hash_objects = [self.hashfcts[hash_entry[1][0]]()
+                        for hash_entry in file_hashes]
+        # one buffer for the file, reused for every read
+        buf = bytearray(max(1, min(self.buf_size, filesize)))
+        min_mmap_size = self.buf_size
+        if (not self.use_mmap) or (self.io_mode == 'direct'):
+            min_mmap_size = float('inf')
+        sweep = ChunkSweep(chunks, filesize, self.hashfcts, self.encodes)
+        with open_data_file(filename, self.io_mode,
+                            self.buf_size) as data_file, \
+                map_data_file(data_file, min_mmap_size) as mapped:
+            bad_chunks = sweep.read(
+                data_file, filesize, hash_objects,
+                functools.partial(read_data_from_file, self.buf_size,
+                                  buf=buf, mapped=mapped,
+                                  io_mode=self.io_mode))
+            bytes_read = data_file.tell()
+        match = not bool(bad_chunks)
+        # (alg, encode, start, stop): computed hash (start, stop None for
+        # the complete file)
+        computed = sweep.computed
         # compare global hash
-        for i in range(number_hashes):
-            encode = self.encodes[self.hash_dicts[1][filename][i][1][1]]
-            cal_hash = encode(hash_objects[i].digest())
-            if self.hash_dicts[1][filename][i][1][1] != 'base64':
-                cal_hash = cal_hash.lower()
-            if cal_hash.decode() != self.hash_dicts[1][filename][i][0]:
+        for (hash_entry, hash_object) in zip(file_hashes, hash_objects):
+            cal_hash = encode_digest(self.encodes, hash_object.digest(),
+                                     hash_entry[1][1])
+            computed[(hash_entry[1][0], hash_entry[1][1],
+                      None, None)] = cal_hash
+            if cal_hash != hash_entry[0]:
                 match = False
                 break
-        return (match, number_hashes, number_chunk_hashes, filesize)
+        if match:
+            self._inode_cache.put(file_stat, computed)
+        return (match, number_hashes, number_chunk_hashes, filesize,
+                bytes_read, time.perf_counter() - dt0, bad_chunks)
+
+    def catalog(self):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Join the data files, the chunk hashes and the hashes of complete
+        files in a single merge pass over the sorted file names.
+        Therefore no membership test in self.data_files is needed and the
+        effort is O(N log N) for N files.
+
+        :return: generator of sorted tuples of the file name, True if it is
+                 a data file and True if hash(es) for the file are available
+        """
+        # (name, False) for a data file, (name, True) for a hash
+        for (name, group) in itertools.groupby(
+                heapq.merge(
+                    ((name, False) for name in sorted(self.data_files)),
+                    ((name, True) for name in sorted(self.hash_dicts[0])),
+                    ((name, True) for name in sorted(self.hash_dicts[1]))),
+                key=operator.itemgetter(0)):
+            kinds = {is_hash for (_, is_hash) in group}
+            yield (name, False in kinds, True in kinds)
 
-    def analyse_all_files(self):
+    def analyse_all_files(self, reset=True):
         """
         :Author: Daniel Mohr
         :Email: daniel.mohr@dlr.de
-        :Date: 2017-02-25 (last change).
+        :Date: 2017-02-25, 2026-10-18 (last change).
         :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
         analyse all files and compare hashes
+
+        :param reset: If True, self.result_number is set to 0 before.
+                      Otherwise the results are added.
         """
         self.log.debug("analyse_all_files")
-        files = list(set(self.hash_dicts[0].keys()) |
-                     set(self.hash_dicts[1].keys()) |
-                     set(self.data_files))
-        files.sort()
-        self.result_number = {'data file without hash': 0,
-                              'hash without data file': 0,
-                              'data file with matching hash(es)': 0,
-                              'data file with not matching hash(es)': 0,
-                              'hash for ignored file': 0,
-                              'data file not handled': 0}
-        for filename in files:
-            if filename in self.data_files:
-                if (((filename in self.hash_dicts[0]) or
-                     (filename in self.hash_dicts[1])) and
-                        os.path.isfile(filename) and
-                        os.access(filename, os.R_OK)):
-                    # data file and related hash(es) available
-                    (match,
-                     number_hashes,
-                     number_chunk_hashes,
-                     filesize) = self.compare_hashes_for_file(filename)
-                    if match:
-                        self.result_number[
-                            'data file with matching hash(es)'] += 1
-                        self.log.verboseinfo(  # pylint: disable=no-member
-                            'file \"%s\" %i: OK (#hash= %i #chunk_hash= %i)',
-                            filename,
-                            filesize,
-                            number_hashes,
-                            number_chunk_hashes)
-                    else:
-                        self.result_number[
-                            'data file with not matching hash(es)'] += 1
-                        self.log.verboseinfo(  # pylint: disable=no-member
-                            'file \"%s\" %i: bad, hash mismatch '
-                            '(some of: #hash= %i #chunk_hash= %i)',
-                            filename,
-                            filesize,
-                            number_hashes,
-                            number_chunk_hashes)
-                elif not ((filename in self.hash_dicts[0]) or
-                          (filename in self.hash_dicts[1])):
-                    self.result_number['data file without hash'] += 1
-                    self.log.verboseinfo(  # pylint: disable=no-member
-                        'file \"%s\": no corresponding hash(es) found',
-                        filename)
+        if reset:
+            self.reset_result_number()
+        # for self.jobs > 1 or self.ledger, file name: result of os.stat
+        to_compare = {}
+        for (filename, is_data_file, has_hash) in self.catalog():
+            if is_data_file and has_hash:
+                # data file and related hash(es) available
+                file_stat = self._stat_data_file(filename)
+                if file_stat is None:
+                    continue
+                if (self.jobs > 1) or (self.ledger is not None):
+                    to_compare[filename] = file_stat
                 else:
-                    self.result_number['data file not handled'] += 1
-                    if not os.access(filename, os.R_OK):
-                        self.log.warning('file "%s" is not readable', filename)
-                    if not os.path.isfile(filename):
-                        self.log.warning('file "%s" not existing (anymore?)',
-                                         filename)
-                    else:
-                        self.log.warning('cannot handle file "%s"', filename)
+                    self._compare_file(filename, file_stat)
             else:
-                if os.path.isfile(filename) is True:
-                    filesize = os.path.getsize(filename)
-                    self.result_number['hash for ignored file'] += 1
-                    self.log.verboseinfo(  # pylint: disable=no-member
-                        'file \"%s\" % i: ignored, but hash(es) available',
-                        filename,
-                        filesize)
+                self._count_not_compared_file(filename, is_data_file,
+                                              has_hash)
+        if self.ledger is not None:
+            to_compare = self._select_by_ledger(to_compare)
+        if (self.jobs > 1) and bool(to_compare):
+            compare_parallel(to_compare, self.jobs,
+                             self.compare_hashes_for_file,
+                             self._count_compared_file,
+                             self._count_not_handled_file)
+        else:
+            for (filename, file_stat) in to_compare.items():
+                self._compare_file(filename, file_stat)
+
+    def _stat_data_file(self, filename):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Get the result of os.stat for the data file, only once for every
+        data file (e. g. from find_files_by_hash_files). A data file, which
+        cannot be accessed or is not a regular file, is counted as not
+        handled.
+        This method should not be called from outside.
+
+        :param filename: string of the filename
+
+        :return: result of os.stat or None
+        """
+        file_stat = self._data_file_stats.pop(filename, None)
+        if file_stat is None:
+            try:
+                file_stat = os.stat(filename)
+            except OSError as err:
+                self._count_not_handled_file(filename, err)
+                return None
+        if not stat.S_ISREG(file_stat.st_mode):
+            self._count_not_handled_file(filename, None)
+            return None
+        return file_stat
+
+    def _compare_file(self, filename, file_stat):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Compare the hashes of the data file and count the result.
+        This method should not be called from outside.
+
+        :param filename: string of the filename
+        :param file_stat: result of os.stat for the file
+        """
+        try:
+            result = self.compare_hashes_for_file(filename, file_stat)
+        except OSError as err:
+            self._count_not_handled_file(filename, err)
+        else:
+            self._count_compared_file(filename, result)
+
+    def _count_not_handled_file(self, filename, err):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Count and log a data file, which could not be compared, e. g. it
+        was deleted or got not readable after it was found.
+        This method should not be called from outside.
+
+        :param filename: string of the filename
+        :param err: OSError accessing the data file
+                    (None for a data file, which is not a regular file)
+        """
+        self.result_number['data file not handled'] += 1
+        self.write_record(filename, 'not handled')
+        if self.ledger is not None:
+            self.ledger.verified(filename, False)
+        if isinstance(err, FileNotFoundError):
+            self.log.warning('file "%s" not existing (anymore?)', filename)
+        elif isinstance(err, PermissionError):
+            self.log.warning('file "%s" is not readable', filename)
+        elif err is None:
+            self.log.warning('cannot handle file "%s"', filename)
+        else:
+            self.log.warning('cannot handle file "%s": %s', filename, err)
+
+    def _count_not_compared_file(self, filename, is_data_file, has_hash):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Count and log a file of the catalog, which is not compared.
+        This method should not be called from outside.
+
+        :param filename: string of the filename
+        :param is_data_file: True if it is a data file
+        :param has_hash: True if hash(es) for the file are available
+                         (not for a data file)
+        """
+        if is_data_file and not has_hash:
+            self.result_number['data file without hash'] += 1
+            self.write_record(filename, 'no hash')
+            self.log.verboseinfo(  # pylint: disable=no-member
+                'file \"%s\": no corresponding hash(es) found',
+                filename)
+        elif os.path.isfile(filename) is True:
+            filesize = os.path.getsize(filename)
+            self.result_number['hash for ignored file'] += 1
+            self.write_record(filename, 'ignored')
+            self.log.verboseinfo(  # pylint: disable=no-member
+                'file \"%s\" % i: ignored, but hash(es) available',
+                filename,
+                filesize)
+        else:
+            self.result_number['hash without data file'] += 1
+            self.write_record(filename, 'missing')
+            self.log.verboseinfo(  # pylint: disable=no-member
+                'file \"%s\": not found, but hash(es) available',
+                filename)
+
+    def _select_by_ledger(self, file_stats):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Count and log the data files skipped by self.ledger and the data
+        files, which cannot be accessed (as not handled).
+        This method should not be called from outside.
+
+        :param file_stats: dict of the data files to compare,
+                           file name: result of os.stat
+
+        :return: dict of the data files due (see VerificationLedger.select)
+        """
+        selected = self.ledger.select(list(file_stats), file_stats)
+        for filename in file_stats:
+            if filename in self.ledger.stat_errors:
+                self._count_not_handled_file(
+                    filename, self.ledger.stat_errors[filename])
+            elif filename not in selected:
+                self.result_number['data file verified recently'] += 1
+                self.write_record(filename, 'skipped')
+                self.log.verboseinfo(  # pylint: disable=no-member
+                    'file \"%s\": skipped, verified recently', filename)
+        return {filename: file_stat
+                for (filename, file_stat) in file_stats.items()
+                if filename in selected}
+
+    def write_record(self, filename, status, result=None):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Write a record for the file to self.result_sink (if not None,
+        see result_record).
+
+        :param filename: string of the filename
+        :param status: status of the file (see result_record)
+        :param result: result of compare_hashes_for_file for filename
+        """
+        if self.result_sink is not None:
+            self.result_sink.write(result_record(filename, status, result))
+
+    def repair_file(self, filename, bad_chunks):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Repair the not matching chunks of the data file by the replica
+        self.repair: Only the ranges of the not matching chunks are read
+        from the replica of the data file (same path relative to the
+        replica as the data file relative to the checked directory tree).
+        A range is only written to the data file, if it matches all hashes
+        of the chunk. Afterwards the data file is compared again.
+
+        :param filename: data file with not matching hash(es)
+        :param bad_chunks: list of the ranges (start, stop) of the not
+                           matching chunks (see compare_hashes_for_file)
+
+        :return: result of compare_hashes_for_file after the repair or None,
+                 if the data file could not be repaired (e. g. an OSError
+                 accessing the data file or the replica)
+        """
+        if not bool(bad_chunks):
+            self.log.warning(
+                'file "%s": cannot repair, no chunk with not matching hash',
+                filename)
+            return None
+        try:
+            replica = find_replica(filename, self._tree_root, self.repair)
+            if replica is None:
+                return None
+            ranges = chunk_ranges(self.hash_dicts[0].get(filename, []),
+                                  os.path.getsize(filename))
+            copy_chunks(
+                filename, replica,
+                {key: ranges[key] for key in bad_chunks if key in ranges},
+                self.hashfcts, self.encodes)
+            result = self.compare_hashes_for_file(filename)
+        except OSError as err:
+            # e. g. a read-only data file or a not readable replica
+            self.log.warning('cannot repair "%s": %s', filename, err)
+            return None
+        if not result[0]:
+            self.log.warning('file "%s": cannot repair', filename)
+            return None
+        return result
+
+    def _count_compared_file(self, filename, result):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Count and log the result of compare_hashes_for_file.
+        This method should not be called from outside.
+
+        :param filename: string of the filename
+        :param result: result of compare_hashes_for_file for filename
+        """
+        (match, number_hashes, number_chunk_hashes, filesize) = result[0:4]
+        for (start, stop) in result[6]:
+            self.log.verboseinfo(  # pylint: disable=no-member
+                'file "%s" bytes %i - %i: bad, hash mismatch',
+                filename, start, stop)
+        status = 'ok' if match else 'bad'
+        if (not match) and (self.repair is not None):
+            repaired = self.repair_file(filename, result[6])
+            if repaired is not None:
+                match = True
+                status = 'repaired'
+                self.result_number['data file repaired'] += 1
+                result = repaired[0:6] + result[6:7]
+        if self.ledger is not None:
+            self.ledger.verified(filename, match)
+        self.write_record(filename, status, result)
+        if status == 'repaired':
+            self.log.warning(
+                'file "%s" %i: repaired (#hash= %i #chunk_hash= %i)',
+                filename, filesize, number_hashes, number_chunk_hashes)
+        elif match:
+            self.result_number['data file with matching hash(es)'] += 1
+            self.log.verboseinfo(  # pylint: disable=no-member
+                'file \"%s\" %i: OK (#hash= %i #chunk_hash= %i)',
+                filename,
+                filesize,
+                number_hashes,
+                number_chunk_hashes)
+        else:
+            self.result_number['data file with not matching hash(es)'] += 1
+            self.log.verboseinfo(  # pylint: disable=no-member
+                'file \"%s\" %i: bad, hash mismatch '
+                '(some of: #hash= %i #chunk_hash= %i)',
+                filename,
+                filesize,
+                number_hashes,
+                number_chunk_hashes)
+
+    def check_directory_streaming(self, name):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Check the directory tree one directory after the other (top down):
+        The hash files of a directory are read and the data files of the
+        directory are checked before the next directory is handled.
+        Hashes for files in subdirectories are kept until the subdirectory
+        is handled. Therefore the used memory is bounded by the size of a
+        directory (and the hashes for not yet handled subdirectories) and
+        not by the size of the tree.
+
+        The results are the same as for find_all_files, read_all_hash_files
+        and analyse_all_files, if hash files only describe files in its
+        directory or its subdirectories (as created by pfu create_checksum).
+
+        :param name: name of the top level directory
+        """
+        self.log.info("analyse directory tree \"%s\" resolved here to \"%s\"",
+                      name, os.path.abspath(name))
+        self.reset_result_number()
+        new_hash_dicts = self.hash_file_reader.new_hash_dicts
+        pending = {}  # directory: hash_dicts of the not yet handled files
+        for (dirpath, _, filenames) in os.walk(name):
+            self.hash_files = []
+            self.data_files = []
+            self._find_files(dirpath, filenames)
+            self.read_all_hash_files()
+            for (index, hash_dict) in enumerate(self.hash_dicts):
+                for (filename, hashes) in hash_dict.items():
+                    pending.setdefault(
+                        os.path.dirname(filename) or '.',
+                        new_hash_dicts())[index].extend(filename, hashes)
+            self.hash_dicts = pending.pop(os.path.normpath(dirpath),
+                                          new_hash_dicts())
+            self.analyse_all_files(reset=False)
+        # hashes for files not in the handled directories
+        self.data_files = []
+        for directory in sorted(pending):
+            self.hash_dicts = pending.pop(directory)
+            self.analyse_all_files(reset=False)
+        self.hash_files = []
+        self.hash_dicts = new_hash_dicts()
+
+    def check_sample(self):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Check a random sample of the chunks of the data files already found
+        and read (see find_all_files and read_all_hash_files). Only the
+        sampled chunks are read.
+
+        Every chunk is sampled with the same probability: self.sample or
+        self.sample_bytes divided by the Bytes in all chunks (the smaller
+        one). The sample is reproducible by self.seed (see ChunkSample).
+        Data files without hashes of chunks cannot be sampled.
+
+        The results are stored in self.sample_number. For every data file
+        with a sampled chunk a record is written (see write_record, only the
+        sampled chunks are counted as hashes of chunks).
+
+        :return: the ChunkSample (e. g. to log the result)
+        """
+        self.log.debug("check_sample")
+        sample = ChunkSample(self.hashfcts, self.encodes, self.seed)
+        self.sample_number = sample.number
+        data_files = []  # data files with hashes of chunks
+        for (filename, is_data_file, _) in self.catalog():
+            if is_data_file and os.path.isfile(filename):
+                if filename in self.hash_dicts[0]:
+                    data_files.append(filename)
+                    sample.count(chunk_ranges(self.hash_dicts[0][filename],
+                                              os.path.getsize(filename)))
                 else:
-                    self.result_number['hash without data file'] += 1
-                    self.log.verboseinfo(  # pylint: disable=no-member
-                        'file \"%s\": not found, but hash(es) available',
-                        filename)
+                    sample.number['data file without chunk hash'] += 1
+        sample.set_probability(self.sample, self.sample_bytes)
+        self.log.info('sample seed: %i', sample.seed)
+        read = functools.partial(read_data_from_file, self.buf_size,
+                                 buf=bytearray(self.buf_size),
+                                 io_mode=self.io_mode)
+        for filename in data_files:
+            filesize = os.path.getsize(filename)
+            sampled = sample.select(
+                chunk_ranges(self.hash_dicts[0][filename], filesize))
+            if not bool(sampled):
+                continue
+            dt0 = time.perf_counter()
+            with open_data_file(filename, self.io_mode,
+                                self.buf_size) as data_file:
+                bad_chunks = sample.check(filename, data_file, sampled, read)
+            self.write_record(
+                filename, 'bad' if bool(bad_chunks) else 'ok',
+                (not bool(bad_chunks), 0, len(sampled), filesize,
+                 sum(stop - start + 1 for (start, stop) in sampled),
+                 time.perf_counter() - dt0, bad_chunks))
+        return sample
 
-    def check_all(self):
+    def find_files_by_hash_files(self, hash_files):
         """
         :Author: Daniel Mohr
         :Email: daniel.mohr@dlr.de
-        :Date: 2017-02-25 (last change).
+        :Date: 2026-10-18 (last change).
         :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
-        check checksums
+        Read the given hash files and find the data files referenced by
+        them without listing any directory. Only the referenced data files
+        are accessed (os.stat, the result is used by analyse_all_files).
+        Missing data files are found by failing os.stat and counted as hash
+        without data file.
+
+        If self.list_data_files is set, also the directory trees of the
+        hash files are listed to find data files without hash.
+
+        :param hash_files: list of the hash files
         """
-        for name in self.directories:
-            if os.path.isdir(name):
-                self.find_all_files(name)
-                # now self.hash_files and self.data_files is filled
-                self.read_all_hash_files()
-                # now self.hash_dicts is filled
-                self.analyse_all_files()
-                self.log.info(
-                    'data file without hash: %i',
-                    self.result_number['data file without hash'])
-                self.log.info(
-                    'hash without data file: %i',
-                    self.result_number['hash without data file'])
-                self.log.info(
-                    'data file with matching hash(es): %i',
-                    self.result_number['data file with matching hash(es)'])
-                self.log.info(
-                    'data file with not matching hash(es): %i',
-                    self.result_number['data file with not matching hash(es)'])
+        self.log.info("analyse %i hash files", len(hash_files))
+        self.hash_files = [os.path.normpath(filename)
+                           for filename in hash_files]
+        self.read_all_hash_files()
+        self._data_file_stats = {}
+        for hash_dict in self.hash_dicts:
+            for filename in hash_dict:
+                if ((filename not in self._data_file_stats) and
+                        (not self.is_accept_hash_file(filename)) and
+                        self.is_accept_data_file2(filename)):
+                    try:
+                        file_stat = os.stat(filename)
+                    except OSError:
+                        continue
+                    if stat.S_ISREG(file_stat.st_mode):
+                        self._data_file_stats[filename] = file_stat
+        data_files = set(self._data_file_stats)
+        if self.list_data_files:
+            # sorted by the absolute path with a trailing separator, every
+            # subdirectory follows directly its parent directory
+            directories = sorted(
+                {(os.path.join(os.path.abspath(os.path.dirname(filename)),
+                               ''), os.path.dirname(filename) or '.')
+                 for filename in self.hash_files})
+            hash_files = self.hash_files
+            prefix = None
+            for (absdirectory, directory) in directories:
+                if (prefix is not None) and absdirectory.startswith(prefix):
+                    continue  # a subdirectory of another directory
+                prefix = absdirectory
                 self.log.info(
-                    'hash for ignored file: %i',
-                    self.result_number['hash for ignored file'])
-                self.log.info(
-                    'data file not handled (not ignored): %i',
-                    self.result_number['data file not handled'])
-                # raise NotImplementedError("not finished")
-            else:
-                self.log.warning(
-                    "cannot handle '%s' (e. g. not a directory)", name)
+                    "analyse directory tree \"%s\" resolved here to \"%s\"",
+                    directory, os.path.abspath(directory))
+                self.data_files = []
+                for (dirpath, _, filenames) in os.walk(directory):
+                    self._find_files(dirpath, filenames)
+                data_files.update(self.data_files)
+            self.hash_files = hash_files
+        self.data_files = sorted(data_files)
+
+    def log_result(self):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Log the results of analyse_all_files (self.result_number).
+        """
+        texts = {'data file not handled':
+                 'data file not handled (not ignored)',
+                 'data file verified recently':
+                 'data file verified recently (skipped)'}
+        for (key, number) in self.result_number.items():
+            if (((key == 'data file verified recently') and
+                 (self.ledger is None)) or
+                    ((key == 'data file repaired') and (self.repair is None))):
+                continue
+            self.log.info('%s: %i', texts.get(key, key), number)
+
+    def _check_found_files(self, sample):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Check the files already found and read and log the result.
+        This method should not be called from outside.
+
+        :param sample: If True, only a sample of the chunks is checked
+                       (see check_sample). Otherwise all files are checked
+                       (see analyse_all_files).
+        """
+        if sample:
+            self.check_sample().log_result()
+        else:
+            self.analyse_all_files()
+            self.log_result()
+
+    def check_all(self):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2017-02-25, 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        check checksums (or a sample of the chunks, see check_sample)
+
+        If self.given_hash_files is not None, the given hash files are
+        checked without listing the directory trees
+        (see find_files_by_hash_files).
+        """
+        if self.jsonl is not None:
+            self.result_sink = JsonLinesSink(self.jsonl)
+        try:
+            sample = ((self.sample is not None) or
+                      (self.sample_bytes is not None))
+            if self.given_hash_files is not None:
+                self._tree_root = '.'
+                self.find_files_by_hash_files(self.given_hash_files)
+                self._check_found_files(sample)
+            for name in self.directories:
+                self._tree_root = name
+                if not os.path.isdir(name):
+                    self.log.warning(
+                        "cannot handle '%s' (e. g. not a directory)", name)
+                elif self.stream and not sample:
+                    self.check_directory_streaming(name)
+                    self.log_result()
+                else:
+                    self.find_all_files(name)
+                    # now self.hash_files and self.data_files is filled
+                    self.read_all_hash_files()
+                    # now self.hash_dicts is filled
+                    self._check_found_files(sample)
+        finally:
+            if self.result_sink is not None:
+                self.result_sink.close()
+                self.result_sink = None
+        if self.hash_file_index is not None:
+            self.log.info(
+                'hash files from index: %i, hash files parsed: %i',
+                self.hash_file_index.number_used,
+                self.hash_file_index.number_parsed)
+            self.hash_file_index.write()
+        if (self.ledger is not None) and not sample:
+            # a sample does not use the ledger and is not a run of it
+            self.ledger.write(
+                [name for name in self.directories if os.path.isdir(name)])
         return 0  # success
@@ -0,0 +1,188 @@
+"""
+Author: Daniel Mohr.
+
+Date: 2026-10-18 (last change).
+
+License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+"""
+
+import heapq
+
+
+def chunk_ranges(chunks, filesize):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    :param chunks: list of (hash, (alg, encode), hashfile, start, stop)
+    :param filesize: size of the data file
+
+    :return: dict of the chunks completely in the data file,
+             (start, stop): list of (alg, encode, expected hash)
+    """
+    ranges = {}
+    for chunk in chunks:
+        if chunk[3] <= chunk[4] < filesize:
+            ranges.setdefault((chunk[3], chunk[4]), []).append(
+                (chunk[1][0], chunk[1][1], chunk[0]))
+    return ranges
+
+
+def encode_digest(encodes, digest, encode):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    :param encodes: dict of the encoding functions
+                    (see CheckChecksumsClass.encodes)
+    :param digest: binary digest
+    :param encode: name of the encoding
+
+    :return: text of the hash as stored in the hash files (lower case, if
+             not base64)
+    """
+    cal_hash = encodes[encode](digest)
+    if encode != 'base64':
+        cal_hash = cal_hash.lower()
+    return cal_hash.decode()
+
+
+class ChunkSweep():
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Compare the hashes of the chunks of a data file while reading it once.
+
+    The sorted ranges of the chunks are handled as events: Only at the
+    start of a chunk and after its stop the set of active hash objects
+    changes. Between two events the data is read once and given to the
+    hash objects of the complete file and the active hash objects.
+    Equal chunks (algorithm, start, stop) of several hash files share
+    one hash object. Therefore the effort is linear in the size of the
+    file and the number of chunks (up to the logarithm of the number of
+    overlapping chunks). Chunks not completely in the file are ignored.
+    The file is read completely, also after a not matching chunk.
+
+    The computed hashes are stored in self.computed,
+    (alg, encode, start, stop): hash.
+    """
+
+    def __init__(self, chunks, filesize, hashfcts, encodes):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        :param chunks: list of (hash, (alg, encode), hashfile, start, stop)
+        :param filesize: size of the data file
+        :param hashfcts: dict of the hash functions
+                         (see CheckChecksumsClass.hashfcts)
+        :param encodes: dict of the encoding functions
+                        (see CheckChecksumsClass.encodes)
+        """
+        self.hashfcts = hashfcts
+        self.encodes = encodes
+        # (alg, start, stop): list of (encode, expected hash)
+        self._ranges = {}
+        for ((start, stop), hashes) in chunk_ranges(chunks, filesize).items():
+            for (alg, encode, hash_string) in hashes:
+                self._ranges.setdefault((alg, start, stop), []).append(
+                    (encode, hash_string))
+        # chunks to start, the next one is the last
+        self._starts = sorted(self._ranges, key=lambda key: key[1],
+                              reverse=True)
+        self.active = {}  # (alg, start, stop): hash object
+        self._stops = []  # heap of (stop, (alg, start, stop)) of active chunks
+        self.computed = {}
+
+    def read(self, data_file, filesize, hash_objects, read):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Read the data file and compare the hashes of the chunks
+        (see start and stop).
+
+        :param data_file: data file opened by open_data_file
+        :param filesize: size of the data file
+        :param hash_objects: hash objects of the complete file
+        :param read: function to read the given number of Bytes from the
+                     data file into the given hash objects (see
+                     pfu_module.checksum_tools.read_data_from_file)
+
+        :return: sorted list of the ranges (start, stop) of the chunks with
+                 a not matching hash (empty if every hash of a chunk
+                 matches)
+        """
+        bad_chunks = set()
+        position = data_file.tell()
+        while position < filesize:
+            end = self.start(position, filesize)
+            read(data_file, end - position,
+                 hash_objects + list(self.active.values()))
+            if data_file.tell() == position:
+                break  # file changed (e. g. smaller than expected)
+            position = data_file.tell()
+            bad_chunks.update(self.stop(position))
+        return sorted(bad_chunks)
+
+    def start(self, position, filesize):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Start the hash objects of the chunks starting at position. The data
+        up to the next event is given to the hash objects of the active
+        chunks (self.active).
+
+        :param position: position in the data file
+        :param filesize: size of the data file
+
+        :return: position of the next event
+        """
+        while bool(self._starts) and (self._starts[-1][1] <= position):
+            key = self._starts.pop()
+            if key[1] == position:
+                self.active[key] = self.hashfcts[key[0]]()
+                heapq.heappush(self._stops, (key[2], key))
+        end = filesize
+        if bool(self._starts):
+            end = min(end, self._starts[-1][1])
+        if bool(self._stops):
+            end = min(end, self._stops[0][0] + 1)
+        return end
+
+    def stop(self, position):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Compare the hashes of the chunks stopping before position.
+
+        :param position: position in the data file
+
+        :return: generator of the ranges (start, stop) of the chunks with a
+                 not matching hash
+        """
+        while bool(self._stops) and (self._stops[0][0] < position):
+            key = heapq.heappop(self._stops)[1]
+            digest = self.active.pop(key).digest()
+            for (encode, hash_string) in self._ranges[key]:
+                cal_hash = encode_digest(self.encodes, digest, encode)
+                self.computed[(key[0], encode, key[1], key[2])] = cal_hash
+                if cal_hash != hash_string:
+                    yield key[1:3]
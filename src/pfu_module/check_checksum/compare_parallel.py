@@ -0,0 +1,91 @@
+"""
+Author: Daniel Mohr.
+
+Date: 2026-10-18 (last change).
+
+License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+"""
+
+import concurrent.futures
+
+
+def _group_hardlinks(file_stats):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    This function should not be called from outside.
+
+    :param file_stats: dict of the data files to compare,
+                       file name: result of os.stat
+
+    :return: tuple of the list of (filename, inode) to start, sorted by
+             the size (largest first, inode is None for a single link),
+             and the dict of the further hardlinks, inode: list of
+             filenames
+    """
+    first = []  # (filename, inode) to start
+    further = {}  # inode: list of further hardlinks
+    for filename in sorted(
+            file_stats,
+            key=lambda filename: file_stats[filename].st_size,
+            reverse=True):
+        file_stat = file_stats[filename]
+        inode = None
+        if file_stat.st_nlink > 1:
+            inode = (file_stat.st_dev, file_stat.st_ino)
+            if inode in further:
+                further[inode].append(filename)
+                continue
+            further[inode] = []
+        first.append((filename, inode))
+    return (first, further)
+
+
+def compare_parallel(file_stats, jobs, compare, count, fail):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Compare the hashes of the given files using a pool of jobs threads
+    (hashlib releases the GIL). The largest files are started first,
+    therefore a huge file does not delay the end of the check.
+    Further hardlinks of a file are started after the file is compared,
+    therefore the inode is read only once.
+    The results are counted in the order they are available.
+    A file, which cannot be accessed (e. g. deleted or not readable since
+    it was found), is given to fail and the other files are compared.
+
+    :param file_stats: dict of the data files to compare,
+                       file name: result of os.stat
+    :param jobs: number of threads
+    :param compare: function to compare the hashes of a file, called with
+                    the file name and the result of os.stat
+                    (e. g. CheckChecksumsClass.compare_hashes_for_file)
+    :param count: function called with the file name and the result of
+                  compare in the calling thread
+    :param fail: function called with the file name and the OSError
+                 of compare in the calling thread
+    """
+    (first, further) = _group_hardlinks(file_stats)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(compare, filename, file_stats[filename]):
+                   (filename, inode) for (filename, inode) in first}
+        while bool(futures):
+            for future in concurrent.futures.wait(
+                    futures,
+                    return_when=concurrent.futures.FIRST_COMPLETED).done:
+                (filename, inode) = futures.pop(future)
+                try:
+                    result = future.result()
+                except OSError as err:
+                    fail(filename, err)
+                else:
+                    count(filename, result)
+                for other in further.pop(inode, []):
+                    futures[executor.submit(
+                        compare, other, file_stats[other])] = (other, None)
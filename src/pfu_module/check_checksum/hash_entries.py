@@ -0,0 +1,363 @@
+"""
+Author: Daniel Mohr.
+
+Date: 2026-10-18 (last change).
+
+License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+"""
+
+import array
+import base64
+import binascii
+import collections.abc
+
+
+class HashEntries(collections.abc.Mapping):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Compact store of the hashes read from hash files.
+
+    It is a mapping of the file name to the list of its hashes, like a dict
+    of lists of tuples (hash, (alg, encode), hashfile) or, for chunks,
+    (hash, (alg, encode), hashfile, start, stop). But the hashes are stored
+    as binary digests in one bytearray, the hash files and the pairs of
+    algorithm and encoding as small integer ids and the other values in
+    arrays. The tuples are only created on access.
+
+    Every added hash gets an id, its index in the arrays self._kind,
+    self._hash_file, self._previous and (for chunks) self._starts and
+    self._stops. The digest of the id i is
+    self._digests[self._offsets[i]:self._offsets[i + 1]]; a text, which is
+    not a valid encoding, is stored in self._texts instead (empty digest).
+    The hashes of a file form a chain: self._index maps the file name to
+    the id of its last hash and self._previous[i] is the id of the
+    previous hash of the same file or -1. Therefore a hash is added in
+    constant time and self[filename] follows the chain backwards and
+    reverses it to give the hashes in the order of adding. merge links the
+    first hash of a file in other to the last hash of the same file name
+    in self, so the hashes of both are given.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    # decode the text of a hash, the name of the encoding in lower case
+    decodes = {'hex': base64.b16decode,
+               'base16': base64.b16decode,
+               'base32': base64.b32decode,
+               'base64': base64.b64decode}
+    encodes = {'hex': base64.b16encode,
+               'base16': base64.b16encode,
+               'base32': base64.b32encode,
+               'base64': base64.b64encode}
+
+    # names of the arrays (see to_json)
+    _array_names = ('_previous', '_kind', '_hash_file', '_offsets',
+                    '_starts', '_stops')
+
+    def __init__(self, chunks=False):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        :param chunks: If True, every hash has a start and a stop.
+        """
+        self.chunks = chunks
+        self._index = {}  # file name: id of the last hash of the file
+        # id of the previous hash of the same file or -1
+        self._previous = array.array('i')
+        self._kinds = []  # interned (alg, encode)
+        self._kind_ids = {}
+        self._kind = array.array('H')
+        self._hash_files = []  # interned file names of the hash files
+        self._hash_file_ids = {}
+        self._hash_file = array.array('I')
+        self._digests = bytearray()
+        # the digest of id i is self._digests[offsets[i]:offsets[i+1]]
+        self._offsets = array.array('Q', [0])
+        self._starts = array.array('Q')
+        self._stops = array.array('Q')
+        self._texts = {}  # id: text of a hash, which is not a valid encoding
+
+    def _encode(self, digest, encode):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        This method should not be called from outside.
+
+        :param digest: binary digest
+        :param encode: name of the encoding
+
+        :return: text of the hash as used in CheckChecksumsClass
+        """
+        hash_string = self.encodes[encode.lower()](digest).decode()
+        if encode != 'base64':
+            hash_string = hash_string.lower()
+        return hash_string
+
+    def add(self, filename, hash_string, hash_encode, hashfilename,
+            start=None, stop=None):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Add a hash for the file filename.
+
+        :param filename: file name of the data file
+        :param hash_string: text of the hash (lower case, if not base64)
+        :param hash_encode: tuple of the algorithm and the encoding
+        :param hashfilename: file name of the hash file
+        :param start: first Byte of the chunk (only for chunks)
+        :param stop: last Byte of the chunk (only for chunks)
+        """
+        # pylint: disable=too-many-arguments
+        entry = len(self._kind)
+        kind = self._kind_ids.get(hash_encode)
+        if kind is None:
+            kind = self._kind_ids[hash_encode] = len(self._kinds)
+            self._kinds.append(hash_encode)
+        self._kind.append(kind)
+        hash_file = self._hash_file_ids.get(hashfilename)
+        if hash_file is None:
+            hash_file = self._hash_file_ids[hashfilename] = len(
+                self._hash_files)
+            self._hash_files.append(hashfilename)
+        self._hash_file.append(hash_file)
+        try:
+            digest = self.decodes[hash_encode[1].lower()](
+                hash_string.upper() if hash_encode[1] != 'base64'
+                else hash_string)
+        except (binascii.Error, KeyError, ValueError):
+            digest = None
+        if (digest is None) or \
+                (self._encode(digest, hash_encode[1]) != hash_string):
+            # store the text, the hash is never matching
+            self._texts[entry] = hash_string
+            digest = b''
+        self._digests += digest
+        self._offsets.append(len(self._digests))
+        if self.chunks:
+            self._starts.append(start)
+            self._stops.append(stop)
+        self._previous.append(self._index.get(filename, -1))
+        self._index[filename] = entry
+
+    def extend(self, filename, hashes):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Add the hashes for the file filename.
+
+        :param filename: file name of the data file
+        :param hashes: list of tuples as given by self[filename]
+        """
+        for hash_entry in hashes:
+            self.add(filename, *hash_entry)
+
+    def merge(self, other, hashfilename, rename=None):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Add all hashes of other without decoding and encoding them.
+
+        :param other: HashEntries with the same value of chunks
+        :param hashfilename: file name of the hash file for all added hashes
+        :param rename: function to get the file name of a data file from its
+                       file name in other or None to use it unchanged
+        """
+        # pylint: disable=protected-access
+        base = len(self._kind)
+        kinds = []
+        for hash_encode in other._kinds:
+            if hash_encode not in self._kind_ids:
+                self._kind_ids[hash_encode] = len(self._kinds)
+                self._kinds.append(hash_encode)
+            kinds.append(self._kind_ids[hash_encode])
+        self._kind.extend(kinds[kind] for kind in other._kind)
+        if hashfilename not in self._hash_file_ids:
+            self._hash_file_ids[hashfilename] = len(self._hash_files)
+            self._hash_files.append(hashfilename)
+        self._hash_file.extend(
+            [self._hash_file_ids[hashfilename]] * len(other._kind))
+        digest_base = len(self._digests)
+        self._digests += other._digests
+        self._offsets.extend(
+            digest_base + offset for offset in other._offsets[1:])
+        if self.chunks:
+            self._starts.extend(other._starts)
+            self._stops.extend(other._stops)
+        for (entry, hash_string) in other._texts.items():
+            self._texts[base + entry] = hash_string
+        previous = array.array(
+            'i', (entry + base if entry >= 0 else -1
+                  for entry in other._previous))
+        for (filename, last) in other._index.items():
+            if rename is not None:
+                filename = rename(filename)
+            if filename in self._index:
+                # link the first hash of the file to the existing hashes
+                first = last
+                while previous[first] >= 0:
+                    first = previous[first] - base
+                previous[first] = self._index[filename]
+            self._index[filename] = base + last
+        self._previous.extend(previous)
+
+    def to_json(self):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        The arrays and the digests are stored base64 encoded
+        (array.tobytes), therefore they are not decoded and encoded.
+
+        :return: dict of the stored hashes, which can be serialized by json
+                 (see from_json)
+        """
+        return {'chunks': self.chunks,
+                'index': self._index,
+                'kinds': self._kinds,
+                'hash files': self._hash_files,
+                'texts': list(self._texts.items()),
+                'digests': base64.b64encode(self._digests).decode(),
+                'arrays': {name: base64.b64encode(
+                    getattr(self, name).tobytes()).decode()
+                           for name in self._array_names}}
+
+    @classmethod
+    def from_json(cls, data):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        :param data: dict as given by to_json
+
+        :return: HashEntries with the stored hashes
+
+        :raise ValueError: if the data is not consistent
+        """
+        # pylint: disable=protected-access
+        hash_entries = cls(chunks=bool(data['chunks']))
+        for name in cls._array_names:
+            setattr(hash_entries, name, array.array(
+                getattr(hash_entries, name).typecode,
+                base64.b64decode(data['arrays'][name], validate=True)))
+        hash_entries._digests = bytearray(
+            base64.b64decode(data['digests'], validate=True))
+        hash_entries._kinds = [tuple(kind) for kind in data['kinds']]
+        hash_entries._kind_ids = {
+            kind: i for (i, kind) in enumerate(hash_entries._kinds)}
+        hash_entries._hash_files = list(data['hash files'])
+        hash_entries._hash_file_ids = {
+            hashfilename: i
+            for (i, hashfilename) in enumerate(hash_entries._hash_files)}
+        hash_entries._texts = {int(entry): str(text)
+                               for (entry, text) in data['texts']}
+        hash_entries._index = {str(filename): int(entry)
+                               for (filename, entry) in data['index'].items()}
+        hash_entries._check()
+        return hash_entries
+
+    def _check(self):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Check the consistency of the arrays (see from_json).
+        This method should not be called from outside.
+
+        :raise ValueError: if the arrays are not consistent
+        """
+        number = len(self._kind)
+        lengths = [len(self._previous), len(self._hash_file),
+                   len(self._offsets) - 1]
+        if self.chunks:
+            lengths += [len(self._starts), len(self._stops)]
+        checks = [
+            all(length == number for length in lengths),
+            self._offsets[-1] == len(self._digests),
+            all(kind < len(self._kinds) for kind in self._kind),
+            all(hash_file < len(self._hash_files)
+                for hash_file in self._hash_file),
+            all(-1 <= entry < number for entry in self._previous),
+            all(0 <= entry < number for entry in self._index.values())]
+        if not all(checks):
+            raise ValueError('inconsistent HashEntries')
+
+    def _entry(self, entry):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        This method should not be called from outside.
+
+        :param entry: id of the hash
+
+        :return: tuple of the hash
+        """
+        hash_encode = self._kinds[self._kind[entry]]
+        hash_string = self._texts.get(entry)
+        if hash_string is None:
+            hash_string = self._encode(
+                self._digests[self._offsets[entry]:self._offsets[entry + 1]],
+                hash_encode[1])
+        if self.chunks:
+            return (hash_string, hash_encode,
+                    self._hash_files[self._hash_file[entry]],
+                    self._starts[entry], self._stops[entry])
+        return (hash_string, hash_encode,
+                self._hash_files[self._hash_file[entry]])
+
+    def __getitem__(self, filename):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        :param filename: file name of the data file
+
+        :return: list of the tuples of the hashes in the order of adding
+        """
+        entry = self._index[filename]
+        hashes = []
+        while entry >= 0:
+            hashes.append(self._entry(entry))
+            entry = self._previous[entry]
+        hashes.reverse()
+        return hashes
+
+    def __contains__(self, filename):
+        # pylint: disable=missing-docstring
+        return filename in self._index
+
+    def __iter__(self):
+        # pylint: disable=missing-docstring
+        return iter(self._index)
+
+    def __len__(self):
+        # pylint: disable=missing-docstring
+        return len(self._index)
@@ -0,0 +1,130 @@
+"""
+Author: Daniel Mohr.
+
+Date: 2026-10-18 (last change).
+
+License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+"""
+
+import json
+import os
+
+from pfu_module.checksum_tools import write_file_atomic
+
+from .hash_entries import HashEntries
+
+
+class HashFileIndex():
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Index of parsed hash files stored in one file (json).
+
+    For every hash file (absolute path) the size, the modification time
+    (st_mtime_ns), the directory as used while parsing and the parsed
+    hashes (list of HashEntries for chunks and complete files) are stored.
+    The parsed hashes are only used, if the size and the modification time
+    of the hash file did not change. Therefore an unchanged hash file has
+    not to be parsed again.
+
+    The parsed hashes are stored as given by HashEntries.to_json. Reading
+    the index only creates data (no code is run). An inconsistent index is
+    handled as empty.
+    """
+
+    version = 1
+
+    def __init__(self, file_name):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Read the index file_name. If it is not available or not readable,
+        the index is empty.
+
+        :param file_name: file name of the index
+        """
+        self.file_name = file_name
+        self._hash_files = {}
+        try:
+            with open(file_name, mode='r', encoding='utf-8') as index_file:
+                index = json.load(index_file)
+            if index['version'] == self.version:
+                self._hash_files = dict(index['hash files'])
+        except (OSError, ValueError, KeyError, TypeError):
+            self._hash_files = {}
+        self.changed = False
+        self.number_used = 0
+        self.number_parsed = 0
+
+    def get(self, hashfilename, file_stat):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        :param hashfilename: file name of the hash file
+        :param file_stat: result of os.stat of the hash file
+
+        :return: tuple of the directory of the hash file as used while
+                 parsing and the list of the parsed hashes (HashEntries) or
+                 None, if the hash file is not in the index or changed
+        """
+        stored = self._hash_files.get(os.path.abspath(hashfilename))
+        hash_dicts = None
+        try:
+            if stored[0:2] == [file_stat.st_size, file_stat.st_mtime_ns]:
+                hash_dicts = [HashEntries.from_json(hash_dict)
+                              for hash_dict in stored[3]]
+        except (ValueError, KeyError, TypeError, AttributeError, IndexError):
+            hash_dicts = None  # not in the index or inconsistent
+        if hash_dicts is None:
+            self.number_parsed += 1
+            return None
+        self.number_used += 1
+        return (stored[2], hash_dicts)
+
+    def put(self, hashfilename, file_stat, directory, hash_dicts):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        :param hashfilename: file name of the hash file
+        :param file_stat: result of os.stat of the hash file before parsing
+        :param directory: directory of the hash file as used while parsing
+        :param hash_dicts: list of the parsed hashes (HashEntries)
+        """
+        self._hash_files[os.path.abspath(hashfilename)] = [
+            file_stat.st_size, file_stat.st_mtime_ns, directory,
+            [hash_dict.to_json() for hash_dict in hash_dicts]]
+        self.changed = True
+
+    def write(self):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Write the index, if it changed. Hash files not existing anymore are
+        removed from the index.
+        """
+        for hashfilename in list(self._hash_files):
+            if not os.path.isfile(hashfilename):
+                del self._hash_files[hashfilename]
+                self.changed = True
+        if not self.changed:
+            return
+        write_file_atomic(
+            self.file_name,
+            [json.dumps({'version': self.version,
+                         'hash files': self._hash_files})])
+        self.changed = False
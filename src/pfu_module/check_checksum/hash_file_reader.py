@@ -0,0 +1,436 @@
+"""
+Author: Daniel Mohr.
+
+Date: 2017-03-01, 2026-10-18 (last change).
+
+License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+"""
+
+import functools
+import logging
+import os
+import re
+
+# own_logger:
+import pfu_module.checksum_tools  # pylint: disable=unused-import
+
+from .hash_entries import HashEntries
+
+
+class HashFileReader():
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2017-03-01, 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Read hash files: The hashes of chunks and of complete files are stored
+    in the given HashEntries (see read_hash_file and parse_hash_lines).
+    """
+
+    # for every length of a hash the possible algorithms and encodings
+    # (the first matching one is used, if the extension does not help)
+    hashtype = {128: [('sha512', 'base16'), ('blake2b', 'base16'),
+                      ('sha3_512', 'base16')],
+                104: [('sha512', 'base32'), ('blake2b', 'base32'),
+                      ('sha3_512', 'base32')],
+                96: [('sha384', 'base16'), ('sha3_384', 'base16')],
+                88: [('sha512', 'base64'), ('blake2b', 'base64'),
+                     ('sha3_512', 'base64')],
+                80: [('sha3_384', 'base32')],
+                64: [('sha256', 'base16'), ('blake2s', 'base16'),
+                     ('sha3_256', 'base16'), ('sha3_384', 'base64')],
+                56: [('sha256', 'base32'), ('blake2s', 'base32'),
+                     ('sha3_256', 'base32'), ('sha224', 'base16'),
+                     ('sha3_224', 'base16')],
+                48: [('sha3_224', 'base32')],
+                44: [('sha256', 'base64'), ('blake2s', 'base64'),
+                     ('sha3_256', 'base64')],
+                40: [('sha1', 'base16'), ('sha3_224', 'base64')],
+                32: [('md5', 'base16'), ('md5', 'base32')],
+                24: [('md5', 'base64')]}
+    encode_regexps = {'base16': re.compile(r"[0-9a-fA-F]+"),
+                      'base32': re.compile(r"[a-zA-Z2-7]+=*"),
+                      'base64': re.compile(r"[a-zA-Z0-9/+]+=*")}
+    # names of the algorithms in the BSD-style differing from hashfcts
+    bsd_types = {'sha3-224': 'sha3_224',
+                 'sha3-256': 'sha3_256',
+                 'sha3-384': 'sha3_384',
+                 'sha3-512': 'sha3_512',
+                 'blake2b-512': 'blake2b',
+                 'blake2s-256': 'blake2s'}
+    # a hash in the regular expressions self.regexps
+    hash_regexp = re.compile(r"[0-9a-zA-Z/+=]+")
+    regexps = [
+        re.compile(
+            r"(?P<hash>[0-9a-zA-Z/+=]+) [ \*]{1}(?P<filename>.+) "
+            r"\(bytes (?P<start>[0-9]+) - (?P<stop>[0-9]+)\)$"),
+        re.compile(r"(?P<hash>[0-9a-zA-Z/+=]+) [ \*]{1}(?P<filename>.+)$"),
+        re.compile(r"(?P<type>MD5|SHA256|SHA512|SHA1|SHA224|SHA384|"
+                   r"SHA3-224|SHA3-256|SHA3-384|SHA3-512|"
+                   r"BLAKE2b-512|BLAKE2s-256|BLAKE2b|BLAKE2s)[ ]{0,1}"
+                   r"\((?P<filename>.+)\)[ ]{0,1}= (?P<hash>[0-9a-zA-Z/+=]+)$")
+    ]
+
+    def __init__(self, algorithms, index=None):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        :param algorithms: names of the known hash algorithms
+                           (e. g. the keys of CheckChecksumsClass.hashfcts)
+        :param index: If not None, the parsed hash files are stored in this
+                      HashFileIndex and unchanged hash files are not parsed
+                      again.
+        """
+        self.algorithms = set(algorithms)
+        self.index = index
+        self.log = logging.getLogger("pfu.check")
+
+    def determine_hash_encode(self, hash_string, hashfilename=None):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2017-03-02, 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Try to determine hash function and encode from hash.
+        If the length and the alphabet of the hash allow more than one
+        hash function, the file extension is used to choose.
+        If this is not possible assume the file extension gives the hash type.
+
+        :param hash_string: the hash to analyse
+        :param hashfilename: file name of the hash
+                             (if hash is not unique the file extension is used)
+
+        :return: tuple of hash algorithm and encoding
+                 or None on error
+        """
+        hash_encode = None
+        extension = None
+        if hashfilename is not None:
+            extension = os.path.splitext(hashfilename)[1][1:].strip().lower()
+        candidates = [
+            candidate for candidate in self.hashtype.get(len(hash_string), [])
+            if self.encode_regexps[candidate[1]].fullmatch(hash_string)]
+        if bool(candidates):
+            hash_encode = candidates[0]
+            for candidate in candidates:
+                if candidate[0] == extension:
+                    hash_encode = candidate
+                    break
+        if (hash_encode is None) and (extension is not None):
+            if extension in self.algorithms:
+                # assume file extension gives the hash type
+                # the coding is really hard to detect, therefore assume base16
+                # RFC 3548 defines the following alphabets:
+                # base64: ABCDEFGHIJKLMNOPQRSTUVWXYZ
+                #         abcdefghijklmnopqrstuvwxyz0123456789-_
+                # base32: abcdefghijklmnopqrstuvwxyz234567
+                # base16: 0123456789ABCDEF
+                # Unfortunately typical used tools like *sum (e. g. md5sum)
+                # gives the output as base16 in lower letters.
+                hash_encode = (extension, 'base16')
+        return hash_encode
+
+    def _analyse_hashline_of_chunk(self, sres, hashfilename, hash_entries):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2017-03-02, 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Analyse line of a hash file describing hash of a chunk.
+        This method should not be called from outside.
+
+        :param sres: re instance
+        :param hashfilename: file name of the hash
+                             (normaly only path is used, if hash is not unique
+                             the file extension is used)
+        :param hash_entries: store the hash in this HashEntries
+        """
+        hash_encode = self.determine_hash_encode(sres.group('hash'),
+                                                 hashfilename)
+        if hash_encode is not None:
+            relfilename = os.path.normpath(
+                os.path.join(os.path.dirname(hashfilename),
+                             sres.group('filename')))
+            if hash_encode[1] == 'base64':
+                hash_string = sres.group('hash')
+            else:
+                hash_string = sres.group('hash').lower()
+            hash_entries.add(
+                relfilename, hash_string, hash_encode, hashfilename,
+                int(sres.group('start')), int(sres.group('stop')))
+
+    def _analyse_hashline_of_file(self, sres, hashfilename, hash_entries):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2017-03-02, 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Analyse line of a hash file describing hash of complete file.
+        This method should not be called from outside.
+
+        :param sres: re instance
+        :param hashfilename: file name of the hash
+                             (normaly only path is used, if hash is not unique
+                             the file extension is used)
+        :param hash_entries: store the hash in this HashEntries
+        """
+        hash_encode = self.determine_hash_encode(sres.group('hash'),
+                                                 hashfilename)
+        if hash_encode is not None:
+            relfilename = os.path.normpath(
+                os.path.join(
+                    os.path.dirname(hashfilename),
+                    sres.group('filename')))
+            if hash_encode[1] == 'base64':
+                hash_string = sres.group('hash')
+            else:
+                hash_string = sres.group('hash').lower()
+            hash_entries.add(
+                relfilename, hash_string, hash_encode, hashfilename)
+
+    def _analyse_hashline_of_file_bsd(self, sres, hashfilename, hash_entries):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2017-03-01, 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Analyse line of a hash file describing hash of complete file in
+        BSD-style.
+        This method should not be called from outside.
+
+        :param sres: re instance
+        :param hashfilename: file name of the hash (here only path is used)
+        :param hash_entries: store the hash in this HashEntries
+        """
+        relfilename = os.path.normpath(
+            os.path.join(
+                os.path.dirname(hashfilename),
+                sres.group('filename')))
+        hash_type = sres.group('type').lower()
+        hash_type = self.bsd_types.get(hash_type, hash_type)
+        hash_entries.add(
+            relfilename, sres.group('hash').lower(), (hash_type, 'base16'),
+            hashfilename)
+
+    def _analyse_hashline(self, line, hashfilename, hash_dicts):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Analyse line of a hash file by the regular expressions self.regexps.
+        This method should not be called from outside.
+
+        :param line: line of the hash file
+        :param hashfilename: file name of the hash
+        :param hash_dicts: store the hashes in these HashEntries for chunks
+                           and for complete files
+        """
+        sres = self.regexps[0].search(line)
+        if sres:  # hash of a chunk
+            self._analyse_hashline_of_chunk(sres, hashfilename,
+                                            hash_dicts[0])
+        else:
+            sres = self.regexps[1].search(line)
+            if sres:  # hash of a complete file
+                self._analyse_hashline_of_file(sres, hashfilename,
+                                               hash_dicts[1])
+            else:
+                sres = self.regexps[2].search(line)
+                if sres:  # hash of a complete file (BSD-style)
+                    self._analyse_hashline_of_file_bsd(
+                        sres, hashfilename, hash_dicts[1])
+                else:
+                    self.log.warning(
+                        "do not understand line in hash file "
+                        "\"%s\": %s", hashfilename, line)
+
+    def parse_hash_lines(self, lines, hashfilename, hash_dicts):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Parse the lines of the hash file hashfilename and store the hashes
+        in hash_dicts.
+
+        Everything depending only on the hash file (the directory, the
+        extension and the possible encodings for a length of a hash) is
+        determined once. Lines of the form "<hash>  <name>" or
+        "<hash> *<name>" are split without regular expressions. Only lines
+        of chunks (ending with ")") and other lines (e. g. BSD-style) are
+        analysed by the regular expressions self.regexps. The result is the
+        same as analysing every line by self.regexps.
+
+        :param lines: iterable of the lines of the hash file
+        :param hashfilename: file name of the hash
+        :param hash_dicts: store the hashes in these HashEntries for chunks
+                           and for complete files
+        """
+        # pylint: disable=too-many-locals,too-many-branches
+        directory = os.path.normpath(os.path.dirname(hashfilename))
+        prefix = ''
+        if directory != '.':
+            prefix = os.path.join(directory, '')
+        extension = os.path.splitext(hashfilename)[1][1:].strip().lower()
+        default_encode = None
+        if extension in self.algorithms:
+            default_encode = (extension, 'base16')
+        candidates = {}  # length of hash: candidates, extension first
+        for line in lines:
+            if line.endswith('\n'):
+                line = line[:-1]
+            sres = None
+            if line.endswith(')'):
+                sres = self.regexps[0].search(line)
+            if sres:  # hash of a chunk
+                (hash_string, filename) = sres.group('hash', 'filename')
+            else:
+                (hash_string, _, filename) = line.partition(' ')
+                if not ((len(filename) > 1) and (filename[0] in ' *')):
+                    self._analyse_hashline(line, hashfilename, hash_dicts)
+                    continue
+                filename = filename[1:]
+            length = len(hash_string)
+            if length not in candidates:
+                candidates[length] = sorted(
+                    self.hashtype.get(length, []),
+                    key=lambda candidate: candidate[0] != extension)
+            hash_encode = None
+            for candidate in candidates[length]:
+                if self.encode_regexps[candidate[1]].fullmatch(hash_string):
+                    hash_encode = candidate
+                    break
+            else:
+                # the alphabets of the encodings are part of the alphabet
+                # of a hash in self.regexps, therefore check only here
+                if not (sres or self.hash_regexp.fullmatch(hash_string)):
+                    self._analyse_hashline(line, hashfilename, hash_dicts)
+                    continue
+                hash_encode = default_encode
+            if hash_encode is None:
+                continue
+            if hash_encode[1] != 'base64':
+                hash_string = hash_string.lower()
+            if (os.sep in filename) or (filename in ('.', '..')):
+                relfilename = os.path.normpath(
+                    os.path.join(directory, filename))
+            else:
+                relfilename = prefix + filename
+            if sres:
+                hash_dicts[0].add(
+                    relfilename, hash_string, hash_encode, hashfilename,
+                    int(sres.group('start')), int(sres.group('stop')))
+            else:
+                hash_dicts[1].add(
+                    relfilename, hash_string, hash_encode, hashfilename)
+
+    def read_hash_file(self, hashfilename, hash_dicts):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2017-02-25, 2023-04-25, 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        read hash file (see parse_hash_lines)
+
+        If self.index is given, an unchanged hash file is not
+        parsed, but the hashes are taken from the index.
+
+        :param hashfilename: read this file
+        :param hash_dicts: store the hashes in these HashEntries for chunks
+                           and for complete files
+        """
+        if (os.path.isfile(hashfilename) and
+                os.access(hashfilename, os.R_OK)):
+            if self.index is not None:
+                self._read_hash_file_indexed(hashfilename, hash_dicts)
+                return
+            self.log.debug("read hash file \"%s\"", hashfilename)
+            with open(hashfilename, mode='r', encoding='utf-8') as hash_file:
+                self.parse_hash_lines(hash_file, hashfilename, hash_dicts)
+        elif not os.access(hashfilename, os.R_OK):
+            self.log.warning('hash file "%s" is not readable', hashfilename)
+        else:
+            self.log.warning('hash file "%s" not existing (anymore?)',
+                             hashfilename)
+
+    def _read_hash_file_indexed(self, hashfilename, hash_dicts):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Read the hash file by self.index: If the hash file is
+        unchanged, the stored hashes are used. Otherwise the hash file is
+        parsed and the hashes are stored in the index.
+        This method should not be called from outside.
+
+        :param hashfilename: read this file
+        :param hash_dicts: store the hashes in these HashEntries for chunks
+                           and for complete files
+        """
+        directory = os.path.normpath(os.path.dirname(hashfilename))
+        file_stat = os.stat(hashfilename)
+        stored = self.index.get(hashfilename, file_stat)
+        if stored is None:
+            self.log.debug("read hash file \"%s\"", hashfilename)
+            stored = (directory, self.new_hash_dicts())
+            with open(hashfilename, mode='r', encoding='utf-8') as hash_file:
+                self.parse_hash_lines(hash_file, hashfilename, stored[1])
+            self.index.put(
+                hashfilename, file_stat, directory, stored[1])
+        else:
+            self.log.debug("hash file \"%s\" from index", hashfilename)
+        rename = None
+        if stored[0] != directory:
+            # the hash file was parsed from another working directory
+            rename = functools.partial(
+                self._rebase_file_name, old_directory=stored[0],
+                new_directory=directory)
+        for (hash_dict, stored_hash_dict) in zip(hash_dicts, stored[1]):
+            hash_dict.merge(stored_hash_dict, hashfilename, rename)
+
+    @staticmethod
+    def _rebase_file_name(filename, old_directory, new_directory):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        This method should not be called from outside.
+
+        :param filename: file name relative to old_directory
+        :param old_directory: directory of the hash file as used while
+                              parsing
+        :param new_directory: directory of the hash file now
+
+        :return: the file name relative to new_directory
+        """
+        return os.path.normpath(os.path.join(
+            new_directory, os.path.relpath(filename, old_directory)))
+
+    @staticmethod
+    def new_hash_dicts():
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        :return: empty stores for the hashes of chunks and of complete files
+                 (see HashEntries)
+        """
+        return [HashEntries(chunks=True), HashEntries()]
@@ -0,0 +1,151 @@
+"""
+Author: Daniel Mohr.
+
+Date: 2026-10-18 (last change).
+
+License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+"""
+
+import json
+import queue
+import sys
+import threading
+
+
+def result_record(filename, status, result=None):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    The record of a checked file has the keys "file" and "status" and for
+    compared data files also "size", "hashes", "chunk_hashes",
+    "bytes_read", "seconds" (to read and hash) and "bad_chunks" (list of
+    the ranges [start, stop] of not matching chunks).
+
+    :param filename: string of the filename
+    :param status: "ok", "bad" or "repaired" (compared data file),
+                   "no hash" (data file without hash), "missing" (hash
+                   without data file), "ignored" (hash for ignored
+                   file), "not handled" or "skipped" (verified
+                   recently)
+    :param result: result of CheckChecksumsClass.compare_hashes_for_file
+                   for filename
+
+    :return: dict of the record
+    """
+    record = {'file': filename, 'status': status}
+    if result is not None:
+        record.update({'size': result[3],
+                       'hashes': result[1],
+                       'chunk_hashes': result[2],
+                       'bytes_read': result[4],
+                       'seconds': result[5],
+                       'bad_chunks': result[6]})
+    return record
+
+
+class JsonLinesSink():
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Write records (dicts) as JSON lines (one JSON object per line).
+
+    The records are given to a thread, which serializes and writes them in
+    blocks. Therefore writing a record costs only putting it into a queue.
+    The queue is bounded: If the thread cannot follow, write waits.
+    An exception in the thread (e. g. a full disk) is raised again by the
+    next call of write or by close.
+    """
+
+    def __init__(self, file_name, block_size=1024, max_queued=16384):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        :param file_name: file name of the output, "-" for stdout
+        :param block_size: the thread writes at most this number of records
+                           at once
+        :param max_queued: at most this number of records are waiting in
+                           the queue
+        """
+        self.file_name = file_name
+        self.block_size = block_size
+        if file_name == '-':
+            self._file = sys.stdout
+        else:
+            self._file = open(  # pylint: disable=consider-using-with
+                file_name, mode='w', encoding='utf-8')
+        self._queue = queue.Queue(maxsize=max_queued)
+        self._error = None  # exception in the thread
+        self._thread = threading.Thread(target=self._write_records,
+                                        daemon=True)
+        self._thread.start()
+
+    def _write_records(self):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Write the records from the queue until None is given.
+        This method should not be called from outside.
+
+        After an exception the records are only taken from the queue (and
+        dropped), so that write and close do not wait forever.
+        """
+        finished = False
+        while not finished:
+            records = [self._queue.get()]
+            while ((len(records) < self.block_size) and
+                   (not self._queue.empty())):
+                records.append(self._queue.get())
+            if records[-1] is None:
+                finished = True
+                records.pop()
+            if self._error is not None:
+                continue
+            try:
+                if bool(records):
+                    self._file.write(''.join(
+                        json.dumps(record) + '\n' for record in records))
+                self._file.flush()
+            except (OSError, TypeError, ValueError) as err:
+                self._error = err
+
+    def write(self, record):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        :param record: dict to write as one line of JSON
+        """
+        if self._error is not None:
+            raise self._error
+        self._queue.put(record)
+
+    def close(self):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Write all given records and close the output.
+        An exception of the thread is raised again.
+        """
+        self._queue.put(None)
+        self._thread.join()
+        if self._file is not sys.stdout:
+            self._file.close()
+        if self._error is not None:
+            raise self._error
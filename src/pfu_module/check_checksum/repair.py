@@ -0,0 +1,111 @@
+"""
+Author: Daniel Mohr.
+
+Date: 2026-10-18 (last change).
+
+License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+"""
+
+import logging
+import os
+
+# own_logger:
+import pfu_module.checksum_tools  # pylint: disable=unused-import
+
+from .chunk_sweep import encode_digest
+
+
+def find_replica(filename, tree_root, replica_root):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    The replica of the data file has the same path relative to replica_root
+    as the data file relative to tree_root.
+
+    :param filename: data file
+    :param tree_root: checked directory tree of the data file
+    :param replica_root: directory of the replica
+
+    :return: name of the replica or None, if there is no replica of the
+             same size
+    """
+    relfilename = os.path.relpath(filename, tree_root)
+    replica = os.path.join(replica_root, relfilename)
+    if (relfilename.startswith(os.pardir) or
+            (not os.path.isfile(replica)) or
+            (os.path.getsize(replica) != os.path.getsize(filename))):
+        logging.getLogger("pfu.check").warning(
+            'file "%s": cannot repair, no replica "%s" of the same size',
+            filename, replica)
+        return None
+    return replica
+
+
+def _matches(data, hashes, hashfcts, encodes):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    This function should not be called from outside.
+
+    :param data: data of a chunk
+    :param hashes: list of (alg, encode, expected hash) of the chunk
+    :param hashfcts: dict of the hash functions
+    :param encodes: dict of the encoding functions
+
+    :return: True if every hash of the chunk matches
+    """
+    for (alg, encode, hash_string) in hashes:
+        if encode_digest(encodes, hashfcts[alg](data).digest(),
+                         encode) != hash_string:
+            return False
+    return True
+
+
+def copy_chunks(filename, replica, ranges, hashfcts, encodes):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Copy the given chunks from the replica to the data file: Only these
+    ranges are read from the replica. A range is only written to the data
+    file, if it matches all hashes of the chunk. At the end the data file
+    is synchronized to the storage (os.fsync).
+
+    :param filename: data file
+    :param replica: replica of the data file (see find_replica)
+    :param ranges: dict of the chunks to copy,
+                   (start, stop): list of (alg, encode, expected hash)
+                   (see chunk_ranges)
+    :param hashfcts: dict of the hash functions
+                     (see CheckChecksumsClass.hashfcts)
+    :param encodes: dict of the encoding functions
+                    (see CheckChecksumsClass.encodes)
+    """
+    log = logging.getLogger("pfu.check")
+    with open(replica, 'rb') as replica_file, \
+            open(filename, 'r+b') as data_file:
+        for ((start, stop), hashes) in sorted(ranges.items()):
+            replica_file.seek(start)
+            data = replica_file.read(stop - start + 1)
+            if ((len(data) == stop - start + 1) and
+                    _matches(data, hashes, hashfcts, encodes)):
+                data_file.seek(start)
+                data_file.write(data)
+                log.verboseinfo(  # pylint: disable=no-member
+                    'file "%s" bytes %i - %i: copied from "%s"',
+                    filename, start, stop, replica)
+            else:
+                log.warning(
+                    'file "%s" bytes %i - %i: cannot repair, '
+                    'hash mismatch in replica "%s"',
+                    filename, start, stop, replica)
+        data_file.flush()
+        os.fsync(data_file.fileno())
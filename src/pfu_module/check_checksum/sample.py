@@ -0,0 +1,205 @@
+"""
+Author: Daniel Mohr.
+
+Date: 2026-10-18 (last change).
+
+License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+"""
+
+import logging
+import random
+
+# own_logger:
+import pfu_module.checksum_tools  # pylint: disable=unused-import
+
+from .chunk_sweep import encode_digest
+
+
+class ChunkSample():
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Random sample of the chunks of data files.
+
+    Every chunk is sampled with the same probability. The random numbers
+    are drawn for every chunk in the same order, therefore the sample is
+    reproducible by the seed. The results are counted in self.number.
+    """
+
+    def __init__(self, hashfcts, encodes, seed=None):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        :param hashfcts: dict of the hash functions
+                         (see CheckChecksumsClass.hashfcts)
+        :param encodes: dict of the encoding functions
+                        (see CheckChecksumsClass.encodes)
+        :param seed: seed for the random sample (None for a random seed)
+        """
+        self.hashfcts = hashfcts
+        self.encodes = encodes
+        if seed is None:
+            seed = random.randrange(2**32)
+        self.seed = seed
+        self._rng = random.Random(seed)
+        self.probability = 1.0
+        self.number = {'data file without chunk hash': 0,
+                       'chunks': 0,
+                       'Bytes in chunks': 0,
+                       'sampled chunks': 0,
+                       'sampled Bytes': 0,
+                       'sampled chunks with not matching hash': 0}
+
+    def count(self, ranges):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Count the chunks of a data file, which can be sampled.
+
+        :param ranges: dict of the chunks completely in the data file,
+                       (start, stop): list of (alg, encode, expected hash)
+                       (see chunk_ranges)
+        """
+        for (start, stop) in ranges:
+            self.number['chunks'] += 1
+            self.number['Bytes in chunks'] += stop - start + 1
+
+    def set_probability(self, sample=None, sample_bytes=None):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Set the probability of a chunk to be sampled to sample or to
+        sample_bytes divided by the counted Bytes in chunks (the smaller
+        one). Therefore about this fraction of the Bytes is read.
+
+        :param sample: fraction of the Bytes in chunks or None
+        :param sample_bytes: amount of Bytes or None
+        """
+        self.probability = 1.0
+        if sample is not None:
+            self.probability = min(self.probability, sample)
+        if (sample_bytes is not None) and (self.number['Bytes in chunks'] > 0):
+            self.probability = min(
+                self.probability,
+                sample_bytes / self.number['Bytes in chunks'])
+
+    def select(self, ranges):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        :param ranges: dict of the chunks completely in the data file
+                       (see chunk_ranges)
+
+        :return: dict of the sampled chunks, sorted by the range
+        """
+        # the random numbers are drawn for every chunk in the same order
+        return {key: ranges[key] for key in sorted(ranges)
+                if self._rng.random() < self.probability}
+
+    def check(self, filename, data_file, sampled, read):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Read the sampled chunks of the data file and compare their hashes.
+
+        :param filename: name of the data file (only used in the messages)
+        :param data_file: data file opened by open_data_file
+        :param sampled: dict of the sampled chunks (see select)
+        :param read: function to read the given number of Bytes from the
+                     data file into the given hash objects (see
+                     pfu_module.checksum_tools.read_data_from_file)
+
+        :return: list of the ranges (start, stop) of the sampled chunks with
+                 a not matching hash
+        """
+        log = logging.getLogger("pfu.check")
+        bad_chunks = []
+        for ((start, stop), hashes) in sampled.items():
+            self.number['sampled chunks'] += 1
+            self.number['sampled Bytes'] += stop - start + 1
+            if self._compare_chunk(data_file, (start, stop), hashes, read):
+                log.verboseinfo(  # pylint: disable=no-member
+                    'file "%s" bytes %i - %i: ok', filename, start, stop)
+            else:
+                bad_chunks.append((start, stop))
+                self.number['sampled chunks with not matching hash'] += 1
+                log.warning('file "%s" bytes %i - %i: bad, hash mismatch',
+                            filename, start, stop)
+        return bad_chunks
+
+    def _compare_chunk(self, data_file, chunk, hashes, read):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Read the chunk and compare its hashes.
+        This method should not be called from outside.
+
+        :param data_file: data file opened by open_data_file
+        :param chunk: range (start, stop) of the chunk
+        :param hashes: list of (alg, encode, expected hash) of the chunk
+        :param read: function to read from the data file (see check)
+
+        :return: True if every hash of the chunk matches
+        """
+        hash_objects = {alg: self.hashfcts[alg]() for (alg, _, _) in hashes}
+        data_file.seek(chunk[0])
+        read(data_file, chunk[1] - chunk[0] + 1, list(hash_objects.values()))
+        match = data_file.tell() == chunk[1] + 1
+        for (alg, encode, hash_string) in hashes:
+            cal_hash = encode_digest(
+                self.encodes, hash_objects[alg].digest(), encode)
+            match = match and (cal_hash == hash_string)
+        return match
+
+    def log_result(self):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Log the results with a confidence estimate: If no sampled chunk is
+        corrupt, the fraction of corrupt chunks is less than
+        1 - 0.05**(1/n) with a confidence of 95 % (n sampled chunks).
+        """
+        log = logging.getLogger("pfu.check")
+        log.info('data file without chunk hash (not sampled): %i',
+                 self.number['data file without chunk hash'])
+        log.info('sampled chunks: %i of %i (%i of %i Bytes)',
+                 self.number['sampled chunks'], self.number['chunks'],
+                 self.number['sampled Bytes'],
+                 self.number['Bytes in chunks'])
+        log.info('sampled chunks with not matching hash: %i',
+                 self.number['sampled chunks with not matching hash'])
+        number = self.number['sampled chunks']
+        bad = self.number['sampled chunks with not matching hash']
+        if number == 0:
+            return
+        if bad == 0:
+            log.info(
+                'with a confidence of 95 %% less than %.3g %% of the chunks '
+                'are corrupt', 100 * (1 - 0.05**(1 / number)))
+        else:
+            log.warning('estimated %.3g %% of the chunks are corrupt',
+                        100 * bad / number)
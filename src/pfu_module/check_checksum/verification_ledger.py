@@ -0,0 +1,212 @@
+"""
+Author: Daniel Mohr.
+
+Date: 2026-10-18 (last change).
+
+License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+"""
+
+import json
+import math
+import os
+import time
+
+from pfu_module.checksum_tools import file_stat_key
+from pfu_module.checksum_tools import write_file_atomic
+
+SECONDS_PER_DAY = 86400
+
+
+class VerificationLedger():
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Ledger of the verified data files stored in one file (json).
+
+    For every data file (absolute path) the size, the modification time
+    (st_mtime_ns), the inode, the change time (st_ctime_ns) and the time of
+    the last successful verification are stored. A data file with another
+    size, modification time, inode or change time is handled as never
+    verified.
+
+    Every data file should be verified at least every reverify_days days.
+    A run verifies the overdue data files, but at least its share of all
+    data files: the fraction of reverify_days since the last run. The data
+    files verified the longest time ago are selected first. Therefore the
+    work is spread over the runs, e. g. a nightly run with reverify_days=30
+    verifies about 1/30 of the data files. The share is for all data files
+    of the run, also if they are given by several calls of select (e. g.
+    one call for every directory).
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    version = 1
+
+    def __init__(self, file_name, reverify_days, now=None):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Read the ledger file_name. If it is not available or not readable,
+        the ledger is empty.
+
+        :param file_name: file name of the ledger
+        :param reverify_days: verify every data file at least every
+                              reverify_days days
+        :param now: time of this run in seconds since the epoch
+                    (None for time.time())
+        """
+        self.file_name = file_name
+        self.reverify_days = reverify_days
+        self.now = now
+        if now is None:
+            self.now = time.time()
+        self._files = {}
+        last_run = None
+        try:
+            with open(file_name, mode='r', encoding='utf-8') as ledger_file:
+                ledger = json.load(ledger_file)
+            if ledger['version'] == self.version:
+                self._files = ledger['files']
+                last_run = ledger['last run']
+        except (OSError, ValueError, KeyError, TypeError):
+            self._files = {}
+            last_run = None
+        self._stats = {}  # absolute path: stat key of the selected files
+        # fraction of the data files to verify in this run
+        self._share = 1.0
+        if last_run is not None:
+            self._share = min(1.0, max(0.0, self.now - last_run) /
+                              (self.reverify_days * SECONDS_PER_DAY))
+        self._number_given = 0  # number of data files given to select
+        self._number_selected = 0  # number of data files selected
+        self._given = set()  # absolute paths of the existing data files
+        # file name: OSError of the data files not accessible in select
+        self.stat_errors = {}
+
+    @staticmethod
+    def _stat_key(file_stat):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        This method should not be called from outside.
+
+        :param file_stat: result of os.stat
+
+        :return: list of the size, the modification time, the inode and the
+                 change time
+        """
+        return file_stat_key(file_stat) + [file_stat.st_ctime_ns]
+
+    def select(self, filenames, file_stats=None):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Select the data files to verify in this run.
+
+        Over all calls in this run at least the share of the given data
+        files is selected (rounded up). A data file, which cannot be
+        accessed (os.stat), is not selected and not counted. It is removed
+        from the ledger and stored with the OSError in self.stat_errors.
+
+        :param filenames: list of the data files
+        :param file_stats: None or dict of the results of os.stat for the
+                           data files (os.stat is called for the others)
+
+        :return: set of the selected data files
+        """
+        self.stat_errors = {}
+        candidates = []  # (time of the last verification, file name)
+        selected = set()
+        if file_stats is None:
+            file_stats = {}
+        for filename in filenames:
+            absfilename = os.path.abspath(filename)
+            try:
+                key = self._stat_key(file_stats.get(filename) or
+                                     os.stat(filename))
+            except OSError as err:
+                self.stat_errors[filename] = err
+                self._files.pop(absfilename, None)
+                continue
+            self._given.add(absfilename)
+            stored = self._files.get(absfilename)
+            if (stored is None) or (stored[0:4] != key):
+                verified = -math.inf  # never verified or changed
+            else:
+                verified = stored[4]
+            if (self.now - verified >=
+                    self.reverify_days * SECONDS_PER_DAY):
+                selected.add(filename)  # overdue
+                self._stats[absfilename] = key
+            else:
+                candidates.append((verified, filename, absfilename, key))
+        self._number_given += len(filenames) - len(self.stat_errors)
+        share = math.ceil(self._number_given * self._share) - \
+            self._number_selected
+        candidates.sort()
+        for (_, filename, absfilename, key) in candidates[
+                0:max(0, share - len(selected))]:
+            selected.add(filename)
+            self._stats[absfilename] = key
+        self._number_selected += len(selected)
+        return selected
+
+    def verified(self, filename, match):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Store the result of the verification of a selected data file.
+
+        :param filename: data file
+        :param match: True, if all hashes of the data file matched
+        """
+        absfilename = os.path.abspath(filename)
+        key = self._stats.pop(absfilename, None)
+        if match and (key is not None):
+            self._files[absfilename] = key + [self.now]
+        else:
+            self._files.pop(absfilename, None)
+
+    def write(self, directories=()):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Write the ledger with the time of this run.
+
+        Data files in the given directories, which were not given to select
+        in this run (e. g. not existing anymore), are removed from the
+        ledger. Data files in other directories are kept, since they were
+        not checked. No file is accessed for this.
+
+        :param directories: completely checked directories
+        """
+        prefixes = tuple(os.path.join(os.path.abspath(directory), '')
+                         for directory in directories)
+        if bool(prefixes):
+            for absfilename in list(self._files):
+                if (absfilename.startswith(prefixes) and
+                        (absfilename not in self._given)):
+                    del self._files[absfilename]
+        write_file_atomic(
+            self.file_name,
+            [json.dumps({'version': self.version,
+                         'last run': self.now,
+                         'files': self._files})])
@@ -1,7 +1,7 @@
 """
 Author: Daniel Mohr.
 
-Date: 2017-02-07 (last change).
+Date: 2017-02-07, 2026-10-18 (last change).
 
 License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 """
@@ -9,6 +9,25 @@ License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 import logging
 
 from .read_data_from_file import read_data_from_file
+from .pread_data_from_file import pread_data_from_file
+from .map_data_file import map_data_file
+from .hash_algorithms import HASH_FUNCTIONS
+from .hash_algorithms import SECURITY_BITS
+from .hash_algorithms import benchmark_hash_algorithms
+from .hash_algorithms import select_hash_algorithm
+from .open_data_file import IO_MODES
+from .open_data_file import DirectFile
+from .open_data_file import drop_cached_data
+from .open_data_file import open_data_file
+from .hash_file_writer import HashFileWriter
+from .hash_file_writer import TEMPORARY_EXTENSION
+from .scandir_walk import scandir_walk
+from .inode_cache import InodeCache
+from .manifest import MANIFEST_EXTENSION
+from .manifest import file_stat_key
+from .manifest import read_manifest
+from .manifest import write_file_atomic
+from .manifest import write_manifest
 
 
 def add_logging_level_name(lvl, levelname):
@@ -42,4 +61,10 @@ def add_logging_level_name(lvl, levelname):
 
 add_logging_level_name(15, "VERBOSEINFO")
 
-__all__ = ['read_data_from_file']
+__all__ = ['read_data_from_file', 'pread_data_from_file', 'map_data_file',
+           'MANIFEST_EXTENSION', 'file_stat_key', 'read_manifest',
+           'write_file_atomic', 'write_manifest', 'scandir_walk',
+           'HashFileWriter', 'TEMPORARY_EXTENSION', 'IO_MODES', 'DirectFile',
+           'drop_cached_data', 'open_data_file', 'HASH_FUNCTIONS',
+           'SECURITY_BITS', 'benchmark_hash_algorithms',
+           'select_hash_algorithm', 'InodeCache']
@@ -0,0 +1,87 @@
+"""
+Author: Daniel Mohr.
+
+Date: 2026-10-18 (last change).
+
+License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+"""
+
+import hashlib
+import time
+
+# hash functions available to create checksums
+HASH_FUNCTIONS = {'sha512': hashlib.sha512,
+                  'sha256': hashlib.sha256,
+                  'md5': hashlib.md5,
+                  'blake2b': hashlib.blake2b,
+                  'blake2s': hashlib.blake2s,
+                  'sha3_224': hashlib.sha3_224,
+                  'sha3_256': hashlib.sha3_256,
+                  'sha3_384': hashlib.sha3_384,
+                  'sha3_512': hashlib.sha3_512}
+
+# security against collisions in bits (md5 is broken)
+SECURITY_BITS = {'sha512': 256,
+                 'sha256': 128,
+                 'md5': 0,
+                 'blake2b': 256,
+                 'blake2s': 128,
+                 'sha3_224': 112,
+                 'sha3_256': 128,
+                 'sha3_384': 192,
+                 'sha3_512': 256}
+
+
+def benchmark_hash_algorithms(algorithms=None, data_size=2097152, repeat=3):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Measure the throughput of hash algorithms on this cpu.
+
+    :param algorithms: list of algorithms to measure,
+                       if None all of HASH_FUNCTIONS are used
+    :param data_size: number of Bytes to hash
+    :param repeat: the best of repeat measurements is used
+
+    :return: dict with the throughput in Bytes per second for every algorithm
+    """
+    if algorithms is None:
+        algorithms = list(HASH_FUNCTIONS)
+    data = bytes(data_size)
+    throughputs = {}
+    for alg in algorithms:
+        duration = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            HASH_FUNCTIONS[alg](data).digest()
+            duration = min(duration, time.perf_counter() - start)
+        throughputs[alg] = data_size / max(duration, 1e-9)
+    return throughputs
+
+
+def select_hash_algorithm(security_floor=128):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Select the fastest hash algorithm on this cpu with at least the given
+    security against collisions.
+
+    :param security_floor: minimal security against collisions in bits
+                           (see SECURITY_BITS)
+
+    :return: tuple of the selected algorithm and the dict of the measured
+             throughputs (see benchmark_hash_algorithms)
+    """
+    algorithms = [alg for alg in HASH_FUNCTIONS
+                  if SECURITY_BITS[alg] >= security_floor]
+    if not bool(algorithms):
+        raise ValueError(
+            f'no hash algorithm with security of {security_floor} bits')
+    throughputs = benchmark_hash_algorithms(algorithms)
+    return (max(algorithms, key=throughputs.get), throughputs)
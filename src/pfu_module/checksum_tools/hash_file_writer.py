@@ -0,0 +1,120 @@
+"""
+Author: Daniel Mohr.
+
+Date: 2026-10-18 (last change).
+
+License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+"""
+
+import collections
+import os
+import shutil
+
+TEMPORARY_EXTENSION = '.pfu_tmp'
+
+
+class HashFileWriter():
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Write hash files buffered and atomic.
+
+    The lines of a hash file are written to a temporary file (file name of
+    the hash file with the extension TEMPORARY_EXTENSION). At most
+    max_open_files of these files are kept open; the least recently used
+    one is closed and renamed to the hash file. Therefore a hash file is
+    never half written.
+    """
+
+    def __init__(self, max_open_files=32):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        :param max_open_files: maximal number of open hash files
+        """
+        self.max_open_files = max(1, max_open_files)
+        self.created = set()  # file names of the written hash files
+        self._open_files = collections.OrderedDict()
+
+    def write(self, hash_file_name, lines):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Append lines to the hash file.
+        On the first write an existing hash file is replaced.
+
+        :param hash_file_name: file name of the hash file
+        :param lines: iterable of strings (without line break)
+        """
+        if hash_file_name in self._open_files:
+            self._open_files.move_to_end(hash_file_name)
+            hash_file = self._open_files[hash_file_name]
+        else:
+            hash_file = self._open(hash_file_name)
+        for line in lines:
+            hash_file.write(line + "\n")
+
+    def _open(self, hash_file_name):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Open the temporary file of the hash file.
+        This method should not be called from outside.
+
+        :param hash_file_name: file name of the hash file
+
+        :return: file object
+        """
+        while len(self._open_files) >= self.max_open_files:
+            self._close(next(iter(self._open_files)))
+        tmp_file_name = hash_file_name + TEMPORARY_EXTENSION
+        if hash_file_name in self.created:
+            # already closed, continue the written hash file
+            shutil.copyfile(hash_file_name, tmp_file_name)
+            hash_file = open(  # pylint: disable=consider-using-with
+                tmp_file_name, mode='a', encoding='utf-8')
+        else:
+            hash_file = open(  # pylint: disable=consider-using-with
+                tmp_file_name, mode='w', encoding='utf-8')
+            self.created.add(hash_file_name)
+        self._open_files[hash_file_name] = hash_file
+        return hash_file
+
+    def _close(self, hash_file_name):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Close the temporary file and rename it to the hash file.
+        This method should not be called from outside.
+
+        :param hash_file_name: file name of the hash file
+        """
+        self._open_files.pop(hash_file_name).close()
+        os.replace(hash_file_name + TEMPORARY_EXTENSION, hash_file_name)
+
+    def close(self):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Close all open hash files.
+        """
+        while bool(self._open_files):
+            self._close(next(iter(self._open_files)))
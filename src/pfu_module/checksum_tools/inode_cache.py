@@ -0,0 +1,108 @@
+"""
+Author: Daniel Mohr.
+
+Date: 2026-10-18 (last change).
+
+License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+"""
+
+import threading
+
+
+class InodeCache():
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Cache results (e. g. hashes) of hardlinked files by the inode
+    (st_dev, st_ino). Therefore the data of an inode has to be read only
+    once for all its hardlinks.
+
+    Only files with more than one hardlink are cached. A result is
+    dropped after it was given for every other hardlink or if the size or
+    the modification time of the file changed. The cache can be used by
+    many threads at once.
+    """
+
+    def __init__(self):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+        """
+        # (st_dev, st_ino): [st_size, st_mtime_ns, remaining links, result]
+        self._results = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        State to pickle the instance (e. g. for a worker process).
+        The lock cannot be pickled and a worker starts with an empty cache.
+        """
+        return {}
+
+    def __setstate__(self, state):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        :param state: state from __getstate__
+        """
+        self.__init__()
+
+    def get(self, file_stat):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        :param file_stat: result of os.stat or os.fstat of the file
+
+        :return: result stored for the inode of the file or None
+        """
+        if file_stat.st_nlink < 2:
+            return None
+        key = (file_stat.st_dev, file_stat.st_ino)
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is None:
+                return None
+            if cached[0:2] != [file_stat.st_size, file_stat.st_mtime_ns]:
+                del self._results[key]
+                return None
+            cached[2] -= 1
+            if cached[2] <= 0:
+                del self._results[key]
+            return cached[3]
+
+    def put(self, file_stat, result):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Store the result for the inode of the file, if it has more than one
+        hardlink.
+
+        :param file_stat: result of os.stat or os.fstat of the file
+                          (before reading the file)
+        :param result: result to store
+        """
+        if file_stat.st_nlink < 2:
+            return
+        with self._lock:
+            self._results[(file_stat.st_dev, file_stat.st_ino)] = [
+                file_stat.st_size, file_stat.st_mtime_ns,
+                file_stat.st_nlink - 1, result]
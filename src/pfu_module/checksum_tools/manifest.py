@@ -0,0 +1,101 @@
+"""
+Author: Daniel Mohr.
+
+Date: 2026-10-18 (last change).
+
+License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+A manifest is stored beside a hash file (file name of the hash file with
+the extension MANIFEST_EXTENSION). For every data file with hashes in the
+hash file it stores the size, the modification time (st_mtime_ns), the
+inode and the lines of the hash file. This allows to update a hash file
+without reading unchanged data files.
+"""
+
+import json
+import os
+
+from .hash_file_writer import TEMPORARY_EXTENSION
+
+MANIFEST_EXTENSION = '.pfu_manifest'
+
+
+def file_stat_key(file_stat):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    :param file_stat: result of os.stat (or os.DirEntry.stat)
+
+    :return: list of the size, the modification time in ns and the inode
+    """
+    return [file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ino]
+
+
+def read_manifest(hash_file_name):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Read the manifest of the hash file hash_file_name.
+    If the manifest is not available or not readable, an empty manifest
+    is returned.
+
+    :param hash_file_name: file name of the hash file
+
+    :return: dict: for every file name (as used in the hash file) a list of
+             the result of file_stat_key and the list of lines in the hash
+             file
+    """
+    manifest = {}
+    try:
+        with open(hash_file_name + MANIFEST_EXTENSION,
+                  mode='r', encoding='utf-8') as manifest_file:
+            manifest = json.load(manifest_file)['files']
+    except (OSError, ValueError, KeyError, TypeError):
+        manifest = {}
+    return manifest
+
+
+def write_file_atomic(file_name, lines):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Write the lines to a temporary file and rename it to file_name.
+    Therefore the file file_name is never half written.
+
+    :param file_name: file name of the file to write
+    :param lines: iterable of strings (without line break)
+    """
+    tmp_file_name = file_name + TEMPORARY_EXTENSION
+    with open(tmp_file_name, mode='w', encoding='utf-8') as tmp_file:
+        for line in lines:
+            tmp_file.write(line + "\n")
+    os.replace(tmp_file_name, file_name)
+
+
+def write_manifest(hash_file_name, manifest):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Write the hash file hash_file_name and its manifest from the manifest.
+
+    :param hash_file_name: file name of the hash file
+    :param manifest: dict as returned by read_manifest
+    """
+    write_file_atomic(
+        hash_file_name,
+        (line for (_, lines) in manifest.values() for line in lines))
+    write_file_atomic(
+        hash_file_name + MANIFEST_EXTENSION,
+        [json.dumps({'version': 1, 'files': manifest})])
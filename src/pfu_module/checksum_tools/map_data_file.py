@@ -0,0 +1,46 @@
+"""
+Author: Daniel Mohr.
+
+Date: 2026-10-18 (last change).
+
+License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+"""
+
+import contextlib
+import mmap
+import os
+import stat
+
+
+def map_data_file(data_file, min_size, file_stat=None):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Create a read only memory map of the complete file data_file, if it is
+    a regular file larger than min_size.
+    The kernel is advised that the map is read sequentially (if possible).
+
+    :param data_file: file object to map
+    :param min_size: only files with more Bytes are mapped
+    :param file_stat: result of os.fstat for data_file,
+                      if None os.fstat is called
+
+    :return: context manager giving the mmap.mmap instance or None,
+             if the file is not mapped
+    """
+    mapped = None
+    try:
+        if file_stat is None:
+            file_stat = os.fstat(data_file.fileno())
+        if stat.S_ISREG(file_stat.st_mode) and (file_stat.st_size > min_size):
+            mapped = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        mapped = None
+    if mapped is None:
+        return contextlib.nullcontext()
+    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+        mapped.madvise(mmap.MADV_SEQUENTIAL)
+    return mapped
@@ -0,0 +1,235 @@
+"""
+Author: Daniel Mohr.
+
+Date: 2026-10-18 (last change).
+
+License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+Open data files with different usage of the page cache:
+
+buffered:
+  normal reading
+sequential-dontneed:
+  The kernel is advised that the file is read sequentially and the data
+  already read is dropped from the page cache (posix_fadvise).
+direct:
+  The page cache is bypassed (O_DIRECT). Therefore the data is really read
+  from the storage. The reads are aligned by DirectFile.
+
+If a mode is not available on the system, the next simpler mode is used.
+"""
+
+import io
+import mmap
+import os
+
+IO_MODES = ['buffered', 'sequential-dontneed', 'direct']
+DIRECT_ALIGNMENT = 4096  # anonymous mmap is aligned to (larger) pages
+
+
+def _align(size):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    :param size: number of Bytes
+
+    :return: size rounded up to a multiple of DIRECT_ALIGNMENT
+    """
+    return -(-size // DIRECT_ALIGNMENT) * DIRECT_ALIGNMENT
+
+
+def _pread_aligned(file_descriptor, buf, offset):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Read into the aligned buffer buf at the aligned offset.
+
+    :param file_descriptor: file descriptor opened with O_DIRECT
+    :param buf: aligned buffer (e. g. anonymous mmap.mmap)
+    :param offset: aligned position in the file
+
+    :return: number of Bytes read
+    """
+    if hasattr(os, 'preadv'):
+        return os.preadv(file_descriptor, [buf], offset)
+    os.lseek(file_descriptor, offset, os.SEEK_SET)
+    return os.readv(file_descriptor, [buf])
+
+
+class DirectFile(io.RawIOBase):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Read only file opened with O_DIRECT.
+
+    O_DIRECT needs aligned buffers, positions and sizes. DirectFile reads
+    aligned blocks into an own aligned buffer and gives arbitrary ranges
+    from this buffer. Therefore it can be used like a file opened in
+    binary mode without buffering.
+    """
+
+    def __init__(self, file_name, buf_size=524288):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        :param file_name: name of the file to open
+        :param buf_size: size of the buffer (rounded up to the alignment)
+        """
+        super().__init__()
+        self.name = file_name
+        # pylint: disable=no-member
+        self._fd = os.open(file_name, os.O_RDONLY | os.O_DIRECT)
+        self._buf = mmap.mmap(-1, _align(max(1, buf_size)))
+        self._view = memoryview(self._buf)
+        self._buf_start = 0
+        self._buf_len = 0
+        self._position = 0
+
+    def fileno(self):
+        # pylint: disable=missing-docstring
+        return self._fd
+
+    def readable(self):
+        # pylint: disable=missing-docstring
+        return True
+
+    def seekable(self):
+        # pylint: disable=missing-docstring
+        return True
+
+    def tell(self):
+        # pylint: disable=missing-docstring
+        return self._position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        # pylint: disable=missing-docstring
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += os.fstat(self._fd).st_size
+        self._position = offset
+        return self._position
+
+    def readinto(self, buffer):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Read data at the actual position into buffer.
+
+        :param buffer: writable buffer
+
+        :return: number of Bytes read (0 at the end of the file)
+        """
+        if not (self._buf_start <= self._position <
+                self._buf_start + self._buf_len):
+            self._buf_start = self._position - (
+                self._position % DIRECT_ALIGNMENT)
+            self._buf_len = _pread_aligned(
+                self._fd, self._buf, self._buf_start)
+        offset = self._position - self._buf_start
+        with memoryview(buffer) as view:
+            number_of_bytes = max(
+                0, min(len(view), self._buf_len - offset))
+            view[:number_of_bytes] = self._view[
+                offset:offset + number_of_bytes]
+        self._position += number_of_bytes
+        return number_of_bytes
+
+    def pread(self, size, offset):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Read size Bytes at offset without using or changing the position.
+        This can be used by many threads at once.
+
+        :param size: number of Bytes to read
+        :param offset: position in the file
+
+        :return: data read (empty at the end of the file)
+        """
+        start = offset - (offset % DIRECT_ALIGNMENT)
+        with mmap.mmap(-1, _align(offset + size - start)) as buf:
+            number_of_bytes = _pread_aligned(self._fd, buf, start)
+            return buf[offset - start:
+                       max(offset - start,
+                           min(offset - start + size, number_of_bytes))]
+
+    def close(self):
+        # pylint: disable=missing-docstring
+        if not self.closed:
+            os.close(self._fd)
+            self._view.release()
+            self._buf.close()
+        super().close()
+
+
+def open_data_file(file_name, io_mode='buffered', buf_size=524288):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Open the file file_name for reading in binary mode.
+
+    :param file_name: name of the file to open
+    :param io_mode: one of IO_MODES
+    :param buf_size: size of the aligned buffer for io_mode='direct'
+
+    :return: file object (can be used as context manager)
+    """
+    if (io_mode == 'direct') and hasattr(os, 'O_DIRECT'):
+        try:
+            return DirectFile(file_name, buf_size=buf_size)
+        except OSError as err:
+            if isinstance(err, (FileNotFoundError, PermissionError)):
+                raise
+            # e. g. file system not supporting O_DIRECT
+            io_mode = 'sequential-dontneed'
+    data_file = open(  # pylint: disable=consider-using-with
+        file_name, 'rb')
+    if (io_mode != 'buffered') and hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(data_file.fileno(), 0, 0,
+                         os.POSIX_FADV_SEQUENTIAL)
+    return data_file
+
+
+def drop_cached_data(data_file, offset, size, io_mode):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    For io_mode='sequential-dontneed' (or io_mode='direct' not available
+    for the file) advise the kernel to drop the given range of the file
+    from the page cache.
+
+    :param data_file: file object
+    :param offset: start of the range
+    :param size: size of the range
+    :param io_mode: one of IO_MODES
+    """
+    if ((io_mode != 'buffered') and (size > 0) and
+            (not isinstance(data_file, DirectFile)) and
+            hasattr(os, 'posix_fadvise')):
+        os.posix_fadvise(data_file.fileno(), offset, size,
+                         os.POSIX_FADV_DONTNEED)
@@ -0,0 +1,70 @@
+"""
+Author: Daniel Mohr.
+
+Date: 2026-10-18 (last change).
+
+License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+"""
+
+import os
+
+
+def pread_data_from_file(buf_size, data_file, offset, size, hash_objects):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Read size Bytes starting at offset from the file data_file in chunks and
+    update hash objects with these data chunks. The file position of
+    data_file is not used or changed. Therefore many threads can read
+    different ranges of the same file at once.
+
+    :param buf_size: read this amount of Bytes at once
+    :param data_file: file object from where to read
+    :param offset: position in the file to start reading
+    :param size: amount of Bytes to read
+    :param hash_objects: list of hash objects to update by the data
+
+    :return: list of the data chunks read
+    """
+    bufs = []
+    data_read = 0
+    if hasattr(data_file, 'pread'):
+        # e. g. DirectFile with aligned reads
+        while data_read < size:
+            buf = data_file.pread(min(buf_size, size-data_read),
+                                  offset + data_read)
+            if not bool(buf):
+                break
+            data_read += len(buf)
+            for hash_object in hash_objects:
+                hash_object.update(buf)
+            bufs.append(buf)
+    elif hasattr(os, 'pread'):
+        file_descriptor = data_file.fileno()
+        while data_read < size:
+            number_of_bytes = min(buf_size, size-data_read)
+            buf = os.pread(file_descriptor, number_of_bytes,
+                           offset + data_read)
+            if not bool(buf):
+                break
+            data_read += len(buf)
+            for hash_object in hash_objects:
+                hash_object.update(buf)
+            bufs.append(buf)
+    else:
+        # e. g. on windows we need an own file object to seek
+        with open(data_file.name, 'rb') as own_data_file:
+            own_data_file.seek(offset)
+            while data_read < size:
+                number_of_bytes = min(buf_size, size-data_read)
+                buf = own_data_file.read(number_of_bytes)
+                if not bool(buf):
+                    break
+                data_read += len(buf)
+                for hash_object in hash_objects:
+                    hash_object.update(buf)
+                bufs.append(buf)
+    return bufs
@@ -1,33 +1,72 @@
 """
 Author: Daniel Mohr.
 
-Date: 2016-12-03 (last change).
+Date: 2016-12-03, 2026-10-18 (last change).
 
 License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 """
 
+from .open_data_file import drop_cached_data
 
-def read_data_from_file(buf_size, data_file, size, hash_objects):
+
+def read_data_from_file(buf_size, data_file, size, hash_objects,
+                        buf=None, mapped=None, io_mode='buffered'):
     """
     :Author: Daniel Mohr
     :Email: daniel.mohr@dlr.de
-    :Date: 2016-12-04 (last change).
+    :Date: 2016-12-04, 2026-10-18 (last change).
     :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
     Read size Bytes from the file data_file in chunks and update
     hash objects with these data chunks.
 
+    The data is read into the buffer buf, which is reused for every chunk.
+    Therefore no new buffer is allocated for every chunk. To avoid
+    allocating a buffer on every call, pass the same buffer (e. g.
+    bytearray(buf_size)) to every call for the same file.
+
     :param buf_size: read this amount of Bytes at once
     :param data_file: file object from where to read
     :param size: amount of Bytes to read
     :param hash_objects: list of hash objects to update by the data
+    :param buf: writable buffer (e. g. bytearray) of at least buf_size Bytes
+                used to read the data into. If None, a buffer is allocated.
+    :param mapped: If not None, this is a memory map (mmap.mmap) of the
+                   complete file data_file. The hash objects are updated
+                   directly from the map and the file position of data_file
+                   is moved forward as if the data was read.
+    :param io_mode: one of IO_MODES (see open_data_file). For
+                    'sequential-dontneed' the data read is dropped from the
+                    page cache afterwards.
     """
+    # pylint: disable=too-many-arguments
     data_read = 0
-    while data_read < size:
-        number_of_bytes = min(buf_size, size-data_read)
-        buf = data_file.read(number_of_bytes)
-        if not bool(buf):
-            break
-        data_read += len(buf)
-        for hash_object in hash_objects:
-            hash_object.update(buf)
+    position = data_file.tell()
+    if mapped is not None:
+        size = min(size, len(mapped) - position)
+        with memoryview(mapped) as view:
+            while data_read < size:
+                number_of_bytes = min(buf_size, size-data_read)
+                with view[position+data_read:
+                          position+data_read+number_of_bytes] as chunk:
+                    for hash_object in hash_objects:
+                        hash_object.update(chunk)
+                data_read += number_of_bytes
+        data_file.seek(position + data_read)
+        drop_cached_data(data_file, position, data_read, io_mode)
+        return
+    if buf is None:
+        buf = bytearray(min(buf_size, size))
+    with memoryview(buf) as view:
+        buf_size = min(buf_size, len(view))
+        while data_read < size:
+            number_of_bytes = min(buf_size, size-data_read)
+            with view[:number_of_bytes] as part:
+                number_read = data_file.readinto(part)
+            if not bool(number_read):
+                break
+            data_read += number_read
+            with view[:number_read] as chunk:
+                for hash_object in hash_objects:
+                    hash_object.update(chunk)
+    drop_cached_data(data_file, position, data_read, io_mode)
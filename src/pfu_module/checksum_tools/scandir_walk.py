@@ -0,0 +1,55 @@
+"""
+Author: Daniel Mohr.
+
+Date: 2026-10-18 (last change).
+
+License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+"""
+
+import os
+
+
+def scandir_walk(top):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Walk the directory tree top down like os.walk, but give the
+    os.DirEntry instances of the files instead of the names.
+    Therefore the type and the stat result of a file are cached and
+    can be used without further system calls (at least on Linux the type
+    is known without calling stat). As for os.walk symbolic links to
+    directories are not followed and not readable directories are skipped.
+
+    :param top: name of the top directory
+
+    :return: generator of tuples of the directory name and the list of
+             os.DirEntry of the files (everything not a directory) in this
+             directory
+    """
+    try:
+        with os.scandir(top) as iterator:
+            entries = list(iterator)
+    except OSError:
+        return
+    dirs = []
+    files = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            dirs.append(entry)
+        else:
+            files.append(entry)
+    yield (top, files)
+    for entry in dirs:
+        try:
+            is_symlink = entry.is_symlink()
+        except OSError:
+            is_symlink = False
+        if not is_symlink:
+            yield from scandir_walk(entry.path)
@@ -1,11 +1,12 @@
 """
 Author: Daniel Mohr.
 
-Date: 2017-02-13 (last change).
+Date: 2017-02-13, 2026-10-18 (last change).
 
 License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 """
 
 from .create_checksum import CreateChecksumsClass
+from .hash_file_updates import HashFileUpdates
 
-__all__ = ['CreateChecksumsClass']
+__all__ = ['CreateChecksumsClass', 'HashFileUpdates']
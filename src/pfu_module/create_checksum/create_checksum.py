@@ -1,24 +1,75 @@
 """
 Author: Daniel Mohr.
 
-Date: 2017-03-07, 2021-05-25 (last change).
+Date: 2017-03-07, 2021-05-25, 2026-10-18 (last change).
 
 License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 """
 
 import base64
-import hashlib
+import collections
+import concurrent.futures
 import logging
 import os
 
+from pfu_module.checksum_tools import HASH_FUNCTIONS
+from pfu_module.checksum_tools import HashFileWriter
+from pfu_module.checksum_tools import InodeCache
+from pfu_module.checksum_tools import MANIFEST_EXTENSION
+from pfu_module.checksum_tools import TEMPORARY_EXTENSION
+from pfu_module.checksum_tools import drop_cached_data
+from pfu_module.checksum_tools import map_data_file
+from pfu_module.checksum_tools import open_data_file
+from pfu_module.checksum_tools import pread_data_from_file
 from pfu_module.checksum_tools import read_data_from_file
+from pfu_module.checksum_tools import scandir_walk
+from pfu_module.checksum_tools import select_hash_algorithm
+
+from .hash_file_updates import HashFileUpdates
+
+_WORKER_INSTANCE = None  # instance of CreateChecksumsClass in a worker
+
+
+def _init_worker(instance):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Store the instance of CreateChecksumsClass in a worker process.
+    This function should not be called from outside.
+
+    :param instance: instance of CreateChecksumsClass
+    """
+    global _WORKER_INSTANCE  # pylint: disable=global-statement
+    _WORKER_INSTANCE = instance
+
+
+def _worker_calculate_hashes(data_file_name, algorithms):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Calculate hash(es) for data_file_name in a worker process.
+    This function should not be called from outside.
+
+    :param data_file_name: file name of the file to analyse
+    :param algorithms: list of algorithms to use
+
+    :return: result of CreateChecksumsClass._calculate_hashes
+    """
+    # pylint: disable=protected-access
+    return _WORKER_INSTANCE._calculate_hashes(data_file_name, algorithms)
 
 
 class CreateChecksumsClass():
     """
     :Author: Daniel Mohr
     :Email: daniel.mohr@dlr.de
-    :Date: 2017-03-07, 2021-05-25 (last change).
+    :Date: 2017-03-07, 2021-05-25, 2026-10-18 (last change).
     :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
     class to create checksums in directory or directories
@@ -36,18 +87,31 @@ class CreateChecksumsClass():
                  chunk_size=12582912,  # 12 MB
                  create_only_missing=1,
                  level=20,
-                 hash_file_prefix='.checksum'):
+                 hash_file_prefix='.checksum',
+                 jobs=1,
+                 pool='thread',
+                 chunk_jobs=1,
+                 use_mmap=0,
+                 io_mode='buffered',
+                 security_floor=128):
         """
         :Author: Daniel Mohr
         :Email: daniel.mohr@dlr.de
-        :Date: 2017-03-06 (last change).
+        :Date: 2017-03-06, 2026-10-18 (last change).
         :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
         class to create checksums in directory or directories
 
         :param directories: Create hashes for this list of directories.
                             Symbolic links in given directories are ignored.
-        :param algorithm: Set the algorithm used to calculate the hashes.
+        :param algorithm: Set the algorithm used to calculate the hashes
+                          (see pfu_module.checksum_tools.HASH_FUNCTIONS).
+                          This can also be a list of algorithms. In this
+                          case every file is read only once and the hashes
+                          of each algorithm are stored in its own file.
+                          The algorithm \"auto\" is replaced by the fastest
+                          algorithm on this cpu with at least the security
+                          security_floor.
         :param coding: Set the coding format (RFC 3548) of the hash output.
         :param store: Set the file(s) to store the hashes.
                       Set to \"dir\" means store the hashes in a file for
@@ -56,7 +120,8 @@ class CreateChecksumsClass():
                       \"many\" means store the hashes in a file for every data
                       file.
         :param ignore: list of file extensions, which are ignored
-                       default: [".md5", ".sha256", ".sha512"]
+                       default: the algorithms as extensions, e. g.
+                       [".sha512", ".sha256", ".md5", ...]
         :param buf_size: Files will be read in chunks of the given amount of
                          Bytes. This should be a factor of the data handled by
                          the hash function (e. g. 64 Bytes for md5, 64 Bytes
@@ -68,13 +133,60 @@ class CreateChecksumsClass():
                                     expected file from store is not available.
                                     If set to 0 hash files are overwritten if
                                     exists.
+                                    If set to 2 the hash files are updated:
+                                    Only new or changed (size, modification
+                                    time or inode) files are hashed and
+                                    hashes of deleted files are removed.
+                                    Therefore a manifest is stored beside
+                                    every hash file.
         :param level: Set how verbose should be the output. This is the level
                       of logging. Lower numbers give more output. The parameter
                       is a number between 1 and 50.
         :param hash_file_prefix: Set the hash file prefix.
+        :param jobs: Number of files hashed in parallel. If set to 0 the
+                     number of CPUs is used. The hash files are identical
+                     to the ones created with jobs=1.
+        :param pool: Set the kind of workers used for jobs > 1.
+                     Set to \"thread\" means a pool of threads (hashlib
+                     releases the GIL, therefore good for large files).
+                     Set to \"process\" means a pool of processes
+                     (good for many small files).
+        :param chunk_jobs: Number of chunks of a file read and hashed in
+                           parallel. The hash of the complete file is fed
+                           in order by a bounded reorder buffer.
+                           This is only used for files larger than
+                           chunk_size.
+        :param use_mmap: If set to 1 files larger than buf_size are mapped
+                         to memory (mmap) instead of reading them into a
+                         buffer.
+        :param io_mode: Set the usage of the page cache (see
+                        pfu_module.checksum_tools.IO_MODES).
+                        Set to \"buffered\" means normal reading.
+                        Set to \"sequential-dontneed\" means the data read
+                        is dropped from the page cache.
+                        Set to \"direct\" means the page cache is bypassed
+                        (O_DIRECT, use_mmap is ignored).
+        :param security_floor: Minimal security against collisions in bits
+                               for the algorithm \"auto\" (see
+                               pfu_module.checksum_tools.SECURITY_BITS).
         """
+        # pylint: disable=too-many-locals
         self.level = level
-        self.algorithm = algorithm
+        self.log = logging.getLogger("pfu.create")
+        self.log.setLevel(1)
+        self.algorithms = algorithm
+        if isinstance(algorithm, str):
+            self.algorithms = [algorithm]
+        if 'auto' in self.algorithms:
+            (selected, throughputs) = select_hash_algorithm(security_floor)
+            for (alg, throughput) in throughputs.items():
+                self.log.debug("algorithm %s: %.1f MB/s", alg,
+                               throughput / 1e6)
+            self.log.info("algorithm auto: use %s", selected)
+            self.algorithms = list(dict.fromkeys(
+                selected if alg == 'auto' else alg
+                for alg in self.algorithms))
+        self.algorithm = self.algorithms[0]
         self.coding = coding
         self.directories = directories
         if directories is None:
@@ -85,14 +197,27 @@ class CreateChecksumsClass():
         self.create_only_missing = create_only_missing
         self.ignore = ignore
         if ignore is None:
-            self.ignore = [".md5", ".sha256", ".sha512"]
+            self.ignore = ['.' + alg for alg in HASH_FUNCTIONS]
         self.buf_size = buf_size
-        self.created_hash_files = []  # list of already created hash files
-        self.log = logging.getLogger("pfu.create")
-        self.log.setLevel(1)
-        self.hashfkt = {'sha512': hashlib.sha512,
-                        'sha256': hashlib.sha256,
-                        'md5': hashlib.md5}[self.algorithm]
+        self.jobs = jobs
+        if jobs == 0:
+            self.jobs = os.cpu_count()
+        self.pool = pool
+        self.chunk_jobs = chunk_jobs
+        self.use_mmap = use_mmap
+        self.io_mode = io_mode
+        self._hash_file_writer = HashFileWriter()
+        # set of already created hash files
+        self.created_hash_files = self._hash_file_writer.created
+        # for create_only_missing=2
+        self._updates = HashFileUpdates(self.created_hash_files)
+        # hashes of hardlinked files, every inode is read only once
+        self._inode_cache = InodeCache()
+        self.saved_reads = 0  # number of reads saved by hardlinks
+        self.hashfkts = {}
+        for alg in self.algorithms:
+            self.hashfkts[alg] = HASH_FUNCTIONS[alg]
+        self.hashfkt = self.hashfkts[self.algorithm]
         self.encode = {'hex': base64.b16encode,
                        'base16': base64.b16encode,
                        'Base16': base64.b16encode,
@@ -101,52 +226,319 @@ class CreateChecksumsClass():
                        'base64': base64.b64encode,
                        'Base64': base64.b64encode}[self.coding]
 
+    def __getstate__(self):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        State to pickle the instance (e. g. for a worker process).
+        The open hash files and the states of the hash files are not
+        needed to calculate hashes and therefore not pickled.
+        """
+        state = self.__dict__.copy()
+        state['_hash_file_writer'] = HashFileWriter()
+        state['created_hash_files'] = state['_hash_file_writer'].created
+        state['_updates'] = HashFileUpdates(state['created_hash_files'])
+        return state
+
     def calculate_hash(self, data_file_name):
         """
         :Author: Daniel Mohr
         :Email: daniel.mohr@dlr.de
-        :Date: 2016-12-08, 2021-05-25 (last change).
+        :Date: 2016-12-08, 2021-05-25, 2026-10-18 (last change).
         :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
-        Calculate hash(es) for data_file_name
+        Calculate hash(es) for data_file_name with the (first) algorithm.
 
         :param data_file_name: file name of the file to analyse
         """
-        out = [()]
-        with open(data_file_name, 'rb') as data_file:
-            last_position = 0
-            cal_hash = self.hashfkt()
-            create_chunk_hashes = False
-            if self.chunk_size < os.path.getsize(data_file_name):
-                create_chunk_hashes = True
-            filename = os.path.normpath(data_file_name)
-            if self.store != 'single':
-                filename = os.path.split(data_file_name)[1]
-            while data_file.tell() < os.path.getsize(data_file_name):
-                hash_objects = [cal_hash]
-                if create_chunk_hashes:
-                    cal_chunk_hash = self.hashfkt()
-                    hash_objects += [cal_chunk_hash]
-                read_data_from_file(self.buf_size, data_file,
-                                    self.chunk_size, hash_objects)
+        return self.calculate_hashes(
+            data_file_name, [self.algorithm])[self.algorithm]
+
+    def calculate_hashes(self, data_file_name, algorithms=None):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Calculate hash(es) for data_file_name with every given algorithm.
+        The file is read only once. The size of the file is determined
+        once after opening the file. Hardlinked files are read only once
+        (see pfu_module.checksum_tools.InodeCache).
+
+        :param data_file_name: file name of the file to analyse
+        :param algorithms: list of algorithms to use,
+                           if None self.algorithms is used
+
+        :return: dict with the output of calculate_hash for every algorithm
+        """
+        if algorithms is None:
+            algorithms = self.algorithms
+        (outs, saved_read) = self._calculate_hashes(data_file_name,
+                                                    algorithms)
+        if saved_read:
+            self.saved_reads += 1
+        return outs
+
+    def _calculate_hashes(self, data_file_name, algorithms):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Calculate hash(es) for data_file_name with every given algorithm.
+        If the hashes of an other hardlink of the file are already
+        calculated, the file is not read and these hashes are used.
+        This method should not be called from outside.
+
+        :param data_file_name: file name of the file to analyse
+        :param algorithms: list of algorithms to use
+
+        :return: tuple of the dict with the output of calculate_hash for
+                 every algorithm and True if reading the file was saved
+        """
+        hashfkts = [self.hashfkts[alg] for alg in algorithms]
+        outs = [[()] for _ in algorithms]
+        with open_data_file(data_file_name, self.io_mode,
+                            self.buf_size) as data_file:
+            file_stat = os.fstat(data_file.fileno())
+            filename = self._name_in_hash_file(data_file_name)
+            cached = self._inode_cache.get(file_stat)
+            if (cached is not None) and set(algorithms) <= set(cached):
+                # same data as an other hardlink, only the name differs
+                return ({alg: [line[:2] + (filename,) + line[3:]
+                               for line in cached[alg]]
+                         for alg in algorithms},
+                        True)
+            cal_hashes = [hashfkt() for hashfkt in hashfkts]
+            if (self.chunk_size < file_stat.st_size) and \
+                    (self.chunk_jobs > 1):
+                for (out, chunk_out) in zip(
+                        outs, self._calculate_chunk_hashes_parallel(
+                            data_file, filename, hashfkts, cal_hashes,
+                            file_stat.st_size)):
+                    out += chunk_out
+            # the rest (or everything) is read sequentially
+            for (out, chunk_out) in zip(
+                    outs, self._calculate_chunk_hashes_sequential(
+                        data_file, filename, hashfkts, cal_hashes,
+                        file_stat)):
+                out += chunk_out
+            for (out, cal_hash) in zip(outs, cal_hashes):
+                out[0] = (self.encode(cal_hash.digest()).decode(),
+                          '  ',
+                          filename)
+        outs = dict(zip(algorithms, outs))
+        self._inode_cache.put(file_stat, outs)
+        return (outs, False)
+
+    def _name_in_hash_file(self, data_file_name):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        This method should not be called from outside.
+
+        :param data_file_name: file name of the file to analyse
+
+        :return: file name of data_file_name as used in the hash file
+        """
+        if self.store == 'single':
+            return os.path.normpath(data_file_name)
+        return os.path.split(data_file_name)[1]
+
+    def _chunk_line(self, cal_chunk_hash, filename, start, stop):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        This method should not be called from outside.
+
+        :param cal_chunk_hash: encoded hash of the chunk
+        :param filename: file name used in the output
+        :param start: position of the first Byte of the chunk
+        :param stop: position of the last Byte of the chunk
+
+        :return: line of the chunk (as in calculate_hash)
+        """
+        return (cal_chunk_hash, '  ', filename,
+                ' (bytes ', f'{start}', ' - ', f'{stop}', ')')
+
+    def _calculate_chunk_hashes_sequential(self, data_file, filename,
+                                           hashfkts, cal_hashes, file_stat):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Read data_file from the current file position to the end with one
+        buffer (or mapped to memory, see use_mmap). The data is fed to
+        cal_hashes and, if the file is larger than self.chunk_size, to the
+        hash objects of the chunks.
+        This method should not be called from outside.
+
+        :param data_file: file object from where to read
+        :param filename: file name used in the output
+        :param hashfkts: list of hash functions to use
+        :param cal_hashes: list of hash objects of the complete file
+                           (one for every hash function)
+        :param file_stat: result of os.fstat for data_file
+
+        :return: for every hash function a list of the hashes of the chunks
+                 (as in calculate_hash)
+        """
+        outs = [[] for _ in hashfkts]
+        create_chunk_hashes = self.chunk_size < file_stat.st_size
+        # one buffer for the file, reused for every read
+        buf = bytearray(max(1, min(self.buf_size, file_stat.st_size)))
+        min_mmap_size = self.buf_size
+        if (not self.use_mmap) or (self.io_mode == 'direct'):
+            min_mmap_size = float('inf')
+        with map_data_file(data_file, min_mmap_size,
+                           file_stat=file_stat) as mapped:
+            while data_file.tell() < file_stat.st_size:
+                offset = data_file.tell()
+                cal_chunk_hashes = []
                 if create_chunk_hashes:
-                    out += [(self.encode(cal_chunk_hash.digest()).decode(),
-                             '  ',
-                             filename,
-                             ' (bytes ', f'{last_position}',
-                             ' - ',
-                             f'{data_file.tell()-1}', ')')]
-                last_position = data_file.tell()
-            out[0] = (self.encode(cal_hash.digest()).decode(),
-                      '  ',
-                      filename)
-        return out
-
-    def _calculate_store_hash(self, data_file_name, hash_file_name):
+                    cal_chunk_hashes = [hashfkt() for hashfkt in hashfkts]
+                read_data_from_file(
+                    self.buf_size, data_file,
+                    min(self.chunk_size, file_stat.st_size - offset),
+                    cal_hashes + cal_chunk_hashes, buf=buf, mapped=mapped,
+                    io_mode=self.io_mode)
+                if data_file.tell() == offset:
+                    break  # file changed (e. g. larger than mapped)
+                for (out, cal_chunk_hash) in zip(outs, cal_chunk_hashes):
+                    out.append(self._chunk_line(
+                        self.encode(cal_chunk_hash.digest()).decode(),
+                        filename, offset, data_file.tell() - 1))
+        return outs
+
+    def _read_hash_chunk(self, data_file, offset, size, hashfkts):
         """
         :Author: Daniel Mohr
         :Email: daniel.mohr@dlr.de
-        :Date: 2017-03-07 (last change).
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Read and hash one chunk of data_file.
+        This method should not be called from outside.
+
+        :param data_file: file object from where to read
+        :param offset: position of the chunk in the file
+        :param size: size of the chunk
+        :param hashfkts: list of hash functions to use
+
+        :return: tuple of the list of encoded hashes of the chunk and the list
+                 of the data read
+        """
+        cal_chunk_hashes = [hashfkt() for hashfkt in hashfkts]
+        bufs = pread_data_from_file(self.buf_size, data_file, offset, size,
+                                    cal_chunk_hashes)
+        drop_cached_data(data_file, offset, size, self.io_mode)
+        return ([self.encode(cal_chunk_hash.digest()).decode()
+                 for cal_chunk_hash in cal_chunk_hashes],
+                bufs)
+
+    def _calculate_chunk_hashes_parallel(self, data_file, filename,
+                                         hashfkts, cal_hashes, filesize):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Calculate the hashes of the chunks of data_file by self.chunk_jobs
+        parallel readers. The data is fed in order to cal_hashes.
+        Therefore the data of a chunk (see _read_hash_chunk) is held in
+        memory until all previous chunks are fed. The number of pending
+        chunks is bounded, at most 2 * self.chunk_jobs chunks (each of
+        self.chunk_size Bytes) are held in memory.
+        Afterwards the file position of data_file is set to the end of
+        the data read.
+        This method should not be called from outside.
+
+        :param data_file: file object from where to read
+        :param filename: file name used in the output
+        :param hashfkts: list of hash functions to use
+        :param cal_hashes: list of hash objects of the complete file
+                           (one for every hash function)
+        :param filesize: size of the file
+
+        :return: for every hash function a list of the hashes of the chunks
+                 (as in calculate_hash)
+        """
+        outs = [[] for _ in hashfkts]
+        pending = collections.deque()
+        position = 0
+
+        def store_next_chunk(position):
+            (offset, future) = pending.popleft()
+            (chunk_hashes, bufs) = future.result()
+            for buf in bufs:
+                for cal_hash in cal_hashes:
+                    cal_hash.update(buf)
+                position += len(buf)
+            if position > offset:
+                for (out, chunk_hash) in zip(outs, chunk_hashes):
+                    out.append(self._chunk_line(
+                        chunk_hash, filename, offset, position - 1))
+            return position
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.chunk_jobs) as executor:
+            for offset in range(0, filesize, self.chunk_size):
+                pending.append((offset, executor.submit(
+                    self._read_hash_chunk, data_file, offset,
+                    min(self.chunk_size, filesize - offset), hashfkts)))
+                while len(pending) >= 2 * self.chunk_jobs:
+                    position = store_next_chunk(position)
+            while bool(pending):
+                position = store_next_chunk(position)
+        data_file.seek(position)
+        return outs
+
+    def _store_hash(self, data_file_name, hash_file_name, out):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Store already calculated hash in file (by the buffered hash file
+        writer) and set.
+        This method should not be called from outside.
+
+        :param data_file_name: file name of the analysed file
+        :param hash_file_name: file name of the file to store hash
+        :param out: result of calculate_hash for data_file_name
+        """
+        if self.create_only_missing == 2:
+            # store hash in the manifest, the hash file is written later
+            self._updates.store(hash_file_name, out[0][2],
+                                [''.join(line) for line in out])
+            self.log.verboseinfo(
+                "file \"%s\": update %i hashes", data_file_name, len(out))
+            return
+        # store hash in hash_file_name (and hash file name in set)
+        self._hash_file_writer.write(
+            hash_file_name, (''.join(line) for line in out))
+        self.log.verboseinfo(
+            "file \"%s\": write %i hashes", data_file_name, len(out))
+
+    def _calculate_store_hash(self, data_file_name, hash_file_names):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2017-03-07, 2026-10-18 (last change).
         :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
         Calculate hash and store hash in file and list.
@@ -155,84 +547,270 @@ class CreateChecksumsClass():
         no hashes are stored.
 
         :param data_file_name: file name of the file to analyse
-        :param hash_file_name: file name of the file to store hash
+        :param hash_file_names: dict of the file names of the files to store
+                                hash for every algorithm to use
         """
-        err = 0  # no error
         # calculate hash for data_file_name
         try:
-            out = self.calculate_hash(data_file_name)
+            outs = self.calculate_hashes(data_file_name,
+                                         list(hash_file_names))
+        except PermissionError:
+            self.log.warning('file "%s" is not readable', data_file_name)
+            self._update_stored(data_file_name, hash_file_names, False)
         except IOError:
-            err = 1  # IOError
             self.log.warning(
                 'IOError during hashing file "%s"', data_file_name)
-        if err == 0:
-            # store hash in hash_file_name
-            with open(hash_file_name, mode='a', encoding='utf-8') as hash_file:
-                for line in out:
-                    hash_file.write(''.join(line)+"\n")
-                self.log.verboseinfo(
-                    "file \"%s\": write %i hashes", data_file_name, len(out))
-            # store hash file name in list
-            if hash_file_name not in self.created_hash_files:
-                self.created_hash_files += [hash_file_name]
-
-    def create_checksum(self, dirpath, data_file_name):
+            self._update_stored(data_file_name, hash_file_names, False)
+        else:
+            for alg, hash_file_name in hash_file_names.items():
+                self._store_hash(data_file_name, hash_file_name, outs[alg])
+            self._update_stored(data_file_name, hash_file_names, True)
+
+    def _store_hash_from_future(self, future, data_file_name,
+                                hash_file_names):
         """
         :Author: Daniel Mohr
         :Email: daniel.mohr@dlr.de
-        :Date: 2017-02-25 (last change).
+        :Date: 2026-10-18 (last change).
         :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
-        Create hashes for the file name.
+        Wait for the hash calculated by a worker and store it in file and list.
+        This method should not be called from outside.
+        If IOError occurred during hashing the file data_file_name,
+        no hashes are stored.
 
-        :param dirpath: directory of the file
+        :param future: future of _calculate_hashes for data_file_name
         :param data_file_name: file name of the file to analyse
+        :param hash_file_names: dict of the file names of the files to store
+                                hash for every algorithm to use
         """
-        if (os.path.isfile(data_file_name) and
-                os.access(data_file_name, os.R_OK)):
-            hash_file_name = ""
-            if self.store == 'dir':
-                hash_file_name = os.path.join(
-                    dirpath,
-                    self.hash_file_prefix + '.' + self.algorithm)
-            elif self.store == 'single':
-                hash_file_name = self.hash_file_prefix + '.' + self.algorithm
-            elif self.store == 'many':
-                hash_file_name = data_file_name + '.' + self.algorithm
-            self.log.debug("possible write hash to \"%s\"", hash_file_name)
-            if ((self.create_only_missing == 0) or
-                    (not os.path.exists(hash_file_name)) or
-                    (hash_file_name in self.created_hash_files)):
-                if ((self.create_only_missing == 0) and
-                        os.path.exists(hash_file_name) and
-                        (hash_file_name not in self.created_hash_files)):
-                    os.remove(hash_file_name)
-                self._calculate_store_hash(data_file_name, hash_file_name)
-            elif (os.path.exists(hash_file_name) and
-                  (hash_file_name not in self.created_hash_files)):
-                self.log.debug(
-                    "hash file \"%s\" already exists", hash_file_name)
-            else:
-                self.log.debug(
-                    "hash file \"%s\" not used (no reason)", hash_file_name)
-        elif not os.access(data_file_name, os.R_OK):
+        try:
+            (outs, saved_read) = future.result()
+        except PermissionError:
             self.log.warning('file "%s" is not readable', data_file_name)
+            self._update_stored(data_file_name, hash_file_names, False)
+        except IOError:
+            self.log.warning(
+                'IOError during hashing file "%s"', data_file_name)
+            self._update_stored(data_file_name, hash_file_names, False)
         else:
+            if saved_read:
+                self.saved_reads += 1
+            for alg, hash_file_name in hash_file_names.items():
+                self._store_hash(data_file_name, hash_file_name, outs[alg])
+            self._update_stored(data_file_name, hash_file_names, True)
+
+    def _update_stored(self, data_file_name, hash_file_names, stored):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Finish hashing of a data file for create_only_missing=2
+        (see HashFileUpdates.stored).
+        This method should not be called from outside.
+
+        :param data_file_name: file name of the data file
+        :param hash_file_names: dict of the file names of the hash files
+        :param stored: True, if the hashes are stored
+        """
+        if self.create_only_missing == 2:
+            self._updates.stored(self._name_in_hash_file(data_file_name),
+                                 hash_file_names, stored)
+
+    def _get_hash_file_name(self, dirpath, data_file_name, alg):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2017-02-25, 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        This method should not be called from outside.
+
+        :param dirpath: directory of the file
+        :param data_file_name: file name of the file to analyse
+        :param alg: algorithm
+
+        :return: file name of the hash file
+        """
+        hash_file_name = ""
+        if self.store == 'dir':
+            hash_file_name = os.path.join(
+                dirpath,
+                self.hash_file_prefix + '.' + alg)
+        elif self.store == 'single':
+            hash_file_name = self.hash_file_prefix + '.' + alg
+        elif self.store == 'many':
+            hash_file_name = data_file_name + '.' + alg
+        return hash_file_name
+
+    def _hash_file_exists(self, hash_file_name, dir_names):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Determine if the hash file exists. For store='dir' and store='many'
+        the hash file is in the directory of the data file. If the names in
+        this directory are given, no system call is necessary.
+        This method should not be called from outside.
+
+        :param hash_file_name: file name of the hash file
+        :param dir_names: None or set of the names in the directory of the
+                          data file
+
+        :return: True, if the hash file exists
+        """
+        if (dir_names is None) or (self.store == 'single'):
+            return os.path.exists(hash_file_name)
+        return os.path.basename(hash_file_name) in dir_names
+
+    def _prepare_hash_files(self, dirpath, data_file_name,
+                            entry=None, dir_names=None):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2017-02-25, 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Determine the hash files for the file name and whether hashes have to
+        be created. Outdated hash files are removed (create_only_missing=0).
+        For create_only_missing=2 the manifests of the hash files are used.
+        If the os.DirEntry of the file and the names in the directory are
+        given, the cached informations are used instead of system calls.
+        If the file is not readable, this is detected on opening the file.
+        This method should not be called from outside.
+
+        :param dirpath: directory of the file
+        :param data_file_name: file name of the file to analyse
+        :param entry: None or os.DirEntry of the file
+        :param dir_names: None or set of the names in the directory dirpath
+
+        :return: dict of the file names of the hash files for every algorithm
+                 needed to use (empty if no hashes are needed)
+        """
+        try:
+            if entry is None:
+                is_file = os.path.isfile(data_file_name)
+            else:
+                is_file = entry.is_file()
+        except OSError:
+            is_file = False
+        if not is_file:
             self.log.warning('file "%s" not existing (anymore?)',
                              data_file_name)
+            return {}
+        if self.create_only_missing == 2:
+            return self._prepare_update(dirpath, data_file_name, entry)
+        hash_file_names = {}
+        for alg in self.algorithms:
+            hash_file_name = self._get_hash_file_name(
+                dirpath, data_file_name, alg)
+            self.log.debug("possible write hash to \"%s\"", hash_file_name)
+            if self._hash_file_needed(hash_file_name, dir_names):
+                hash_file_names[alg] = hash_file_name
+        return hash_file_names
+
+    def _hash_file_needed(self, hash_file_name, dir_names):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Determine for create_only_missing=0 or create_only_missing=1 if
+        hashes have to be written to the hash file. An outdated hash file
+        is removed (create_only_missing=0).
+        This method should not be called from outside.
+
+        :param hash_file_name: file name of the hash file
+        :param dir_names: None or set of the names in the directory of the
+                          data file
+
+        :return: True, if hashes have to be written to hash_file_name
+        """
+        if hash_file_name in self.created_hash_files:
+            return True
+        if not self._hash_file_exists(hash_file_name, dir_names):
+            return True
+        if self.create_only_missing == 0:
+            os.remove(hash_file_name)
+            if dir_names is not None:
+                dir_names.discard(os.path.basename(hash_file_name))
+            return True
+        self.log.debug("hash file \"%s\" already exists", hash_file_name)
+        return False
+
+    def _prepare_update(self, dirpath, data_file_name, entry):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Determine for create_only_missing=2 the hash files, which have to
+        be updated, by the manifests of the hash files
+        (see HashFileUpdates.needed).
+        This method should not be called from outside.
+
+        :param dirpath: directory of the file
+        :param data_file_name: file name of the file to analyse
+        :param entry: None or os.DirEntry of the file
+
+        :return: dict of the file names of the hash files for every algorithm
+                 needed to use (empty if the file is unchanged)
+        """
+        if entry is None:
+            file_stat = os.stat(data_file_name)
+        else:
+            file_stat = entry.stat()
+        hash_file_names = {}
+        for alg in self.algorithms:
+            hash_file_name = self._get_hash_file_name(
+                dirpath, data_file_name, alg)
+            self.log.debug("possible update hash in \"%s\"", hash_file_name)
+            if self._updates.needed(
+                    hash_file_name, self._name_in_hash_file(data_file_name),
+                    file_stat):
+                hash_file_names[alg] = hash_file_name
+        if not bool(hash_file_names):
+            self.log.debug("file \"%s\" unchanged", data_file_name)
+        return hash_file_names
+
+    def create_checksum(self, dirpath, data_file_name,
+                        entry=None, dir_names=None):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2017-02-25, 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Create hashes for the file name.
+
+        :param dirpath: directory of the file
+        :param data_file_name: file name of the file to analyse
+        :param entry: None or os.DirEntry of the file
+        :param dir_names: None or set of the names in the directory dirpath
+        """
+        hash_file_names = self._prepare_hash_files(
+            dirpath, data_file_name, entry=entry, dir_names=dir_names)
+        if bool(hash_file_names):
+            self._calculate_store_hash(data_file_name, hash_file_names)
 
     def is_hash_file(self, name):
         """
         :Author: Daniel Mohr
         :Email: daniel.mohr@dlr.de
-        :Date: 2016-12-02 (last change).
+        :Date: 2016-12-02, 2026-10-18 (last change).
         :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
         Determine if name is a hash file.
 
         :param name: name of the file
         """
-        ret = False
+        ret = name.endswith((MANIFEST_EXTENSION, TEMPORARY_EXTENSION))
         for file_extention in self.ignore:
             if name.endswith(file_extention):
                 ret = True
@@ -243,7 +821,7 @@ class CreateChecksumsClass():
         """
         :Author: Daniel Mohr
         :Email: daniel.mohr@dlr.de
-        :Date: 2017-02-25 (last change).
+        :Date: 2017-02-25, 2026-10-18 (last change).
         :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
         Create hashes for every file in this directory.
@@ -251,21 +829,138 @@ class CreateChecksumsClass():
         :param name: name of the top directory to handle
         """
         self.log.debug("analyse directory \"%s\"", name)
-        self.created_hash_files = []  # list of already created hash files
-        for (dirpath, _, filenames) in os.walk(name):
-            for filename in filenames:
-                if not self.is_hash_file(os.path.join(dirpath, filename)):
+        self._hash_file_writer = HashFileWriter()
+        # set of already created hash files
+        self.created_hash_files = self._hash_file_writer.created
+        self._updates = HashFileUpdates(self.created_hash_files)
+        try:
+            if self.jobs > 1:
+                self._create_hashes_in_directory_parallel(name)
+            else:
+                self._create_hashes_in_directory_sequential(name)
+        finally:
+            self._hash_file_writer.close()
+
+    def _create_hashes_in_directory_sequential(self, name):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2017-02-25, 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Create hashes for every file in this directory one after the other.
+        This method should not be called from outside.
+
+        :param name: name of the top directory to handle
+        """
+        for (dirpath, entries) in scandir_walk(name):
+            dir_names = {entry.name for entry in entries}
+            self._open_update_states(dirpath, dir_names)
+            for entry in entries:
+                if not self.is_hash_file(entry.path):
+                    self.log.debug("create hash for file \"%s\"",
+                                   entry.path)
+                    self.create_checksum(dirpath, entry.path,
+                                         entry=entry, dir_names=dir_names)
+            self._updates.write(dirpath=dirpath)
+        self._updates.write(close_all=True)
+
+    def _open_update_states(self, dirpath, dir_names):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        For create_only_missing=2 and store='dir' or store='many' get the
+        state of the hash files with manifest in the directory, even if no
+        data file is left. Therefore the hash files and manifests of deleted
+        data files are removed (see HashFileUpdates.write).
+        This method should not be called from outside.
+
+        :param dirpath: directory
+        :param dir_names: set of the names in the directory
+        """
+        if self.create_only_missing != 2:
+            return
+        if self.store == 'dir':
+            for alg in self.algorithms:
+                hash_file_name = self._get_hash_file_name(dirpath, None, alg)
+                if os.path.basename(hash_file_name) + MANIFEST_EXTENSION \
+                        in dir_names:
+                    self._updates.get(hash_file_name)
+        elif self.store == 'many':
+            # <data file>.<alg>.pfu_manifest
+            extensions = tuple('.' + alg + MANIFEST_EXTENSION
+                               for alg in self.algorithms)
+            for name in dir_names:
+                if name.endswith(extensions):
+                    self._updates.get(os.path.join(
+                        dirpath, name[:-len(MANIFEST_EXTENSION)]))
+
+    def _create_hashes_in_directory_parallel(self, name):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Create hashes for every file in this directory using a pool of
+        self.jobs workers. The hashes are calculated in parallel, but
+        stored in the order of the directory walk. Therefore the hash files
+        are the same as created sequentially.
+        This method should not be called from outside.
+
+        :param name: name of the top directory to handle
+        """
+        if self.pool == 'process':
+            executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.jobs,
+                initializer=_init_worker,
+                initargs=(self,))
+            calculate_hashes = _worker_calculate_hashes
+        else:
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.jobs)
+            calculate_hashes = self._calculate_hashes
+        # limit the number of results waiting to be stored
+        max_pending = 4 * self.jobs
+        pending = collections.deque()
+        with executor:
+            for (dirpath, entries) in scandir_walk(name):
+                dir_names = {entry.name for entry in entries}
+                self._open_update_states(dirpath, dir_names)
+                for entry in entries:
+                    data_file_name = entry.path
+                    if self.is_hash_file(data_file_name):
+                        continue
                     self.log.debug("create hash for file \"%s\"",
-                                   os.path.join(dirpath, filename))
-                    self.create_checksum(
-                        dirpath,
-                        os.path.join(dirpath, filename))
+                                   data_file_name)
+                    hash_file_names = self._prepare_hash_files(
+                        dirpath, data_file_name,
+                        entry=entry, dir_names=dir_names)
+                    if not bool(hash_file_names):
+                        continue
+                    pending.append(
+                        (executor.submit(calculate_hashes, data_file_name,
+                                         list(hash_file_names)),
+                         data_file_name,
+                         hash_file_names))
+                    while (bool(pending) and
+                           ((len(pending) > max_pending) or
+                            pending[0][0].done())):
+                        self._store_hash_from_future(*pending.popleft())
+                        self._updates.write()
+                self._updates.write(dirpath=dirpath)
+            while bool(pending):
+                self._store_hash_from_future(*pending.popleft())
+        self._updates.write(close_all=True)
 
     def create_all(self):
         """
         :Author: Daniel Mohr
         :Email: daniel.mohr@dlr.de
-        :Date: 2017-02-25 (last change).
+        :Date: 2017-02-25, 2026-10-18 (last change).
         :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
         create (missing) checksums
@@ -276,4 +971,5 @@ class CreateChecksumsClass():
             else:
                 self.log.warning(
                     "cannot handle '%s' (e. g. not a directory)", name)
+        self.log.info('reads saved by hardlinks: %i', self.saved_reads)
         return 0  # success
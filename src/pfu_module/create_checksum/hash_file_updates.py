@@ -0,0 +1,193 @@
+"""
+Author: Daniel Mohr.
+
+Date: 2026-10-18 (last change).
+
+License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+"""
+
+import logging
+import os
+
+# own_logger:
+import pfu_module.checksum_tools  # pylint: disable=unused-import
+from pfu_module.checksum_tools import MANIFEST_EXTENSION
+from pfu_module.checksum_tools import file_stat_key
+from pfu_module.checksum_tools import read_manifest
+from pfu_module.checksum_tools import write_manifest
+
+
+class HashFileUpdates():
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Update the hash files by their manifests (create_only_missing=2).
+
+    For every opened hash file the state is stored in self.states. On
+    first use the manifest of the hash file is read. Only new or changed
+    data files are hashed (see needed). A hash file is written (see write),
+    after it is closed and no data file is pending. Hashes of data files
+    not seen are removed. If no hash is left, the hash file and its
+    manifest are removed.
+    """
+
+    def __init__(self, created):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        :param created: set of the created hash files, the written hash
+                        files are added
+        """
+        self.created = created
+        self.states = {}  # hash file name: state
+
+    def get(self, hash_file_name):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Get the state of the hash file. On first use the manifest of the
+        hash file is read.
+
+        :param hash_file_name: file name of the hash file
+
+        :return: dict describing the state of the hash file
+        """
+        if hash_file_name not in self.states:
+            self.states[hash_file_name] = {
+                'manifest': read_manifest(hash_file_name),
+                'seen': set(),  # file names of existing data files
+                'new_stats': {},  # stats of data files to hash
+                'changed': not os.path.exists(hash_file_name),
+                'pending': 0,  # number of data files to hash
+                'closed': False}  # no more data files expected
+        return self.states[hash_file_name]
+
+    def needed(self, hash_file_name, key, file_stat):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Determine if the data file is new or changed compared to the
+        manifest of the hash file.
+
+        :param hash_file_name: file name of the hash file
+        :param key: file name of the data file as used in the hash file
+        :param file_stat: result of os.stat for the data file
+
+        :return: True, if the data file has to be hashed
+        """
+        state = self.get(hash_file_name)
+        stat_key = file_stat_key(file_stat)
+        state['seen'].add(key)
+        if (key in state['manifest']) and \
+                (state['manifest'][key][0] == stat_key):
+            return False
+        state['new_stats'][key] = stat_key
+        state['pending'] += 1
+        return True
+
+    def store(self, hash_file_name, key, lines):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Store the hashes of a data file in the manifest, the hash file is
+        written later (see write).
+
+        :param hash_file_name: file name of the hash file
+        :param key: file name of the data file as used in the hash file
+        :param lines: lines of the hash file for the data file
+        """
+        state = self.states[hash_file_name]
+        state['manifest'][key] = [state['new_stats'].pop(key), lines]
+        state['changed'] = True
+
+    def stored(self, key, hash_file_names, stored):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Finish hashing of a data file. If it was not possible to hash the
+        data file, the old hashes are removed.
+
+        :param key: file name of the data file as used in the hash file
+        :param hash_file_names: dict of the file names of the hash files
+        :param stored: True, if the hashes are stored
+        """
+        for hash_file_name in hash_file_names.values():
+            state = self.states[hash_file_name]
+            state['pending'] -= 1
+            if not stored:
+                state['manifest'].pop(key, None)
+                state['new_stats'].pop(key, None)
+                state['changed'] = True
+
+    def write(self, dirpath=None, close_all=False):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        Write the hash files and manifests, which are closed and have no
+        pending data files. Hashes of deleted data files are removed. Only
+        changed hash files are written.
+
+        :param dirpath: close the hash files in this directory
+        :param close_all: if True, close all hash files
+        """
+        for hash_file_name in list(self.states):
+            state = self.states[hash_file_name]
+            if close_all or (os.path.dirname(hash_file_name) == dirpath):
+                state['closed'] = True
+            if state['closed'] and (state['pending'] == 0):
+                self._write_hash_file(hash_file_name, state)
+                del self.states[hash_file_name]
+
+    def _write_hash_file(self, hash_file_name, state):
+        """
+        :Author: Daniel Mohr
+        :Email: daniel.mohr@dlr.de
+        :Date: 2026-10-18 (last change).
+        :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        This method should not be called from outside.
+
+        :param hash_file_name: file name of the hash file
+        :param state: state of the hash file (see get)
+        """
+        log = logging.getLogger("pfu.create")
+        manifest = state['manifest']
+        for key in [key for key in manifest if key not in state['seen']]:
+            log.verboseinfo(  # pylint: disable=no-member
+                "hash file \"%s\": remove hashes of \"%s\"",
+                hash_file_name, key)
+            del manifest[key]
+            state['changed'] = True
+        if not state['changed']:
+            return
+        if bool(manifest):
+            log.debug("write hash file \"%s\"", hash_file_name)
+            write_manifest(hash_file_name, manifest)
+            self.created.add(hash_file_name)
+            return
+        for file_name in [hash_file_name,
+                          hash_file_name + MANIFEST_EXTENSION]:
+            if os.path.exists(file_name):
+                log.debug("remove \"%s\"", file_name)
+                os.remove(file_name)
@@ -1,17 +1,16 @@
 """
 Author: Daniel Mohr.
-Date: 2017-02-14, 2021-05-25 (last change).
+Date: 2017-02-14, 2021-05-25, 2026-10-18 (last change).
 License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 """
 # pylint: skip-file
 
 import datetime
+import functools
 import logging
 import os
 import platform
 import re
-import subprocess
-import time
 
 from pfu_module.replicate.tools import *
 
@@ -22,7 +21,7 @@ def replicate(args):
     """
     :Author: Daniel Mohr
     :Email: daniel.mohr@dlr.de
-    :Date: 2015-10-05, 2017-02-14, 2021-05-25 (last change).
+    :Date: 2015-10-05, 2017-02-14, 2021-05-25, 2026-10-18 (last change).
     :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
     In this function the command line parameter/command 'replicate' is handled.
@@ -43,6 +42,8 @@ def replicate(args):
         args.checksum_create_parameter = args.checksum_create_parameter[0]
     if not isinstance(args.checksum_check_parameter, str):
         args.checksum_check_parameter = args.checksum_check_parameter[0]
+    if not isinstance(args.checksum_in_process, int):
+        args.checksum_in_process = args.checksum_in_process[0]
     if not isinstance(args.checksum_check_method, int):
         args.checksum_check_method = args.checksum_check_method[0]
     if not isinstance(args.checksum_file_name, str):
@@ -68,8 +69,6 @@ def replicate(args):
         args.limit_number_of_processes_to_distinations = \
             args.limit_number_of_processes_to_distinations[
                 0]
-    if not isinstance(args.sleeptime, float):
-        args.sleeptime = args.sleeptime[0]
     if not isinstance(args.extrasleeptime, float):
         args.extrasleeptime = args.extrasleeptime[0]
     if args.use_relpath == 1:
@@ -130,6 +129,7 @@ def replicate(args):
              (args.checksum_program, args.checksum_create_parameter))
     log.info(" parameter for %s to check: %s" %
              (args.checksum_program, args.checksum_check_parameter))
+    log.info(" checksum in process: %i" % args.checksum_in_process)
     log.info(" checksum file name: %s" % args.checksum_file_name)
     log.info(" checksum log file name: %s" % args.checksum_log_file_name)
     log.info(" checksum status file name: %s" % args.checksum_status_file_name)
@@ -138,6 +138,17 @@ def replicate(args):
     log.info(" system: %s" % platform.system())
     log.info(" release: %s" % platform.release())
     log.info("")
+    if args.sleeptime is not None:
+        log.warning("the parameter -sleeptime is deprecated and ignored")
+    # commands run in process are marked by in_process
+    in_process = ""
+    if args.checksum_in_process == 1:
+        if bsd_program(args.checksum_program) is None:
+            log.error("checksum program '%s' cannot run in process " %
+                      args.checksum_program +
+                      "(possible: %s)" % ", ".join(BSD_PROGRAMS))
+            exit(1)
+        in_process = "(in process) "
     # create commands to run
     warning_creating_checksums = ""
     commands_copy1 = []
@@ -190,6 +201,7 @@ def replicate(args):
                            source + "/" + " " +
                            destination + "/"]
     commands_create_checksums = []
+    functions_create_checksums = []  # for args.checksum_in_process == 1
     if (not args.dryrun) and (args.overwrite_checksum_file == 1):
         for (dirpath, dirnames, filenames) in os.walk(args.source):
             if ((os.path.exists(
@@ -206,11 +218,14 @@ def replicate(args):
                 # sha256 sum will wait for stdin, if no files are given
                 change_dir = create_change_dir_command(dirpath)
                 commands_create_checksums += [
-                    change_dir + dirpath + " && " +
+                    in_process + change_dir + dirpath + " && " +
                     args.checksum_program + " " +
                     args.checksum_create_parameter + " " +
                     file_list + " > " +
                     args.checksum_file_name]
+                functions_create_checksums += [functools.partial(
+                    create_bsd_checksums, dirpath, sorted(filenames),
+                    args.checksum_program, args.checksum_file_name)]
         elif ((os.path.exists(
                 os.path.join(dirpath, args.checksum_file_name))) and
                 (args.overwrite_checksum_file == 2)):
@@ -236,11 +251,15 @@ def replicate(args):
             if len(file_list) > 0:  # create command
                 change_dir = create_change_dir_command(dirpath)
                 commands_create_checksums += [
-                    change_dir + dirpath + " && " +
+                    in_process + change_dir + dirpath + " && " +
                     args.checksum_program + " " +
                     args.checksum_create_parameter + " " +
                     file_list + " >> " +
                     args.checksum_file_name]
+                functions_create_checksums += [functools.partial(
+                    create_bsd_checksums, dirpath, sorted(filenames),
+                    args.checksum_program, args.checksum_file_name,
+                    append=True)]
         else:
             # do not create commands to create checksums
             stat = "WARNING: '%s' already exists in '%s'" % (
@@ -248,49 +267,67 @@ def replicate(args):
             log.info(stat)
             warning_creating_checksums += stat + "\n"
     commands_check_checksums = []
+    functions_check_checksums = []  # for args.checksum_in_process == 1
     for dest in args.destination:
         if args.checksum_check_method == 1:
             # Do not check the checksums, but instead calculate new ones.
             cmds = []
+            functions = []
             for (dirpath, dirnames, filenames) in os.walk(args.source):
                 p = os.path.join(dest, os.path.relpath(dirpath, args.source))
                 p = os.path.normpath(p)
                 file_list = create_file_list(dirpath, filenames)
                 if len(file_list) > 0:
                     change_dir = create_change_dir_command(p)
-                    cmds += [change_dir + p + " && " +
+                    cmds += [in_process + change_dir + p + " && " +
                              args.checksum_program + " " +
                              args.checksum_create_parameter + " " +
                              file_list + " > " +
                              args.checksum_file_name_destination]
+                    functions += [functools.partial(
+                        create_bsd_checksums, p, sorted(filenames),
+                        args.checksum_program,
+                        args.checksum_file_name_destination)]
             commands_check_checksums += [cmds]
+            functions_check_checksums += [functions]
         else:  # args.checksum_check_method == 0
             # Check the checksums by the program creating checksums.
             cmds = []
+            functions = []
             for (dirpath, dirnames, filenames) in os.walk(args.source):
                 p = os.path.join(dest, os.path.relpath(dirpath, args.source))
                 p = os.path.normpath(p)
                 file_list = create_file_list(dirpath, filenames)
                 if len(file_list) > 0:
                     change_dir = create_change_dir_command(p)
-                    cmds += [change_dir + p + " && " +
+                    cmds += [in_process + change_dir + p + " && " +
                              args.checksum_program + " " +
                              args.checksum_check_parameter + " " +
                              args.checksum_file_name + " " +
                              "> " + args.checksum_log_file_name + " "
                              "2> " + args.checksum_status_file_name]
+                    functions += [functools.partial(
+                        check_bsd_checksums, p, args.checksum_program,
+                        args.checksum_file_name,
+                        (args.checksum_log_file_name,
+                         args.checksum_status_file_name),
+                        quiet='--quiet' in
+                        args.checksum_check_parameter.split())]
             commands_check_checksums += [cmds]
+            functions_check_checksums += [functions]
     log.info("the following commands will be run:\n")
     for c in commands_copy1:
         log.info(" %s" % c)
     for c in commands_create_checksums:
         log.info(" %s" % c)
-    log.info(" # wait until above commands are ready")
-    for c in commands_copy2:
-        log.info(" %s" % c)
-    log.info(" # wait until above commands are ready")
-    for cc in commands_check_checksums:
-        for c in cc:  # these ones should run sequential
+    for i in range(len(args.destination)):
+        log.info(" # for '%s' wait until copying to it " %
+                 args.destination[i] + "and creating checksums are ready")
+        log.info(" %s" % commands_copy2[i])
+        log.info(" # for '%s' wait until above command is ready" %
+                 args.destination[i])
+        for c in commands_check_checksums[i]:
+            # these ones should run sequential
             log.info(" %s" % c)
     if args.dryrun:
         log.info("")
@@ -300,105 +337,46 @@ def replicate(args):
     log.info("###########")
     log.info("### run ###")
     log.info("###########\n")
-    # step 1/3 (copy + create checksum)
-    log.info(
-        "### run step 1/3 (copy with %s + create checksum with %s) ###\n" %
-        (args.copy_program1, args.checksum_program))
-    summary = ""
-    # run copy program1 and create checksums
-    create_checksums_errors = ""
-    runs = dict()
-    runs['processes'] = [None] * args.number_of_processes
-    runs['cmd'] = [None] * args.number_of_processes
-    cri = 0
-    ccc = 0
-    while ((cri < len(commands_copy1)) or
-           (ccc < len(commands_create_checksums))):
-        i = wait_for_free_slot(
-            runs['processes'], args.number_of_processes, args.sleeptime)
-        if not (runs['processes'][i] is None):
-            stat = "process '%s' terminated with %d" % (
-                runs['cmd'][i], runs['processes'][i].returncode)
-            log.info(stat)
-            summary += stat + "\n"
-            if runs['processes'][i].returncode != 0:
-                create_checksums_errors += stat + "\n"
-            runs['processes'][i] = None
-        # start subprocess
-        if cri < len(commands_copy1):
-            runs['processes'][i] = subprocess.Popen(
-                commands_copy1[cri], bufsize=-1, shell=True)
-            runs['cmd'][i] = commands_copy1[cri]
-            log.info("started '%s'" % commands_copy1[cri])
-            cri += 1
-        elif ccc < len(commands_create_checksums):
-            runs['processes'][i] = subprocess.Popen(
-                commands_create_checksums[ccc], bufsize=-1, shell=True)
-            runs['cmd'][i] = commands_create_checksums[ccc]
-            log.info("started '%s'" % commands_create_checksums[ccc])
-            ccc += 1
-    # wait until all processes are ready
-    log.info(
-        "all processes started for step 1/3 " +
-        "(copy with %s + create checksum with %s)" %
-        (args.copy_program1, args.checksum_program))
-    for i in range(args.number_of_processes):
-        if not (runs['processes'][i] is None):
-            runs['processes'][i].wait()
-            stat = "process '%s' terminated with %d" % (
-                runs['cmd'][i], runs['processes'][i].returncode)
-            log.info(stat)
-            summary += stat + "\n"
-            if runs['processes'][i].returncode != 0:
-                create_checksums_errors += stat + "\n"
-            runs['processes'][i] = None
-    time.sleep(args.extrasleeptime)
-    # run step 2/3 (copy)
-    log.info("")
-    log.info("### run step 2/3 (copy with %s) ###\n" % args.copy_program2)
-    copy_errors = ""
-    cri = 0
-    while cri < len(commands_copy2):
-        i = wait_for_free_slot(
-            runs['processes'], args.number_of_processes, args.sleeptime)
-        if not (runs['processes'][i] is None):
-            stat = "process '%s' terminated with %d" % (
-                runs['cmd'][i], runs['processes'][i].returncode)
-            log.info(stat)
-            summary += stat + "\n"
-            if runs['processes'][i].returncode != 0:
-                copy_errors += stat + "\n"
-            runs['processes'][i] = None
-        # start subprocess
-        if cri < len(commands_copy2):
-            runs['processes'][i] = subprocess.Popen(
-                commands_copy2[cri], bufsize=-1, shell=True)
-            runs['cmd'][i] = commands_copy2[cri]
-            log.info("started '%s'" % commands_copy2[cri])
-            cri += 1
-    # wait until all processes are ready
-    log.info("all processes started for step 2/3 (copy with %s)" %
-             args.copy_program2)
-    for i in range(args.number_of_processes):
-        if not (runs['processes'][i] is None):
-            runs['processes'][i].wait()
-            stat = "process '%s' terminated with %d" % (
-                runs['cmd'][i], runs['processes'][i].returncode)
-            log.info(stat)
-            summary += stat + "\n"
-            if runs['processes'][i].returncode != 0:
-                copy_errors += stat + "\n"
-            runs['processes'][i] = None
-    time.sleep(args.extrasleeptime)
-    # run step 3/3 (check checksums)
-    log.info("")
-    log.info("### run step 3/3 (check checksums with %s) ###\n" %
-             args.checksum_program)
-    summary, check_checksums_errors = run_check_checksums(
-        args, log, commands_check_checksums,
-        text="all processes started for step 3/3 (check checksums with %s)" %
-        args.checksum_program,
-        summary=summary)
+    # dependency graph of the jobs:
+    # copy with program2 to a destination waits for copy with program1 to
+    # this destination and creating checksums; checking checksums in a
+    # destination waits for copy with program2 to this destination
+    jobs = []
+    for c in commands_copy1:
+        jobs += [{'cmd': c, 'after': [], 'group': None,
+                  'step': 'create checksums'}]
+    for (c, f) in zip(commands_create_checksums,
+                      functions_create_checksums):
+        jobs += [{'cmd': c, 'after': [], 'group': None,
+                  'step': 'create checksums'}]
+        if args.checksum_in_process == 1:
+            jobs[-1]['function'] = f
+    for i in range(len(args.destination)):
+        after = [i] + list(range(
+            len(commands_copy1),
+            len(commands_copy1) + len(commands_create_checksums)))
+        jobs += [{'cmd': commands_copy2[i], 'after': after, 'group': i,
+                  'step': 'copy'}]
+        after = [len(jobs) - 1]
+        for (c, f) in zip(commands_check_checksums[i],
+                          functions_check_checksums[i]):
+            jobs += [{'cmd': c, 'after': after, 'group': i,
+                      'step': 'check'}]
+            if args.checksum_in_process == 1:
+                jobs[-1]['function'] = f
+    summary, errors = run_jobs(
+        args, log, jobs,
+        texts={'create checksums':
+               "all processes started for copy with %s + " %
+               args.copy_program1 +
+               "create checksum with %s" % args.checksum_program,
+               'copy': "all processes started for copy with %s" %
+               args.copy_program2,
+               'check': "all processes started for check checksums " +
+               "with %s" % args.checksum_program})
+    create_checksums_errors = errors.get('create checksums', "")
+    copy_errors = errors.get('copy', "")
+    check_checksums_errors = errors.get('check', "")
     # print/log summary
     log.info("")
     log.info("###############")
@@ -10,7 +10,7 @@ copyright + license
 ===================
 Author: Daniel Mohr.
 
-Date: 2017-02-14, 2021-05-25 (last change).
+Date: 2017-02-14, 2021-05-25, 2026-10-18 (last change).
 
 License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
@@ -35,9 +35,19 @@ from .check_for_none import check_for_none
 from .create_change_dir_command import create_change_dir_command
 from .create_file_list import create_file_list
 from .run_check_checksums import run_check_checksums
+from .run_jobs import run_jobs
+from .bsd_checksums import BSD_PROGRAMS
+from .bsd_checksums import bsd_program
+from .bsd_checksums import check_bsd_checksums
+from .bsd_checksums import create_bsd_checksums
 
 __all__ = ['wait_for_free_slot',
            'check_for_none',
            'create_change_dir_command',
            'create_file_list',
-           'run_check_checksums']
+           'run_check_checksums',
+           'run_jobs',
+           'BSD_PROGRAMS',
+           'bsd_program',
+           'check_bsd_checksums',
+           'create_bsd_checksums']
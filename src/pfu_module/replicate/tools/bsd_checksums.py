@@ -0,0 +1,303 @@
+"""
+Author: Daniel Mohr.
+Date: 2026-10-18 (last change).
+License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+Create and check checksum files in the BSD-style of the coreutils (e. g.
+"sha256sum --tag") without running an external program.
+"""
+
+import hashlib
+import logging
+import os
+import re
+
+from pfu_module.checksum_tools import read_data_from_file
+
+# program of the coreutils: (algorithm in hashlib, tag in the BSD-style)
+BSD_PROGRAMS = {'md5sum': ('md5', 'MD5'),
+                'sha1sum': ('sha1', 'SHA1'),
+                'sha224sum': ('sha224', 'SHA224'),
+                'sha256sum': ('sha256', 'SHA256'),
+                'sha384sum': ('sha384', 'SHA384'),
+                'sha512sum': ('sha512', 'SHA512'),
+                'b2sum': ('blake2b', 'BLAKE2b')}
+# tag in the BSD-style: algorithm in hashlib
+BSD_TAGS = {tag: alg for (alg, tag) in BSD_PROGRAMS.values()}
+BSD_TAGS['BLAKE2b-512'] = 'blake2b'
+
+_BSD_LINE = re.compile(
+    r"(?P<escaped>\\?)(?P<tag>[0-9A-Za-z-]+) \((?P<filename>.*)\) = "
+    r"(?P<hash>[0-9a-fA-F]+)$")
+_ESCAPES = {'\\': '\\\\', '\n': '\\n', '\r': '\\r'}
+_UNESCAPES = re.compile(r"\\(.)")
+_BUF_SIZE = 524288  # read this amount of Bytes at once
+
+
+def bsd_program(program):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    :param program: checksum program, e. g. "sha256sum" or "/usr/bin/b2sum"
+
+    :return: tuple of the algorithm and the tag or None, if the program is
+             not known
+    """
+    return BSD_PROGRAMS.get(os.path.basename(program))
+
+
+def _escape(name, needs_escape='\\\n\r'):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    This function should not be called from outside.
+
+    :param name: file name
+    :param needs_escape: the file name is escaped, if it contains one of
+                         these characters
+
+    :return: tuple of the prefix of the line ("\\" if escaped or "") and
+             the escaped file name (as the coreutils do)
+    """
+    if any(char in name for char in needs_escape):
+        return ('\\', ''.join(_ESCAPES.get(char, char) for char in name))
+    return ('', name)
+
+
+def _bsd_line(tag, name, hash_string):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    This function should not be called from outside.
+
+    :param tag: tag in the BSD-style
+    :param name: file name
+    :param hash_string: hash as lower case hex string
+
+    :return: line (without line break) of a checksum file in the BSD-style
+    """
+    (prefix, escaped_name) = _escape(name)
+    return f"{prefix}{tag} ({escaped_name}) = {hash_string}"
+
+
+def _write_lines(file_name, lines, mode='w'):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    This function should not be called from outside.
+
+    :param file_name: file to write
+    :param lines: lines (without line break) to write
+    :param mode: 'w' to write or 'a' to append
+    """
+    with open(file_name, mode, encoding='utf-8', errors='surrogateescape',
+              newline='\n') as out:
+        out.writelines(line + '\n' for line in lines)
+
+
+def _hash_file(file_name, algorithm, buf):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    This function should not be called from outside.
+
+    :param file_name: file to hash
+    :param algorithm: algorithm in hashlib
+    :param buf: buffer to read the data into
+
+    :return: hash as lower case hex string
+    """
+    hash_object = hashlib.new(algorithm)
+    with open(file_name, 'rb') as data_file:
+        read_data_from_file(len(buf), data_file,
+                            os.fstat(data_file.fileno()).st_size,
+                            [hash_object], buf=buf)
+    return hash_object.hexdigest()
+
+
+def create_bsd_checksums(dirpath, filenames, program, checksum_file_name,
+                         append=False):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Create the checksum file checksum_file_name in dirpath as
+    "cd dirpath && program --tag -- filenames > checksum_file_name" does.
+
+    :param dirpath: directory of the data files and the checksum file
+    :param filenames: names of the data files in dirpath
+    :param program: checksum program (see BSD_PROGRAMS)
+    :param checksum_file_name: name of the checksum file
+    :param append: If True, the checksums are appended to the checksum file.
+
+    :return: 0 on success, 1 if a data file was not readable
+    """
+    log = logging.getLogger('pfu.replicate')
+    (algorithm, tag) = bsd_program(program)
+    buf = bytearray(_BUF_SIZE)
+    lines = []
+    returncode = 0
+    for name in filenames:
+        try:
+            hash_string = _hash_file(
+                os.path.join(dirpath, name), algorithm, buf)
+        except OSError as err:
+            log.warning("%s: %s: %s", os.path.basename(program),
+                        os.path.join(dirpath, name), err.strerror)
+            returncode = 1
+            continue
+        lines.append(_bsd_line(tag, name, hash_string))
+    _write_lines(os.path.join(dirpath, checksum_file_name), lines,
+                 mode='a' if append else 'w')
+    return returncode
+
+
+def _check_bsd_line(dirpath, line, buf, number, quiet):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Check one line of a checksum file.
+    This function should not be called from outside.
+
+    :param dirpath: directory of the checksum file
+    :param line: line of the checksum file (without line break)
+    :param buf: buffer to read the data into
+    :param number: dict of the counters (see check_bsd_checksums), which
+                   is updated
+    :param quiet: If True, no result is given for a matching checksum.
+
+    :return: tuple of the result for the log file (or None) and the
+             warning (or None)
+    """
+    sres = _BSD_LINE.match(line)
+    if (not sres) or (sres.group('tag') not in BSD_TAGS):
+        number['improperly formatted'] += 1
+        return (None, None)
+    number['properly formatted'] += 1
+    name = sres.group('filename')
+    if sres.group('escaped'):
+        name = _UNESCAPES.sub(
+            lambda m: {'n': '\n', 'r': '\r'}.get(m.group(1), m.group(1)),
+            name)
+    # the coreutils do not escape a backslash alone in the results
+    (prefix, escaped_name) = _escape(name, needs_escape='\n\r')
+    try:
+        hash_string = _hash_file(os.path.join(dirpath, name),
+                                 BSD_TAGS[sres.group('tag')], buf)
+    except OSError as err:
+        number['not readable'] += 1
+        return (f"{prefix}{escaped_name}: FAILED open or read",
+                f"{name}: {err.strerror}")
+    if hash_string == sres.group('hash').lower():
+        if quiet:
+            return (None, None)
+        return (f"{prefix}{escaped_name}: OK", None)
+    number['not matching'] += 1
+    return (f"{prefix}{escaped_name}: FAILED", None)
+
+
+def _summary_warnings(program, checksum_file_name, number):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    This function should not be called from outside.
+
+    :param program: name of the checksum program
+    :param checksum_file_name: name of the checksum file
+    :param number: dict of the counters (see check_bsd_checksums)
+
+    :return: list of the warnings at the end of the check
+    """
+    if number['properly formatted'] == 0:
+        return [f"{program}: {checksum_file_name}: no properly formatted "
+                "checksum lines found"]
+    warnings = []
+    for (key, text) in [
+            ('improperly formatted', "line{s} {are} improperly formatted"),
+            ('not readable', "listed file{s} could not be read"),
+            ('not matching', "computed checksum{s} did NOT match")]:
+        if number[key] > 0:
+            text = text.format(s='s' if number[key] > 1 else '',
+                               are='are' if number[key] > 1 else 'is')
+            warnings.append(f"{program}: WARNING: {number[key]} {text}")
+    return warnings
+
+
+def check_bsd_checksums(dirpath, program, checksum_file_name,
+                        output_file_names, quiet=False):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Check the checksum file checksum_file_name in dirpath as
+    "cd dirpath && program --check checksum_file_name > log_file_name
+    2> status_file_name" does.
+
+    :param dirpath: directory of the checksum file
+    :param program: checksum program (see BSD_PROGRAMS), only used in the
+                    messages
+    :param checksum_file_name: name of the checksum file
+    :param output_file_names: tuple of the name of the file for the result
+                              of every file (log_file_name) and of the name
+                              of the file for the warnings
+                              (status_file_name)
+    :param quiet: If True, the files with matching checksum are not listed.
+
+    :return: 0 if all checksums matched, otherwise 1
+    """
+    program = os.path.basename(program)
+    buf = bytearray(_BUF_SIZE)
+    results = []
+    warnings = []
+    number = {'improperly formatted': 0, 'not readable': 0,
+              'not matching': 0, 'properly formatted': 0}
+    try:
+        with open(os.path.join(dirpath, checksum_file_name),
+                  encoding='utf-8', errors='surrogateescape',
+                  newline='\n') as checksum_file:
+            lines = checksum_file.read().split('\n')
+        if lines[-1] == '':
+            lines.pop()
+    except OSError as err:
+        lines = None
+        warnings.append(f"{program}: {checksum_file_name}: {err.strerror}")
+    for line in lines or []:
+        (result, warning) = _check_bsd_line(dirpath, line, buf, number,
+                                            quiet)
+        if result is not None:
+            results.append(result)
+        if warning is not None:
+            warnings.append(f"{program}: {warning}")
+    if lines is not None:
+        warnings += _summary_warnings(program, checksum_file_name, number)
+    _write_lines(os.path.join(dirpath, output_file_names[0]), results)
+    _write_lines(os.path.join(dirpath, output_file_names[1]), warnings)
+    if ((lines is None) or (number['properly formatted'] == 0) or
+            (number['not readable'] > 0) or (number['not matching'] > 0)):
+        return 1
+    return 0
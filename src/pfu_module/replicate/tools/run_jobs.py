@@ -0,0 +1,189 @@
+"""
+Author: Daniel Mohr.
+Date: 2026-10-18 (last change).
+License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+"""
+
+import concurrent.futures
+import subprocess
+import time
+
+
+def _run_job(job):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    This function should not be called from outside.
+
+    :param job: dict of the job (see run_jobs)
+
+    :return: return code of the job
+    """
+    if job.get('function') is not None:
+        return job['function']()
+    return subprocess.run(job['cmd'], bufsize=-1, shell=True,
+                          check=False).returncode
+
+
+def _start_jobs(args, log, jobs, state, executor):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Start all startable jobs (see run_jobs) in the given order.
+    This function should not be called from outside.
+
+    :param args: parameters (see run_jobs)
+    :param log: logger
+    :param jobs: list of dicts of the jobs (see run_jobs)
+    :param state: dict of the state of run_jobs, which is updated
+    :param executor: executor to run the jobs
+
+    :return: None or the next time a waiting job gets startable
+    """
+    now = time.time()
+    deadline = None
+    for j in list(state['not_started']):
+        if len(state['running']) >= args.number_of_processes:
+            break
+        job = jobs[j]
+        if any(state['terminated'][k] is None for k in job['after']):
+            continue
+        startable = max((state['terminated'][k] for k in job['after']),
+                        default=now - args.extrasleeptime) + \
+            args.extrasleeptime
+        if startable > now:
+            if (deadline is None) or (startable < deadline):
+                deadline = startable
+            continue
+        if ((args.limit_number_of_processes_to_distinations != 0) and
+                (job['group'] is not None) and
+                (job['group'] in state['running_groups'])):
+            continue
+        state['running'][executor.submit(_run_job, job)] = j
+        if job['group'] is not None:
+            state['running_groups'].add(job['group'])
+        state['not_started'].remove(j)
+        log.info("started '%s'", job['cmd'])
+        state['not_started_steps'][job['step']] -= 1
+        if ((state['not_started_steps'][job['step']] == 0) and
+                (job['step'] in state['texts'])):
+            log.info(state['texts'][job['step']])
+    return deadline
+
+
+def _reap_jobs(log, jobs, state, done):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Handle the terminated jobs.
+    This function should not be called from outside.
+
+    An exception of a job (e. g. of its function) is logged and handled as
+    return code 1.
+
+    :param log: logger
+    :param jobs: list of dicts of the jobs (see run_jobs)
+    :param state: dict of the state of run_jobs, which is updated
+    :param done: futures of the terminated jobs
+
+    :return: text for the summary
+    """
+    summary = ""
+    for future in done:
+        j = state['running'].pop(future)
+        job = jobs[j]
+        try:
+            returncode = future.result()
+        except Exception as err:  # pylint: disable=broad-except
+            log.error("'%s' raised %s: %s", job['cmd'], type(err).__name__,
+                      err)
+            returncode = 1
+        stat = f"process '{job['cmd']}' terminated with {returncode}"
+        log.info(stat)
+        summary += stat + "\n"
+        if returncode != 0:
+            state['errors'][job['step']] += stat + "\n"
+        state['terminated'][j] = time.time()
+        state['running_groups'].discard(job['group'])
+    return summary
+
+
+def run_jobs(args, log, jobs, texts=None, summary=""):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    Run the jobs as a dependency graph with args.number_of_processes
+    jobs in parallel.
+
+    Every job runs in a thread of a pool, which runs the shell command
+    and waits for its termination or calls the function of the job
+    in-process. The pool is waited for the first terminated job, therefore
+    a new job is started as soon as a job terminated.
+
+    A job is started, if all jobs it depends on terminated (independent of
+    their return codes) and args.extrasleeptime seconds passed since then.
+    If args.limit_number_of_processes_to_distinations is not 0, at most
+    one job of a group is running at a time. The jobs are started in the
+    given order as far as possible.
+    An exception of a job (e. g. of its function) is logged and handled as
+    return code 1.
+
+    :param args: parameters (number_of_processes,
+                 limit_number_of_processes_to_distinations,
+                 extrasleeptime)
+    :param log: logger
+    :param jobs: list of dicts with the keys 'cmd' (shell command),
+                 'after' (list of the indices of the jobs to wait for),
+                 'group' (None or the group of the job, e. g. the index of
+                 the destination) and 'step' (name of the step for the
+                 errors); the optional key 'function' is a function
+                 returning the return code, which is called instead of
+                 running 'cmd' (then 'cmd' is only used in the messages)
+    :param texts: dict of step: text to log, if all jobs of the step are
+                  started
+    :param summary: text to extend by the terminated processes
+
+    :return: tuple of the summary and the dict of step: errors
+    """
+    # not_started: indices of the jobs not started yet
+    # not_started_steps: step: number of the jobs not started yet
+    # terminated: time of the termination of every job (or None)
+    # running: future: index of the job
+    # running_groups: groups of the running jobs
+    state = {'errors': {}, 'not_started': list(range(len(jobs))),
+             'not_started_steps': {}, 'terminated': [None] * len(jobs),
+             'running': {}, 'running_groups': set(), 'texts': texts or {}}
+    for job in jobs:
+        state['errors'][job['step']] = ""
+        state['not_started_steps'][job['step']] = \
+            state['not_started_steps'].get(job['step'], 0) + 1
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=args.number_of_processes) as executor:
+        while True:
+            deadline = _start_jobs(args, log, jobs, state, executor)
+            if not bool(state['running']):
+                if deadline is None:
+                    break  # all jobs are done
+                time.sleep(max(0.0, deadline - time.time()))
+                continue
+            # wait for a terminated job
+            timeout = None
+            if deadline is not None:
+                timeout = max(0.0, deadline - time.time())
+            (done, _) = concurrent.futures.wait(
+                state['running'], timeout=timeout,
+                return_when=concurrent.futures.FIRST_COMPLETED)
+            summary += _reap_jobs(log, jobs, state, done)
+    return summary, state['errors']
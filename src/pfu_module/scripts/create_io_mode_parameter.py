@@ -0,0 +1,35 @@
+"""
+Author: Daniel Mohr.
+Date: 2026-10-18 (last change).
+License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+"""
+
+from pfu_module.checksum_tools import IO_MODES
+
+
+def create_io_mode_parameter(parser):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+    """
+    parser.add_argument(
+        '-io_mode',
+        nargs=1,
+        default=['buffered'],
+        choices=IO_MODES,
+        type=str,
+        required=False,
+        dest='io_mode',
+        help='Set the usage of the page cache for reading the data files. ' +
+        'Set to "buffered" means normal reading. ' +
+        'Set to "sequential-dontneed" means the kernel is advised to read ' +
+        'ahead and to drop the data read from the page cache ' +
+        '(posix_fadvise). Therefore other data in the page cache is not ' +
+        'evicted. ' +
+        'Set to "direct" means the page cache is bypassed (O_DIRECT) and ' +
+        'the data is read from the storage (e. g. to check a copy). ' +
+        'If a mode is not available, the next simpler mode is used. ' +
+        'default: buffered',
+        metavar='m')
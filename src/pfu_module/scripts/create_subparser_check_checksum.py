@@ -1,23 +1,55 @@
 """
 Author: Daniel Mohr.
-Date: 2017-03-01, 2022-05-30 (last change).
+Date: 2017-03-01, 2022-05-30, 2026-10-18 (last change).
 License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 """
 
 import argparse
 
 import pfu_module.check_checksum
+from pfu_module.checksum_tools import HASH_FUNCTIONS
 
 from .create_common_parameter import create_common_parameter
+from .create_io_mode_parameter import create_io_mode_parameter
+from .create_subparser_create_checksum import check_jobs
 
-__date__ = "2022-05-30"
+
+def check_fraction(value):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+    """
+    fvalue = float(value)
+    if not 0 < fvalue <= 1:
+        raise argparse.ArgumentTypeError(
+            f"{value} is an invalid fraction (0 < f <= 1)")
+    return fvalue
+
+
+def check_positive(value):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+    """
+    ivalue = int(value)
+    if ivalue < 1:
+        raise argparse.ArgumentTypeError(
+            f"{value} is an invalid positive int value")
+    return ivalue
+
+
+__date__ = "2026-10-18"
 
 
 def check_checksum(args):
     """
     :Author: Daniel Mohr
     :Email: daniel.mohr@dlr.de
-    :Date: 2017-02-13 (last change).
+    :Date: 2017-02-13, 2026-10-18 (last change).
     :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
     This function should check checksums.
@@ -30,7 +62,21 @@ def check_checksum(args):
         hash_extension=args.hash_extension,
         ignore_extension=args.ignore_extension,
         buf_size=args.buf_size[0],
-        level=args.loglevel[0])
+        level=args.loglevel[0],
+        use_mmap=args.use_mmap[0],
+        io_mode=args.io_mode[0],
+        jobs=args.jobs[0],
+        stream=args.stream[0],
+        index=args.index[0],
+        sample=args.sample[0],
+        sample_bytes=args.sample_bytes[0],
+        seed=args.seed[0],
+        ledger=args.ledger[0],
+        reverify_days=args.reverify_days[0],
+        hash_files=args.hash_files,
+        list_data_files=args.list_data_files[0],
+        jsonl=args.jsonl[0],
+        repair=args.repair[0])
     return c.check_all()
 
 
@@ -38,7 +84,7 @@ def create_subparser_check_checksum(subparsers):
     """
     :Author: Daniel Mohr
     :Email: daniel.mohr@dlr.de
-    :Date: 2017-03-01, 2022-05-30 (last change).
+    :Date: 2017-03-01, 2022-05-30, 2026-10-18 (last change).
     :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
     """
     # pylint: disable=line-too-long
@@ -50,7 +96,20 @@ def create_subparser_check_checksum(subparsers):
     myposthelp += " pfu check_checksum -d . -loglevel 15 -logfile output.log\n"
     myposthelp += " pfu check_checksum -d . -loglevel 15 "
     myposthelp += "-i \"~\" .tmp .bak .md5\n"
-    myposthelp += " pfu check_checksum -directory . -loglevel 20"
+    myposthelp += " pfu check_checksum -directory . -loglevel 20\n"
+    myposthelp += " pfu check_checksum -directory . -jobs 8\n"
+    myposthelp += " pfu check_checksum -directory . -stream 1\n"
+    myposthelp += " pfu check_checksum -directory . -index ~/archive.pfuidx\n"
+    myposthelp += " pfu check_checksum -directory . -sample 0.01 -seed 42\n"
+    myposthelp += " pfu check_checksum -directory . -sample_bytes 1000000000\n"
+    myposthelp += " pfu check_checksum -directory . -ledger ~/archive.ledger "
+    myposthelp += "-reverify_days 30\n"
+    myposthelp += " pfu check_checksum -hash_file .checksum.sha512\n"
+    myposthelp += " pfu check_checksum -hash_file a/.checksum.sha512 "
+    myposthelp += "b/.checksum.sha512 -list_data_files 1\n"
+    myposthelp += " pfu check_checksum -directory . -jsonl results.jsonl\n"
+    myposthelp += " pfu check_checksum -directory archive "
+    myposthelp += "-repair /mnt/replica/archive"
     parser = subparsers.add_parser(
         'check_checksum',
         description=myprehelp,
@@ -59,23 +118,36 @@ def create_subparser_check_checksum(subparsers):
         "GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.\n\n" +
         myposthelp,
         formatter_class=argparse.RawDescriptionHelpFormatter)
-    parser.add_argument(
+    what = parser.add_mutually_exclusive_group(required=True)
+    what.add_argument(
         '-directory',
         nargs="+",
-        default=[""],
+        default=None,
         type=str,
-        required=True,
         dest='directories',
         help='Check hashes for this directory tree or these directory trees.' +
         ' Symbolic links in given directories are ignored. ' +
         'All hash files and data files have to be in this directory tree or ' +
         'these directory trees.',
         metavar='dir')
+    what.add_argument(
+        '-hash_file',
+        nargs="+",
+        default=None,
+        type=str,
+        dest='hash_files',
+        help='Check the data files referenced by this hash file or these ' +
+        'hash files. No directory is listed, only the referenced data ' +
+        'files are accessed. Missing data files are reported as hash ' +
+        'without data file. Data files without hash are not found ' +
+        '(see -list_data_files).',
+        metavar='f')
     # pylint: disable=anomalous-backslash-in-string
     parser.add_argument(
         '-hash_extension',
         nargs="+",
-        default=[".md5", ".sha256", ".sha512", ".checksum", ".sha1"],
+        default=(['.' + alg for alg in HASH_FUNCTIONS] +
+                 [".checksum", ".sha1"]),
         type=str,
         dest='hash_extension',
         help='Files with the given extension(s) are interpreted as ' +
@@ -83,15 +155,18 @@ def create_subparser_check_checksum(subparsers):
         'r"(?P<hash>[0-9a-zA-Z/+=]+) [ \\*]{1}(?P<filename>.+) ' +  # noqa
         '\\(bytes (?P<start>[0-9]+) - (?P<stop>[0-9]+)\\)$", ' +  # noqa
         'r"(?P<hash>[0-9a-zA-Z/+=]+) [ \\*]{1}(?P<filename>.+)$" or ' +  # noqa
-        'r"(?P<type>MD5|SHA256|SHA512|SHA1|SHA224|SHA384)[ ]{0,1}' +  # noqa
+        'r"(?P<type>MD5|SHA256|SHA512|SHA1|SHA224|SHA384|' +
+        'SHA3-224|SHA3-256|SHA3-384|SHA3-512|' +
+        'BLAKE2b-512|BLAKE2s-256|BLAKE2b|BLAKE2s)[ ]{0,1}' +  # noqa
         '\\((?P<filename>.+)\\)[ ]{0,1}= ' +
         '(?P<hash>[0-9a-zA-Z/+=]+)$". ' +  # noqa
         'In the latter case base16 encoding is assumed. ' +
         'The hash types sha1, sha224 and sha384 are only interpreted/used ' +
-        'for the BSD-style. default: .md5 .sha256 .sha512 .checksum .sha1',
+        'for the BSD-style. default: ' +
+        ' '.join('.' + alg for alg in HASH_FUNCTIONS) + ' .checksum .sha1',
         metavar='ext')
     parser.add_argument(
-        '-ignore_extension',
+        '-ignore_extension', '-i',
         nargs="+",
         default=["~", ".tmp", ".bak"],
         type=str,
@@ -111,5 +186,160 @@ def create_subparser_check_checksum(subparsers):
         '(e. g. 64 Bytes for md5, 64 Bytes for sha256, ' +
         '128 Bytes for sha512). default (512 kB): 524288',
         metavar='i')
+    parser.add_argument(
+        '-use_mmap',
+        nargs=1,
+        default=[0],
+        choices=[0, 1],
+        type=int,
+        required=False,
+        dest='use_mmap',
+        help='If set to 1 files larger than buf_size are mapped to memory ' +
+        '(mmap) instead of reading them into a buffer. default: 0',
+        metavar='n')
+    parser.add_argument(
+        '-jobs',
+        nargs=1,
+        default=[1],
+        type=check_jobs,
+        required=False,
+        dest='jobs',
+        help='Number of files checked in parallel. ' +
+        'If set to 0 the number of CPUs is used. ' +
+        'The largest files are checked first. default: 1',
+        metavar='n')
+    parser.add_argument(
+        '-stream',
+        nargs=1,
+        default=[0],
+        choices=[0, 1],
+        type=int,
+        required=False,
+        dest='stream',
+        help='If set to 1 the directory tree is checked one directory ' +
+        'after the other. The hash files of a directory are read and the ' +
+        'data files are checked before the next directory is handled. ' +
+        'Therefore the used memory is bounded by the size of a directory ' +
+        'and not by the size of the tree. Hash files have to describe ' +
+        'only files in its directory or its subdirectories. default: 0',
+        metavar='n')
+    parser.add_argument(
+        '-index',
+        nargs=1,
+        default=[None],
+        type=str,
+        required=False,
+        dest='index',
+        help='Store the parsed hash files in this file. ' +
+        'A hash file is only parsed again, if its size or modification ' +
+        'time changed. The file should not be in the checked directory ' +
+        'tree (json). An index not readable or inconsistent is handled ' +
+        'as empty. default: no index',
+        metavar='f')
+    parser.add_argument(
+        '-sample',
+        nargs=1,
+        default=[None],
+        type=check_fraction,
+        required=False,
+        dest='sample',
+        help='Only check a random sample of the chunks: ' +
+        'Every chunk is checked with this probability. Therefore about ' +
+        'this fraction of the Bytes in chunks is read. ' +
+        'A confidence estimate for the fraction of corrupt chunks is ' +
+        'given. Files without hashes of chunks are not checked. ' +
+        'default: check everything',
+        metavar='f')
+    parser.add_argument(
+        '-sample_bytes',
+        nargs=1,
+        default=[None],
+        type=check_positive,
+        required=False,
+        dest='sample_bytes',
+        help='Only check a random sample of the chunks with about this ' +
+        'amount of Bytes (see -sample). If -sample is also given, ' +
+        'the smaller sample is used. default: check everything',
+        metavar='n')
+    parser.add_argument(
+        '-seed',
+        nargs=1,
+        default=[None],
+        type=int,
+        required=False,
+        dest='seed',
+        help='Seed for the random sample (see -sample). ' +
+        'The used seed is logged. default: a random seed',
+        metavar='n')
+    parser.add_argument(
+        '-ledger',
+        nargs=1,
+        default=[None],
+        type=str,
+        required=False,
+        dest='ledger',
+        help='Store the verified data files (size, modification time, ' +
+        'inode, change time and time of the verification) in this file. ' +
+        'Only the data files due are verified (see -reverify_days). ' +
+        'Changed data files are always verified. The file should not be ' +
+        'in the checked directory tree. default: verify every data file',
+        metavar='f')
+    parser.add_argument(
+        '-reverify_days',
+        nargs=1,
+        default=[30],
+        type=check_positive,
+        required=False,
+        dest='reverify_days',
+        help='Verify every data file at least every n days ' +
+        '(only used with -ledger). A run verifies the overdue data files, ' +
+        'but at least the fraction of all data files given by the time ' +
+        'since the last run divided by n days. Therefore the work is ' +
+        'spread over the runs. default: 30',
+        metavar='n')
+    parser.add_argument(
+        '-list_data_files',
+        nargs=1,
+        default=[0],
+        choices=[0, 1],
+        type=int,
+        required=False,
+        dest='list_data_files',
+        help='If set to 1 and -hash_file is given, the directory trees of ' +
+        'the hash files are listed to find data files without hash. ' +
+        'default: 0',
+        metavar='n')
+    parser.add_argument(
+        '-jsonl',
+        nargs=1,
+        default=[None],
+        type=str,
+        required=False,
+        dest='jsonl',
+        help='Write a record for every file to this file as JSON lines ' +
+        '("-" for stdout). A record has the keys "file" and "status" ' +
+        '("ok", "bad", "repaired", "no hash", "missing", "ignored", ' +
+        '"not handled" or "skipped") and for checked data files also ' +
+        '"size", "hashes", "chunk_hashes", "bytes_read", "seconds" and ' +
+        '"bad_chunks" ' +
+        '(ranges [start, stop] of not matching chunks). ' +
+        'default: no records',
+        metavar='f')
+    parser.add_argument(
+        '-repair',
+        nargs=1,
+        default=[None],
+        type=str,
+        required=False,
+        dest='repair',
+        help='Repair data files with not matching hashes of chunks from ' +
+        'the replica in this directory. The replica of a data file has ' +
+        'the same path relative to this directory as the data file ' +
+        'relative to the checked directory tree (or the working directory ' +
+        'for -hash_file). Only the ranges of the not matching chunks are ' +
+        'read from the replica and only if these match the hashes of the ' +
+        'chunks, they are written. default: no repair',
+        metavar='dir')
+    create_io_mode_parameter(parser)
     create_common_parameter(parser)
     parser.set_defaults(func=check_checksum)
@@ -1,23 +1,25 @@
 """
 Author: Daniel Mohr.
-Date: 2017-02-25 (last change).
+Date: 2017-02-25, 2026-10-18 (last change).
 License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 """
 
 import argparse
 
 import pfu_module.create_checksum
+from pfu_module.checksum_tools import HASH_FUNCTIONS
 
 from .create_common_parameter import create_common_parameter
+from .create_io_mode_parameter import create_io_mode_parameter
 
-__date__ = "2017-02-13"
+__date__ = "2026-10-18"
 
 
 def create_checksum(args):
     """
     :Author: Daniel Mohr
     :Email: daniel.mohr@dlr.de
-    :Date: 2017-02-13 (last change).
+    :Date: 2017-02-13, 2026-10-18 (last change).
     :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
     This function should create (missing) checksums.
@@ -27,7 +29,7 @@ def create_checksum(args):
     # pylint: disable=invalid-name
     c = pfu_module.create_checksum.CreateChecksumsClass(
         directories=args.directories,
-        algorithm=args.algorithm[0],
+        algorithm=args.algorithm,
         coding=args.coding[0],
         store=args.store[0],
         ignore=args.ignore,
@@ -35,7 +37,13 @@ def create_checksum(args):
         chunk_size=args.chunk_size[0],
         create_only_missing=args.create_only_missing[0],
         level=args.loglevel[0],
-        hash_file_prefix=args.hash_file_prefix[0])
+        hash_file_prefix=args.hash_file_prefix[0],
+        jobs=args.jobs[0],
+        pool=args.pool[0],
+        chunk_jobs=args.chunk_jobs[0],
+        use_mmap=args.use_mmap[0],
+        io_mode=args.io_mode[0],
+        security_floor=args.security_floor[0])
     return c.create_all()
 
 
@@ -59,11 +67,39 @@ def check_chunk_size(value):
     return ivalue
 
 
+def check_jobs(value):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+    """
+    ivalue = int(value)
+    if ivalue < 0:
+        raise argparse.ArgumentTypeError(
+            f"{value} is an invalid non-negative int value")
+    return ivalue
+
+
+def check_chunk_jobs(value):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18 (last change).
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+    """
+    ivalue = int(value)
+    if ivalue < 1:
+        raise argparse.ArgumentTypeError(
+            f"{value} is an invalid positive int value")
+    return ivalue
+
+
 def create_subparser_create_checksum(subparsers):
     """
     :Author: Daniel Mohr
     :Email: daniel.mohr@dlr.de
-    :Date: 2017-02-25 (last change).
+    :Date: 2017-02-25, 2026-10-18 (last change).
     :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
     """
     # pylint: disable=line-too-long
@@ -73,7 +109,12 @@ def create_subparser_create_checksum(subparsers):
         "Command line parameters can be shortened, as far as they are unique."
     myposthelp = "Example:\n\n"
     myposthelp += " pfu create_checksum -d .\n"
-    myposthelp += " pfu create_checksum -d . -logfile l -fileloglevel 15"
+    myposthelp += " pfu create_checksum -d . -logfile l -fileloglevel 15\n"
+    myposthelp += " pfu create_checksum -d . -create_only_missing 2\n"
+    myposthelp += " pfu create_checksum -d . -algorithm md5 sha512\n"
+    myposthelp += " pfu create_checksum -d . -algorithm auto\n"
+    myposthelp += " pfu create_checksum -d . -jobs 8 -pool process\n"
+    myposthelp += " pfu create_checksum -d . -chunk_jobs 8"
     parser_create = subparsers.add_parser(
         'create_checksum',
         description=help_create,
@@ -94,14 +135,19 @@ def create_subparser_create_checksum(subparsers):
         metavar='dir')
     parser_create.add_argument(
         '-algorithm',
-        nargs=1,
+        nargs="+",
         default=['sha512'],
-        choices=['md5', 'sha256', 'sha512'],
+        choices=list(HASH_FUNCTIONS) + ['auto'],
         type=str,
         required=False,
         dest='algorithm',
-        help='Set the algorithm used to calculate the hashes. ' +
-        'Possible values are: md5, sha256, sha512. default: sha512',
+        help='Set the algorithm(s) used to calculate the hashes. ' +
+        'Possible values are: ' + ', '.join(HASH_FUNCTIONS) + ', auto. ' +
+        'The algorithm auto is the fastest algorithm on this cpu ' +
+        'with at least the security given by -security_floor. ' +
+        'If more than one algorithm is given, every file is read only ' +
+        'once and the hashes of each algorithm are stored in its own ' +
+        'file. default: sha512',
         metavar='a')
     parser_create.add_argument(
         '-coding',
@@ -131,14 +177,26 @@ def create_subparser_create_checksum(subparsers):
         'means store the hashes in a file for every data file. default: dir',
         metavar='p')
     parser_create.add_argument(
-        '-ignore',
+        '-ignore', '-i',
         nargs="+",
-        default=[".md5", ".sha256", ".sha512"],
+        default=['.' + alg for alg in HASH_FUNCTIONS],
         type=str,
         dest='ignore',
         help='Files with the given extension(s) are ignored ' +
-        '(interpreted as hash files). default: .md5 .sha256 .sha512',
+        '(interpreted as hash files). default: ' +
+        ' '.join('.' + alg for alg in HASH_FUNCTIONS),
         metavar='ext')
+    parser_create.add_argument(
+        '-security_floor',
+        nargs=1,
+        default=[128],
+        type=int,
+        required=False,
+        dest='security_floor',
+        help='Set the minimal security against collisions in bits for the ' +
+        'algorithm auto (e. g. sha256: 128, sha512: 256, md5: 0). ' +
+        'default: 128',
+        metavar='n')
     parser_create.add_argument(
         '-buf_size',
         nargs=1,
@@ -166,13 +224,17 @@ def create_subparser_create_checksum(subparsers):
         '-create_only_missing',
         nargs=1,
         default=[1],
-        choices=[0, 1],
+        choices=[0, 1, 2],
         type=int,
         required=False,
         dest='create_only_missing',
         help='If set to 1 only missing checksums are created. ' +
         'A checksum is missing, if the expected file from store is ' +
         'not available. If set to 0 hash files are overwritten if exists. ' +
+        'If set to 2 the hash files are updated: only new or changed ' +
+        '(size, modification time or inode) files are hashed and hashes ' +
+        'of deleted files are removed. Therefore a manifest ' +
+        '(extension .pfu_manifest) is stored beside every hash file. ' +
         'default: 1',
         metavar='n')
     parser_create.add_argument(
@@ -184,5 +246,56 @@ def create_subparser_create_checksum(subparsers):
         dest='hash_file_prefix',
         help='Set the hash file prefix. default: .checksum',
         metavar='f')
+    parser_create.add_argument(
+        '-jobs',
+        nargs=1,
+        default=[1],
+        type=check_jobs,
+        required=False,
+        dest='jobs',
+        help='Number of files hashed in parallel. ' +
+        'If set to 0 the number of CPUs is used. ' +
+        'The created hash files are the same as for 1. default: 1',
+        metavar='n')
+    parser_create.add_argument(
+        '-pool',
+        nargs=1,
+        default=['thread'],
+        choices=['thread', 'process'],
+        type=str,
+        required=False,
+        dest='pool',
+        help='Set the kind of workers used for "-jobs" greater than 1. ' +
+        'Set to "thread" means a pool of threads (good for large files). ' +
+        'Set to "process" means a pool of processes ' +
+        '(good for many small files). default: thread',
+        metavar='p')
+    parser_create.add_argument(
+        '-chunk_jobs',
+        nargs=1,
+        default=[1],
+        type=check_chunk_jobs,
+        required=False,
+        dest='chunk_jobs',
+        help='Number of chunks of a file read and hashed in parallel ' +
+        '(only used for files larger than the chunk size). ' +
+        'This helps to use the bandwidth of parallel file systems for ' +
+        'single huge files. The data of a chunk is held in memory until ' +
+        'the hash of the complete file is updated in order. Therefore up ' +
+        'to 2 times this number of chunks (each of the chunk size) are ' +
+        'held in memory. default: 1',
+        metavar='n')
+    parser_create.add_argument(
+        '-use_mmap',
+        nargs=1,
+        default=[0],
+        choices=[0, 1],
+        type=int,
+        required=False,
+        dest='use_mmap',
+        help='If set to 1 files larger than buf_size are mapped to memory ' +
+        '(mmap) instead of reading them into a buffer. default: 0',
+        metavar='n')
+    create_io_mode_parameter(parser_create)
     create_common_parameter(parser_create)
     parser_create.set_defaults(func=create_checksum)
@@ -1,12 +1,13 @@
 """
 Author: Daniel Mohr.
-Date: 2017-02-14, 2021-05-17 (last change).
+Date: 2017-02-14, 2021-05-17, 2026-10-18 (last change).
 License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 """
 
 import argparse
 
 import pfu_module.replicate.script
+from pfu_module.replicate.tools import BSD_PROGRAMS
 
 from .create_common_parameter import create_common_parameter
 
@@ -27,7 +28,7 @@ def create_subparser_replicate(subparsers):
     """
     :Author: Daniel Mohr
     :Email: daniel.mohr@dlr.de
-    :Date: 2017-02-14, 2021-05-17 (last change).
+    :Date: 2017-02-14, 2021-05-17, 2026-10-18 (last change).
     :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
     This is the code for the script :program:`pfu`.
@@ -46,6 +47,8 @@ def create_subparser_replicate(subparsers):
         "-copy_parameter1 '--recursive --archive --update " + \
         "--one-file-system --no-dereference' \\\n   -source sd " + \
         "-destination t1 t2\n\n"
+    myhelp += "  time pfu replicate -checksum_in_process 1 " + \
+        "-source sd -destination t1 t2\n\n"
     myhelp += "It takes a long time, e. g.:\n"
     myhelp += "  >>> data = 1.0 * 1024*1024*1024*1024 # 1.0 [TB]\n"
     myhelp += "  >>> copytime = data / (100*1024*1024) / 60.0 / 60.0 " + \
@@ -207,6 +210,24 @@ def create_subparser_replicate(subparsers):
         help='Parameter uses for the program (e. g. sha256sum) to ' +
         'check checksums. default: "--quiet --check"',
         metavar='param')
+    parser.add_argument(
+        '-checksum_in_process',
+        nargs=1,
+        default=0,
+        type=int,
+        required=False,
+        choices=[0, 1],
+        dest='checksum_in_process',
+        help='If set to 1, the checksums are created and checked in ' +
+        'process by a pool of number_of_processes threads instead of ' +
+        'running the checksum program in a shell for every directory. ' +
+        'The checksum files and the log and status files are the same ' +
+        'as created by the checksum program with the BSD-style (e. g. ' +
+        '"sha256sum --tag"). The checksum program has not to be ' +
+        'installed; it only sets the algorithm and has to be one of: ' +
+        ', '.join(BSD_PROGRAMS) + '. The parameters for the checksum ' +
+        'program are ignored, except "--quiet" for checking. default: 0',
+        metavar='i')
     parser.add_argument(
         '-checksum_check_method',
         nargs=1,
@@ -341,13 +362,12 @@ def create_subparser_replicate(subparsers):
     parser.add_argument(
         '-sleeptime',
         nargs=1,
-        default=0.1,
+        default=None,
         type=float,
         required=False,
-        choices=[0, 1],
         dest='sleeptime',
-        help='Number of seconds to sleep between checking running ' +
-        'subprocesses. default: 0.1',
+        help='Deprecated and ignored, since a new subprocess is started ' +
+        'as soon as a subprocess terminated.',
         metavar='f')
     parser.add_argument(
         '-extrasleeptime',
@@ -356,7 +376,9 @@ def create_subparser_replicate(subparsers):
         type=float,
         required=False,
         dest='extrasleeptime',
-        help='Number of seconds to sleep between steps (2 times). ' +
+        help='Number of seconds to wait after the commands a command ' +
+        'depends on are ready (e. g. copying to a destination and ' +
+        'creating checksums before copying again to this destination). ' +
         'default: 1.0',
         metavar='f')
     parser.add_argument(
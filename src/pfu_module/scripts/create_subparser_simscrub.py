@@ -1,6 +1,6 @@
 """
 Author: Daniel Mohr.
-Date: 2017-02-13 (last change).
+Date: 2017-02-13, 2026-10-18 (last change).
 License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 """
 
@@ -11,8 +11,9 @@ import os
 import pfu_module.simscrub.script
 
 from .create_common_parameter import create_common_parameter
+from .create_io_mode_parameter import create_io_mode_parameter
 
-__date__ = "2017-01-29"
+__date__ = "2026-10-18"
 
 
 def simscrub(args):
@@ -36,7 +37,7 @@ def create_subparser_simscrub(subparsers):
     """
     :Author: Daniel Mohr
     :Email: daniel.mohr@dlr.de
-    :Date: 2017-02-13 (last change).
+    :Date: 2017-02-13, 2026-10-18 (last change).
     :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
     """
     myhelp = "You can scrub your data regularly by calling this script " + \
@@ -162,4 +163,5 @@ def create_subparser_simscrub(subparsers):
         dest='update',
         help='If set do not update the directory tree before scrubbing.')
     parser.set_defaults(update=True)
+    create_io_mode_parameter(parser)
     create_common_parameter(parser)
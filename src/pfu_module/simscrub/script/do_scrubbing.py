@@ -1,7 +1,7 @@
 """
 :Author: Daniel Mohr
 :Email: daniel.mohr@gmx.de
-:Date: 2017-01-29, 2021-08-31 (last change).
+:Date: 2017-01-29, 2021-08-31, 2026-10-18 (last change).
 :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 """
 
@@ -19,7 +19,7 @@ def do_scrubbing(args, log):
     """
     :Author: Daniel Mohr
     :Email: daniel.mohr@gmx.de
-    :Date: 2017-01-29, 2021-08-31 (last change).
+    :Date: 2017-01-29, 2021-08-31, 2026-10-18 (last change).
     :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
     """
     if os.path.exists(args.config_data_directory[0]):
@@ -43,7 +43,8 @@ def do_scrubbing(args, log):
                 reduced_chunk_size=args.reduced_chunk_size[0],
                 max_retry=args.max_retry[0],
                 omit_chunk_size=args.omit_chunk_size[0],
-                update=args.update)]
+                update=args.update,
+                io_mode=args.io_mode[0])]
             list_of_thread_stop_fct += [
                 list_of_scrub_inst[-1].stop_scrubbing]
         random.shuffle(list_of_scrub_inst)
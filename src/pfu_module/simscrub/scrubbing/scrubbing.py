@@ -1,7 +1,7 @@
 """
 :Author: Daniel Mohr
 :Email: daniel.mohr@gmx.de
-:Date: 2017-08-23 (last change).
+:Date: 2017-08-23, 2026-10-18 (last change).
 :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 """
 
@@ -14,13 +14,15 @@ import threading
 import time
 
 import pfu_module.simscrub
+from pfu_module.checksum_tools import open_data_file
+from pfu_module.checksum_tools import read_data_from_file
 
 
 class Scrubbing():
     """
     :Author: Daniel Mohr
     :Email: daniel.mohr@gmx.de
-    :Date: 2017-08-23 (last change).
+    :Date: 2017-08-23, 2026-10-18 (last change).
     :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
     """
     # pylint: disable=too-many-instance-attributes
@@ -35,12 +37,16 @@ class Scrubbing():
                  reduced_chunk_size=1024,
                  max_retry=3,
                  omit_chunk_size=1024,
-                 update=True):
+                 update=True,
+                 io_mode='buffered'):
         """
         :Author: Daniel Mohr
         :Email: daniel.mohr@gmx.de
-        :Date: 2017-01-10 (last change).
+        :Date: 2017-01-10, 2026-10-18 (last change).
         :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+        :param io_mode: Set the usage of the page cache (see
+                        pfu_module.checksum_tools.IO_MODES).
         """
         # pylint: disable=too-many-arguments
         # store parameter
@@ -54,6 +60,7 @@ class Scrubbing():
         self._max_retry = max_retry
         self._omit_chunk_size = omit_chunk_size
         self._update = update
+        self._io_mode = io_mode
         # create own variables
         self._scrubbing = False
         self._file_status = os.path.join(self._config_dir, 'status')
@@ -64,17 +71,22 @@ class Scrubbing():
         """
         :Author: Daniel Mohr
         :Email: daniel.mohr@gmx.de
-        :Date: 2017-01-10 (last change).
+        :Date: 2017-01-10, 2026-10-18 (last change).
         :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
         """
         if os.path.isfile(file_name) and os.access(file_name, os.R_OK):
             retry = self._max_retry
             chunk_size = self._chunk_size
-            with open(file_name, 'rb') as data_file:
+            # one buffer for the file, reused for every read
+            buf = bytearray(max(1, self._chunk_size))
+            with open_data_file(file_name, self._io_mode,
+                                self._chunk_size) as data_file:
                 while (self._scrubbing and
                        (data_file.tell() < os.path.getsize(file_name))):
                     try:
-                        _ = data_file.read(chunk_size)
+                        read_data_from_file(
+                            chunk_size, data_file, chunk_size, [],
+                            buf=buf, io_mode=self._io_mode)
                     except IOError:
                         chunk_size = self._reduced_chunk_size
                         retry -= 1
@@ -7,4 +7,6 @@
 
 """
 
+from .main import benchmarks
+from .main import modules
 from .main import scripts
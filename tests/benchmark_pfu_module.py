@@ -0,0 +1,793 @@
+"""
+:Author: Daniel Mohr
+:Email: daniel.mohr@dlr.de
+:Date: 2026-10-18
+:License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+benchmarks of the hot loops of pfu_module
+
+The benchmarks check the expected savings; the measurements are given in
+the messages of failing checks. They are not part of the automatic tests,
+run them with::
+
+  env python3 setup.py run_benchmark
+
+Or you can run this file directly::
+
+  env python3 benchmark_pfu_module.py
+
+  pytest-3 benchmark_pfu_module.py
+
+Or you can run only one benchmark, e. g.::
+
+  env python3 benchmark_pfu_module.py \
+    BenchmarkReadDataFromFile.test_read_data_from_file_allocation
+
+  pytest-3 -k test_read_data_from_file_allocation benchmark_pfu_module.py
+"""
+
+import argparse
+import base64
+import functools
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import tempfile
+import threading
+import time
+import tracemalloc
+import unittest
+import unittest.mock
+
+from pfu_module.checksum_tools import HashFileWriter
+from pfu_module.checksum_tools import map_data_file
+from pfu_module.checksum_tools import read_data_from_file
+from pfu_module.checksum_tools import TEMPORARY_EXTENSION
+from pfu_module.check_checksum import CheckChecksumsClass
+from pfu_module.check_checksum import HashEntries
+from pfu_module.check_checksum import JsonLinesSink
+from pfu_module.create_checksum import CreateChecksumsClass
+from pfu_module.replicate.tools import create_bsd_checksums
+from pfu_module.replicate.tools import run_jobs
+
+
+class BufferCounter():
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+
+    hash object counting the Bytes of the buffers allocated for the data
+    """
+
+    def __init__(self):
+        self.hash_object = hashlib.sha512()
+        self.buffers = {}  # id of buffer -> buffer (keeps id unique)
+
+    def update(self, data):
+        # pylint: disable=missing-docstring
+        self.hash_object.update(data)
+        buf = data
+        if isinstance(data, memoryview):
+            buf = data.obj
+        self.buffers[id(buf)] = buf
+
+    def allocated(self):
+        """
+        :return: sum of the sizes of the different buffers
+        """
+        return sum(len(buf) for buf in self.buffers.values())
+
+
+def read_data_from_file_by_read(buf_size, data_file, size, hash_objects):
+    """
+    reference implementation allocating a new buffer for every read
+    (read_data_from_file before using a reused buffer)
+    """
+    data_read = 0
+    while data_read < size:
+        number_of_bytes = min(buf_size, size-data_read)
+        buf = data_file.read(number_of_bytes)
+        if not bool(buf):
+            break
+        data_read += len(buf)
+        for hash_object in hash_objects:
+            hash_object.update(buf)
+
+
+class BenchmarkReadDataFromFile(unittest.TestCase):
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+    """
+
+    def test_read_data_from_file_allocation(self):
+        """
+        compares the Bytes allocated for buffers and the time needed by
+        read_data_from_file (with and without mmap) and the reference
+        implementation allocating a new buffer for every read
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        buf_size = 524288
+        filesize = 64 * buf_size + 23
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'data')
+            with open(filename, 'wb') as data_file:
+                data_file.write(os.urandom(filesize))
+            results = {}
+            for method in ['read', 'readinto', 'mmap']:
+                counter = BufferCounter()
+                with open(filename, 'rb') as data_file:
+                    dt0 = time.perf_counter()
+                    if method == 'read':
+                        read_data_from_file_by_read(
+                            buf_size, data_file, filesize, [counter])
+                    elif method == 'readinto':
+                        read_data_from_file(
+                            buf_size, data_file, filesize, [counter],
+                            buf=bytearray(buf_size))
+                    else:
+                        with map_data_file(data_file, 0) as mapped:
+                            read_data_from_file(
+                                buf_size, data_file, filesize, [counter],
+                                mapped=mapped)
+                            # mapped memory is not allocated
+                            del counter.buffers[id(mapped)]
+                    duration = time.perf_counter() - dt0
+                    self.assertEqual(data_file.tell(), filesize)
+                results[method] = (counter.hash_object.hexdigest(),
+                                   counter.allocated(),
+                                   duration)
+        msg = ', '.join(f'{method}: {result[1]} Bytes allocated for '
+                        f'buffers in {result[2]:.4f} s'
+                        for (method, result) in results.items())
+        self.assertEqual(results['read'][1], filesize, msg=msg)
+        self.assertEqual(results['readinto'][1], buf_size, msg=msg)
+        self.assertEqual(results['mmap'][1], 0, msg=msg)
+        for method in ['readinto', 'mmap']:
+            self.assertEqual(results[method][0], results['read'][0])
+
+
+class BenchmarkCreateChecksumsMetadata(unittest.TestCase):
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+    """
+
+    def test_create_checksums_metadata_calls(self):
+        """
+        counts the metadata system calls (stat, lstat, access and fstat)
+        of CreateChecksumsClass.create_all
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        # pylint: disable=too-many-locals
+        number_dirs = 4
+        number_files = 64
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i in range(number_dirs):
+                os.mkdir(os.path.join(tmpdir, str(i)))
+                for j in range(number_files):
+                    with open(os.path.join(tmpdir, str(i), str(j)),
+                              'wb') as data_file:
+                        data_file.write(os.urandom(42))
+            for create_only_missing in [1, 1, 2, 2]:
+                counters = {}
+                for name in ['stat', 'lstat', 'access', 'fstat']:
+                    counters[name] = unittest.mock.patch(
+                        'os.' + name, wraps=getattr(os, name))
+                mocks = {name: patcher.start()
+                         for (name, patcher) in counters.items()}
+                try:
+                    dt0 = time.perf_counter()
+                    CreateChecksumsClass(
+                        directories=[tmpdir], chunk_size=23,
+                        create_only_missing=create_only_missing,
+                        level=30).create_all()
+                    duration = time.perf_counter() - dt0
+                finally:
+                    for patcher in counters.values():
+                        patcher.stop()
+                calls = {name: mock.call_count
+                         for (name, mock) in mocks.items()}
+                msg = (f'create_only_missing={create_only_missing}: '
+                       f'{calls} for {number_dirs * number_files} files, '
+                       f'{duration:.4f} s')
+                # only the directories are checked by stat
+                self.assertLessEqual(
+                    calls['stat'] + calls['lstat'] + calls['access'],
+                    number_dirs + 1, msg=msg)
+                # every hashed file is checked once by fstat
+                self.assertLessEqual(calls['fstat'],
+                                     number_dirs * number_files, msg=msg)
+
+
+class BenchmarkHashFileWriter(unittest.TestCase):
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+    """
+
+    def test_hash_file_writer(self):
+        """
+        compares the HashFileWriter with opening the hash file in append
+        mode for every data file
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        number_hash_files = 64
+        number_lines = 32
+        durations = {}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for method in ['append', 'writer']:
+                os.mkdir(os.path.join(tmpdir, method))
+                hash_file_names = [
+                    os.path.join(tmpdir, method, str(i))
+                    for i in range(number_hash_files)]
+                writer = HashFileWriter(max_open_files=8)
+                dt0 = time.perf_counter()
+                # interleaved writes force closing and reopening
+                for j in range(number_lines):
+                    for hash_file_name in hash_file_names:
+                        line = f'{j}  {os.path.basename(hash_file_name)}'
+                        if method == 'append':
+                            with open(hash_file_name, mode='a',
+                                      encoding='utf-8') as hash_file:
+                                hash_file.write(line + "\n")
+                        else:
+                            writer.write(hash_file_name, [line])
+                    if (j == 0) and (method == 'writer'):
+                        # only the open hash files are not renamed
+                        self.assertEqual(
+                            len([name for name in os.listdir(
+                                os.path.join(tmpdir, method))
+                                 if name.endswith(TEMPORARY_EXTENSION)]),
+                            8)
+                writer.close()
+                durations[method] = time.perf_counter() - dt0
+                self.assertEqual(len(writer.created),
+                                 number_hash_files * (method == 'writer'))
+            self.assertEqual(
+                sorted(os.listdir(os.path.join(tmpdir, 'writer'))),
+                sorted(os.listdir(os.path.join(tmpdir, 'append'))))
+            for i in range(number_hash_files):
+                with open(os.path.join(tmpdir, 'append', str(i)),
+                          encoding='utf-8') as hash_file:
+                    expected = hash_file.read()
+                with open(os.path.join(tmpdir, 'writer', str(i)),
+                          encoding='utf-8') as hash_file:
+                    self.assertEqual(hash_file.read(), expected,
+                                     msg=f'durations: {durations}')
+
+
+class BenchmarkCheckChecksumsCatalog(unittest.TestCase):
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+    """
+
+    def test_check_checksums_catalog_scaling(self):
+        """
+        measures CheckChecksumsClass.catalog for 1k, 10k and 100k synthetic
+        entries and checks the near linear scaling
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        durations = {}
+        for number in [1000, 1000, 10000, 100000]:
+            checker = CheckChecksumsClass(level=30)
+            names = [f'dir{i % 1000}/file{i}' for i in range(number)]
+            # every 10th data file without hash, every 10th hash without
+            # data file, every 3rd hash only for chunks
+            checker.data_files = [name for (i, name) in enumerate(names)
+                                  if i % 10 != 1]
+            checker.hash_dicts = [
+                {name: [] for (i, name) in enumerate(names)
+                 if i % 10 != 0},
+                {name: [] for (i, name) in enumerate(names)
+                 if (i % 10 != 0) and (i % 3 != 0)}]
+            dt0 = time.perf_counter()
+            catalog = list(checker.catalog())
+            durations[number] = time.perf_counter() - dt0
+            self.assertEqual(len(catalog), number)
+            self.assertEqual(
+                [entry[0] for entry in catalog], sorted(names))
+            self.assertEqual(sum(entry[1] for entry in catalog),
+                             number - number // 10)
+            self.assertEqual(sum(entry[2] for entry in catalog),
+                             number - number // 10)
+        # quadratic behaviour would give a factor of 100 per entry
+        self.assertLess(durations[100000] / 100000,
+                        10 * durations[1000] / 1000,
+                        msg=f'durations: {durations}')
+
+
+class BenchmarkCheckChecksumsChunks(unittest.TestCase):
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+    """
+
+    def test_check_checksums_chunks_scaling(self):
+        """
+        counts the reads and the updates of hash objects of
+        CheckChecksumsClass.compare_hashes_for_file for a file with about
+        5k, 22k and 87k chunks (two overlapping chunk sets) and checks the
+        linear scaling
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        filesize = 2097152
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'data')
+            data = os.urandom(filesize)
+            with open(filename, 'wb') as data_file:
+                data_file.write(data)
+            for chunk_size in [512, 128, 32]:
+                chunks = []
+                for size in [chunk_size, 3 * chunk_size]:
+                    for start in range(0, filesize, size):
+                        stop = min(start + size, filesize) - 1
+                        chunks.append((
+                            hashlib.sha256(
+                                data[start:stop + 1]).hexdigest(),
+                            ('sha256', 'base16'), 'hash_file', start, stop))
+                checker = CheckChecksumsClass(level=30)
+                checker.hash_dicts = [
+                    {filename: chunks},
+                    {filename: [(hashlib.sha256(data).hexdigest(),
+                                 ('sha256', 'base16'), 'hash_file')]}]
+                with unittest.mock.patch(
+                        'pfu_module.check_checksum.check_checksum.'
+                        'read_data_from_file',
+                        wraps=read_data_from_file) as reads:
+                    result = checker.compare_hashes_for_file(filename)
+                self.assertTrue(result[0])
+                self.assertEqual(result[2], len(chunks))
+                # a read between two events (start or stop of a chunk)
+                self.assertLessEqual(reads.call_count, len(chunks))
+                # at most the complete file and 2 overlapping chunks
+                self.assertLessEqual(
+                    sum(len(call.args[3]) for call in reads.call_args_list),
+                    3 * reads.call_count)
+                # a wrong hash of the last chunk is detected
+                chunks[-1] = ('0' * 64,) + chunks[-1][1:]
+                self.assertFalse(checker.compare_hashes_for_file(filename)[0])
+
+
+class BenchmarkCheckChecksumsStream(unittest.TestCase):
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+    """
+
+    def test_check_checksums_stream_memory(self):
+        """
+        compares the peak memory of CheckChecksumsClass.check_all with and
+        without streaming and checks the number of data files and hashes
+        hold in memory while comparing the hashes
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        number_dirs = 32
+        number_files = 64
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i in range(number_dirs):
+                os.mkdir(os.path.join(tmpdir, str(i)))
+                for j in range(number_files):
+                    with open(os.path.join(tmpdir, str(i), str(j)),
+                              'wb') as data_file:
+                        data_file.write(os.urandom(42))
+            CreateChecksumsClass(
+                directories=[tmpdir], chunk_size=7, level=30).create_all()
+            peaks = {}
+            held = {}
+            for stream in [0, 1]:
+                checker = CheckChecksumsClass(
+                    directories=[tmpdir], level=30, stream=stream)
+                held[stream] = set()
+                compare = checker.compare_hashes_for_file
+
+                def compare_and_count(filename, file_stat=None,
+                                      checker=checker, compare=compare,
+                                      stream=stream):
+                    held[stream].add(
+                        (len(checker.data_files),
+                         len(checker.hash_dicts[0]),
+                         len(checker.hash_dicts[1])))
+                    return compare(filename, file_stat)
+                checker.compare_hashes_for_file = compare_and_count
+                # no log records (e. g. collected by pytest)
+                logging.disable(logging.CRITICAL)
+                tracemalloc.start()
+                try:
+                    checker.check_all()
+                    peaks[stream] = tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+                    logging.disable(logging.NOTSET)
+                self.assertEqual(
+                    checker.result_number['data file with matching hash(es)'],
+                    number_dirs * number_files)
+            msg = f'peaks of memory: {peaks}'
+            self.assertEqual(held[0], {(number_dirs * number_files,) * 3},
+                             msg=msg)
+            # only a directory is hold in memory
+            self.assertEqual(held[1], {(number_files,) * 3}, msg=msg)
+
+
+class BenchmarkParseHashLines(unittest.TestCase):
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+    """
+
+    def test_parse_hash_lines(self):
+        """
+        compares CheckChecksumsClass.parse_hash_lines with analysing every
+        line by the regular expressions for a synthetic .checksum.sha512
+        and checks, that only the lines of chunks are searched by a regular
+        expression
+
+        The number of lines is scaled down from 10 million, which does not
+        fit into the memory of every test machine.
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        number_lines = 20000
+        lines = []
+        for i in range(number_lines):
+            hash_string = base64.b64encode(os.urandom(64)).decode()
+            if i % 4 == 3:
+                # every 4th line is a chunk
+                lines.append(f'{hash_string}  file{i // 4} '
+                             f'(bytes 0 - {i})\n')
+            else:
+                lines.append(f'{hash_string}  file{i}\n')
+        hash_dicts = {}
+        for method in ['regexps', 'parser']:
+            checker = CheckChecksumsClass(level=30)
+            reader = checker.hash_file_reader
+            if method == 'regexps':
+                for line in lines:
+                    # pylint: disable=protected-access
+                    reader._analyse_hashline(line, 'dir/.checksum.sha512',
+                                             checker.hash_dicts)
+            else:
+                # an attribute of the instance, the class is not changed
+                reader.regexps = [unittest.mock.Mock(
+                    wraps=reader.regexps[0])] + reader.regexps[1:]
+                with unittest.mock.patch.object(
+                        reader, '_analyse_hashline',
+                        side_effect=AssertionError('_analyse_hashline')):
+                    checker.parse_hash_lines(lines, 'dir/.checksum.sha512')
+                self.assertEqual(reader.regexps[0].search.call_count,
+                                 number_lines // 4)
+            hash_dicts[method] = checker.hash_dicts
+            self.assertEqual(
+                sum(len(entries) for hash_dict in checker.hash_dicts
+                    for entries in hash_dict.values()),
+                number_lines)
+        # the same result
+        self.assertEqual(hash_dicts['regexps'], hash_dicts['parser'])
+
+
+class BenchmarkHashEntries(unittest.TestCase):
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+    """
+
+    def test_hash_entries_memory(self):
+        """
+        compares the memory of the parsed hashes stored in dicts of lists of
+        tuples and in HashEntries
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        number_files = 20000
+        chunks_per_file = 4
+        number_hashes = number_files * (chunks_per_file + 1)
+        hashfilename = 'dir/.checksum.sha512'
+        digests = [os.urandom(64) for _ in range(number_hashes)]
+        sizes = {}
+        stores = {}
+        for method in ['tuples', 'HashEntries']:
+            tracemalloc.start()
+            try:
+                # the texts are created as when reading the hash files
+                if method == 'tuples':
+                    hash_dicts = [{}, {}]
+                    for i in range(number_files):
+                        hash_dicts[1][f'dir/file{i}'] = [
+                            (digests[i].hex(), ('sha512', 'base16'),
+                             hashfilename)]
+                        hash_dicts[0][f'dir/file{i}'] = [
+                            (digests[number_files + chunks_per_file * i +
+                                     j].hex(),
+                             ('sha512', 'base16'), hashfilename,
+                             1024 * j, 1024 * j + 1023)
+                            for j in range(chunks_per_file)]
+                else:
+                    hash_dicts = [HashEntries(chunks=True), HashEntries()]
+                    for i in range(number_files):
+                        hash_dicts[1].add(
+                            f'dir/file{i}', digests[i].hex(),
+                            ('sha512', 'base16'), hashfilename)
+                        for j in range(chunks_per_file):
+                            hash_dicts[0].add(
+                                f'dir/file{i}',
+                                digests[number_files + chunks_per_file * i +
+                                        j].hex(),
+                                ('sha512', 'base16'), hashfilename,
+                                1024 * j, 1024 * j + 1023)
+                sizes[method] = tracemalloc.get_traced_memory()[0]
+            finally:
+                tracemalloc.stop()
+            stores[method] = hash_dicts
+        # the same content
+        self.assertEqual(stores['tuples'], stores['HashEntries'])
+        # a sha512 digest needs 64 Bytes, its text (base16) 177 Bytes
+        self.assertLess(2 * sizes['HashEntries'], sizes['tuples'],
+                        msg=f'Bytes for {number_hashes} hashes: {sizes}')
+
+
+class BenchmarkHashFileIndex(unittest.TestCase):
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+    """
+
+    def test_hash_file_index(self):
+        """
+        reads a hash file from the index without parsing it again
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        number_lines = 100000
+        with tempfile.TemporaryDirectory() as tmpdir:
+            hashfilename = os.path.join(tmpdir, '.checksum.sha512')
+            with open(hashfilename, 'w', encoding='utf-8') as hash_file:
+                for i in range(number_lines):
+                    hash_file.write(f'{os.urandom(64).hex()}  file{i}\n')
+            index = os.path.join(tmpdir, 'index.pfuidx')
+            hash_dicts = {}
+            for method in ['parse', 'create index', 'index']:
+                checker = CheckChecksumsClass(
+                    level=30, index=None if method == 'parse' else index)
+                checker.hash_files = [hashfilename]
+                if method == 'index':
+                    # the hash file must not be parsed again
+                    with unittest.mock.patch.object(
+                            checker.hash_file_reader, 'parse_hash_lines',
+                            side_effect=AssertionError('parsed again')):
+                        checker.read_all_hash_files()
+                else:
+                    checker.read_all_hash_files()
+                if checker.hash_file_index is not None:
+                    checker.hash_file_index.write()
+                hash_dicts[method] = checker.hash_dicts
+            self.assertEqual(hash_dicts['index'], hash_dicts['parse'])
+            self.assertEqual(checker.hash_file_index.number_used, 1)
+            self.assertEqual(checker.hash_file_index.number_parsed, 0)
+
+
+class BenchmarkCheckChecksumsHashFiles(unittest.TestCase):
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+    """
+
+    def test_check_checksums_hash_files(self):
+        """
+        checks, that CheckChecksumsClass with given hash files does not list
+        any directory and calls os.stat only once for every file
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        number_dirs = 10
+        number_files = 20
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i in range(number_dirs):
+                os.mkdir(os.path.join(tmpdir, str(i)))
+                for j in range(number_files):
+                    with open(os.path.join(tmpdir, str(i), str(j)),
+                              'wb') as data_file:
+                        data_file.write(os.urandom(42))
+            CreateChecksumsClass(directories=[tmpdir], level=30).create_all()
+            checker = CheckChecksumsClass(
+                level=30,
+                hash_files=[os.path.join(tmpdir, str(i), '.checksum.sha512')
+                            for i in range(number_dirs)])
+            with unittest.mock.patch(
+                    'os.walk', side_effect=AssertionError('os.walk')), \
+                    unittest.mock.patch(
+                        'os.scandir',
+                        side_effect=AssertionError('os.scandir')), \
+                    unittest.mock.patch(
+                        'os.listdir',
+                        side_effect=AssertionError('os.listdir')), \
+                    unittest.mock.patch('os.stat', wraps=os.stat) as stat:
+                checker.check_all()
+            self.assertEqual(
+                checker.result_number['data file with matching hash(es)'],
+                number_dirs * number_files,
+                msg=f'{stat.call_count} calls of os.stat for '
+                f'{number_dirs * number_files} data files')
+            # once for every data file and every hash file
+            self.assertEqual(stat.call_count,
+                             number_dirs * (number_files + 1))
+
+
+class BenchmarkJsonLinesSink(unittest.TestCase):
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+    """
+
+    def test_json_lines_sink(self):
+        """
+        compares the records written by JsonLinesSink and directly and
+        checks, that the caller does not serialize the records
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        number_records = 100000
+        records = [{'file': f'dir/file{i}', 'status': 'ok', 'size': i,
+                    'hashes': 1, 'chunk_hashes': 4, 'bytes_read': i,
+                    'seconds': 1e-4, 'bad_chunks': []}
+                   for i in range(number_records)]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, 'direct'), 'w',
+                      encoding='utf-8') as out:
+                for record in records:
+                    out.write(json.dumps(record) + '\n')
+            threads = set()
+
+            def dumps(record, dumps=json.dumps):
+                threads.add(threading.current_thread())
+                return dumps(record)
+            with unittest.mock.patch('json.dumps', side_effect=dumps) as \
+                    mock:
+                sink = JsonLinesSink(os.path.join(tmpdir, 'JsonLinesSink'))
+                for record in records:
+                    sink.write(record)
+                sink.close()
+            self.assertEqual(mock.call_count, number_records)
+            self.assertNotIn(threading.current_thread(), threads)
+            with open(os.path.join(tmpdir, 'direct'),
+                      encoding='utf-8') as direct, \
+                    open(os.path.join(tmpdir, 'JsonLinesSink'),
+                         encoding='utf-8') as sink_file:
+                self.assertEqual(sink_file.read(), direct.read())
+
+
+class BenchmarkRunJobs(unittest.TestCase):
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+    """
+
+    def test_run_jobs(self):
+        """
+        runs the jobs of replicate for a slow and a fast destination;
+        the fast destination has to be checked before the slow copy is
+        ready
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        if not os.name == 'posix':
+            self.skipTest('needs the posix commands sleep and true')
+        args = argparse.Namespace(
+            number_of_processes=2,
+            limit_number_of_processes_to_distinations=1,
+            extrasleeptime=0.0)
+        jobs = [
+            {'cmd': 'sleep 1 # copy1 slow', 'after': [], 'group': None,
+             'step': 'create checksums'},
+            {'cmd': 'true # copy1 fast', 'after': [], 'group': None,
+             'step': 'create checksums'},
+            {'cmd': 'true # create', 'after': [], 'group': None,
+             'step': 'create checksums'},
+            {'cmd': 'true # copy2 slow', 'after': [0, 2], 'group': 0,
+             'step': 'copy'},
+            {'cmd': 'true # check slow', 'after': [3], 'group': 0,
+             'step': 'check'},
+            {'cmd': 'true # copy2 fast', 'after': [1, 2], 'group': 1,
+             'step': 'copy'},
+            {'cmd': 'false # check fast', 'after': [5], 'group': 1,
+             'step': 'check'}]
+        dt0 = time.perf_counter()
+        summary, errors = run_jobs(args, logging.getLogger('benchmark'),
+                                   jobs)
+        duration = time.perf_counter() - dt0
+        order = [job['cmd'] for job in jobs]
+        order.sort(key=summary.index)
+        self.assertEqual(len(summary.splitlines()), len(jobs))
+        self.assertLess(order.index('false # check fast'),
+                        order.index('sleep 1 # copy1 slow'),
+                        msg=f'{duration:.3f} s for 1 s and 0 s copy')
+        self.assertLess(order.index('sleep 1 # copy1 slow'),
+                        order.index('true # copy2 slow'))
+        self.assertLess(order.index('true # copy2 slow'),
+                        order.index('true # check slow'))
+        self.assertEqual(errors['copy'], '')
+        self.assertIn('false # check fast', errors['check'])
+
+
+class BenchmarkCreateBsdChecksums(unittest.TestCase):
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+    """
+
+    def test_create_bsd_checksums(self):
+        """
+        compares creating the checksum files of many small directories by
+        sha256sum in a shell and in process and checks, that no subprocess
+        is started in process
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        if subprocess.run('sha256sum --version', stdout=subprocess.PIPE,
+                          stderr=subprocess.PIPE, shell=True,
+                          check=False).returncode != 0:
+            self.skipTest('sha256sum not available')
+        number_dirs = 200
+        args = argparse.Namespace(
+            number_of_processes=2,
+            limit_number_of_processes_to_distinations=1,
+            extrasleeptime=0.0)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            dirpaths = []
+            for i in range(number_dirs):
+                dirpaths.append(os.path.join(tmpdir, f'dir{i}'))
+                os.mkdir(dirpaths[-1])
+                for name in ['a', 'b c']:
+                    with open(os.path.join(dirpaths[-1], name), 'wb') as fd:
+                        fd.write(os.urandom(1024))
+            for method in ['shell', 'in process']:
+                jobs = []
+                for dirpath in dirpaths:
+                    jobs.append(
+                        {'cmd': f'cd {dirpath} && sha256sum --tag -- ' +
+                         'a "b c" > .shell',
+                         'after': [], 'group': None, 'step': method})
+                    if method == 'in process':
+                        jobs[-1]['function'] = functools.partial(
+                            create_bsd_checksums, dirpath, ['a', 'b c'],
+                            'sha256sum', '.in_process')
+                if method == 'shell':
+                    (_, errors) = run_jobs(
+                        args, logging.getLogger('benchmark'), jobs)
+                else:
+                    with unittest.mock.patch(
+                            'subprocess.Popen',
+                            side_effect=AssertionError('subprocess')):
+                        (_, errors) = run_jobs(
+                            args, logging.getLogger('benchmark'), jobs)
+                self.assertEqual(errors[method], '')
+            for dirpath in dirpaths:
+                with open(os.path.join(dirpath, '.shell'), 'rb') as fd0, \
+                        open(os.path.join(dirpath, '.in_process'),
+                             'rb') as fd1:
+                    self.assertEqual(fd1.read(), fd0.read())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
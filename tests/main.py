@@ -1,7 +1,7 @@
 """
 :Author: Daniel Mohr
 :Email: daniel.mohr@dlr.de
-:Date: 2021-05-25
+:Date: 2021-05-25, 2026-10-18
 :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
 aggregation of tests
@@ -111,6 +111,10 @@ def scripts(suite):
     # pfu check_checksum
     suite.addTest(loader.loadTestsFromName(
         'tests.script_pfu_check_checksum'))
+    suite.addTest(loader.loadTestsFromName(
+        'tests.script_pfu_check_checksum_large_trees'))
+    suite.addTest(loader.loadTestsFromName(
+        'tests.script_pfu_check_checksum_scrubbing'))
     # pfu replicate
     suite.addTest(loader.loadTestsFromName(
         'tests.script_pfu_replicate'))
@@ -119,5 +123,38 @@ def scripts(suite):
         'tests.script_pfu_speed_test'))
 
 
+def modules(suite):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    add tests for the classes and functions of the module
+    """
+    print('add tests for the classes and functions of the module')
+    loader = unittest.defaultTestLoader
+    suite.addTest(loader.loadTestsFromName(
+        'tests.module_pfu_module'))
+
+
+def benchmarks(suite):
+    """
+    :Author: Daniel Mohr
+    :Email: daniel.mohr@dlr.de
+    :Date: 2026-10-18
+    :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+    add benchmarks of the module
+
+    The benchmarks are not added by default, run them with::
+
+      env python3 setup.py run_benchmark
+    """
+    loader = unittest.defaultTestLoader
+    suite.addTest(loader.loadTestsFromName(
+        'tests.benchmark_pfu_module'))
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -0,0 +1,724 @@
+"""
+:Author: Daniel Mohr
+:Email: daniel.mohr@dlr.de
+:Date: 2026-10-18
+:License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+tests of the classes and functions of pfu_module
+
+You can run this file directly::
+
+  env python3 module_pfu_module.py
+
+  pytest-3 module_pfu_module.py
+
+Or you can run only one test, e. g.::
+
+  env python3 module_pfu_module.py \
+    ModuleJsonLinesSink.test_json_lines_sink_error
+
+  pytest-3 -k test_json_lines_sink_error module_pfu_module.py
+"""
+
+import argparse
+import errno
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import unittest
+import unittest.mock
+
+from pfu_module.check_checksum import CheckChecksumsClass
+from pfu_module.check_checksum import HashEntries
+from pfu_module.check_checksum import HashFileIndex
+from pfu_module.check_checksum import JsonLinesSink
+from pfu_module.check_checksum import VerificationLedger
+from pfu_module.checksum_tools import HashFileWriter
+from pfu_module.checksum_tools import TEMPORARY_EXTENSION
+from pfu_module.checksum_tools import scandir_walk
+from pfu_module.create_checksum import CreateChecksumsClass
+from pfu_module.replicate.tools import run_jobs
+
+
+class ModuleCheckChecksums(unittest.TestCase):
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+    """
+
+    def test_check_checksums_vanished_files(self):
+        """
+        tests, that data files deleted after they were found are counted as
+        not handled by CheckChecksumsClass with jobs > 1 and the other data
+        files are checked
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            names = [os.path.join(tmpdir, name) for name in 'abcdef']
+            for name in names:
+                with open(name, 'wb') as fd:
+                    fd.write(os.urandom(42))
+            CreateChecksumsClass(directories=[tmpdir], chunk_size=7,
+                                 level=30).create_all()
+            for jobs in [2, 4]:
+                checker = CheckChecksumsClass(directories=[tmpdir],
+                                              jobs=jobs, level=30)
+
+                def catalog_and_remove(catalog=checker.catalog):
+                    # remove 'a' after the catalog
+                    yield from catalog()
+                    os.remove(names[0])
+
+                def remove_and_compare(
+                        filename, file_stat=None,
+                        compare=checker.compare_hashes_for_file):
+                    # remove 'b' before comparing it
+                    if filename == names[1]:
+                        os.remove(filename)
+                    return compare(filename, file_stat)
+                checker.catalog = catalog_and_remove
+                checker.compare_hashes_for_file = remove_and_compare
+                with self.assertLogs('pfu.check', level='WARNING') as logs:
+                    self.assertEqual(checker.check_all(), 0)
+                for name in names[0:2]:
+                    self.assertIn(f'file "{name}" not existing (anymore?)',
+                                  '\n'.join(logs.output))
+                self.assertEqual(
+                    checker.result_number['data file not handled'], 2)
+                self.assertEqual(
+                    checker.result_number['data file with matching hash(es)'],
+                    len(names) - 2)
+                # create the deleted files again for the next run
+                for name in names[0:2]:
+                    with open(name, 'wb') as fd:
+                        fd.write(b'')
+
+    def test_check_checksums_keyword_only(self):
+        """
+        tests, that the options of CheckChecksumsClass after level are
+        keyword-only
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        checker = CheckChecksumsClass(['.'], None, None, 1024, 30, jobs=2)
+        self.assertEqual(checker.jobs, 2)
+        with self.assertRaises(TypeError):
+            CheckChecksumsClass(  # pylint: disable=too-many-function-args
+                ['.'], None, None, 1024, 30, 1)
+
+    def test_check_checksums_hash_files_directories(self):
+        """
+        tests, that CheckChecksumsClass with given hash files and
+        list_data_files lists every directory tree only once, also if hash
+        files are in subdirectories
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            directories = [os.path.join(tmpdir, 'd'),
+                           os.path.join(tmpdir, 'd', 'sub'),
+                           os.path.join(tmpdir, 'd-x')]
+            for directory in directories:
+                os.makedirs(directory)
+                with open(os.path.join(directory, 'a'), 'wb') as fd:
+                    fd.write(os.urandom(42))
+                CreateChecksumsClass(directories=[directory],
+                                     level=30).create_all()
+            for directory in directories:
+                # data file without hash
+                with open(os.path.join(directory, 'b'), 'wb') as fd:
+                    fd.write(os.urandom(42))
+            checker = CheckChecksumsClass(
+                level=30, list_data_files=1,
+                hash_files=[os.path.join(directory, '.checksum.sha512')
+                            for directory in reversed(directories)])
+            with self.assertLogs('pfu.check', level='INFO') as logs:
+                checker.check_all()
+            self.assertEqual(
+                sorted(record.args[0] for record in logs.records
+                       if record.msg.startswith('analyse directory tree')),
+                [directories[0], directories[2]])
+            self.assertEqual(
+                checker.result_number['data file without hash'], 3)
+            self.assertEqual(
+                checker.result_number['data file with matching hash(es)'], 3)
+
+    def test_check_checksums_repair_errors(self):
+        """
+        tests, that an OSError repairing a data file (e. g. a read-only data
+        file or a not readable replica) does not abort the check and the
+        data file is counted as not matching
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        def failing_open(filename, mode='r', **kwargs):
+            if (filename, mode) == (data_file, 'r+b'):
+                raise OSError(errno.EROFS, os.strerror(errno.EROFS),
+                              filename)
+            if (filename, mode) == (replica_file, 'rb'):
+                raise PermissionError(errno.EACCES,
+                                      os.strerror(errno.EACCES), filename)
+            return open(  # pylint: disable=unspecified-encoding
+                filename, mode, **kwargs)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tree = os.path.join(tmpdir, 'tree')
+            replica = os.path.join(tmpdir, 'replica')
+            os.mkdir(tree)
+            os.mkdir(replica)
+            for directory in [tree, replica]:
+                with open(os.path.join(directory, 'a'), 'wb') as fd:
+                    fd.write(42 * b'a')
+            CreateChecksumsClass(directories=[tree], chunk_size=7,
+                                 level=30).create_all()
+            with open(os.path.join(tree, 'a'), 'r+b') as fd:
+                fd.write(b'b')
+            for (data_file, replica_file) in [
+                    (os.path.join(tree, 'a'), None),
+                    (None, os.path.join(replica, 'a'))]:
+                checker = CheckChecksumsClass(directories=[tree],
+                                              level=30, repair=replica)
+                with unittest.mock.patch(
+                        'pfu_module.check_checksum.repair.open',
+                        failing_open, create=True), \
+                        self.assertLogs('pfu.check', level='WARNING') as logs:
+                    self.assertEqual(checker.check_all(), 0)
+                self.assertIn('cannot repair', '\n'.join(logs.output))
+                self.assertEqual(
+                    checker.result_number[
+                        'data file with not matching hash(es)'], 1)
+                self.assertEqual(
+                    checker.result_number['data file repaired'], 0)
+
+
+class ModuleHashEntries(unittest.TestCase):
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+    """
+
+    def test_hash_entries_merge(self):
+        """
+        tests HashEntries.merge with file names in both HashEntries (also
+        by rename) and with a hash, which is not a valid encoding
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        def sha256(data):
+            return hashlib.sha256(data).hexdigest()
+        kind = ('sha256', 'hex')
+        entries = HashEntries()
+        entries.add('a', sha256(b'a1'), kind, 'h1')
+        entries.add('b', sha256(b'b1'), kind, 'h1')
+        other = HashEntries()
+        other.add('a', sha256(b'a2'), kind, 'in other')
+        other.add('c', sha256(b'c2'), ('sha256', 'base64'), 'in other')
+        other.add('a', 'not a hash', kind, 'in other')
+        entries.merge(other, 'h2')
+        self.assertEqual(sorted(entries), ['a', 'b', 'c'])
+        self.assertEqual(entries['a'],
+                         [(sha256(b'a1'), kind, 'h1'),
+                          (sha256(b'a2'), kind, 'h2'),
+                          ('not a hash', kind, 'h2')])
+        self.assertEqual(entries['b'], [(sha256(b'b1'), kind, 'h1')])
+        self.assertEqual(entries['c'],
+                         [(sha256(b'c2'), ('sha256', 'base64'), 'h2')])
+        # merge again with renamed file names: 'c' collides with 'b'
+        entries.merge(other, 'h3',
+                      rename=lambda name: {'a': 'd', 'c': 'b'}[name])
+        self.assertEqual(sorted(entries), ['a', 'b', 'c', 'd'])
+        self.assertEqual(entries['b'],
+                         [(sha256(b'b1'), kind, 'h1'),
+                          (sha256(b'c2'), ('sha256', 'base64'), 'h3')])
+        self.assertEqual(entries['d'],
+                         [(sha256(b'a2'), kind, 'h3'),
+                          ('not a hash', kind, 'h3')])
+        # other is not changed
+        self.assertEqual(other['a'], [(sha256(b'a2'), kind, 'in other'),
+                                      ('not a hash', kind, 'in other')])
+
+    def test_hash_entries_merge_chunks(self):
+        """
+        tests HashEntries.merge for chunks with colliding file names
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        kind = ('md5', 'hex')
+        entries = HashEntries(chunks=True)
+        other = HashEntries(chunks=True)
+        for (hash_entries, hashfilename) in [(entries, 'h1'),
+                                             (other, 'in other')]:
+            for start in range(0, 21, 7):
+                hash_entries.add(
+                    'a', hashlib.md5(f'{hashfilename}{start}'.encode())
+                    .hexdigest(), kind, hashfilename, start, start + 6)
+        expected = entries['a'] + [
+            (hash_string, kind, 'h2', start, stop)
+            for (hash_string, _, _, start, stop) in other['a']]
+        entries.merge(other, 'h2')
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries['a'], expected)
+
+
+class ModuleHashFileIndex(unittest.TestCase):
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+    """
+
+    def test_hash_file_index(self):
+        """
+        tests, that HashFileIndex stores the parsed hashes as json and
+        handles a changed hash file or an index, which is not json (e. g.
+        pickle) or inconsistent, as not in the index
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            index_name = os.path.join(tmpdir, 'archive.pfuidx')
+            hash_file = os.path.join(tmpdir, '.checksum.md5')
+            with open(hash_file, 'w', encoding='utf-8') as fd:
+                fd.write('hashes\n')
+            hash_dicts = [HashEntries(chunks=True), HashEntries()]
+            hash_dicts[0].add('a', hashlib.md5(b'a').hexdigest(),
+                              ('md5', 'hex'), hash_file, 0, 6)
+            hash_dicts[1].add('a', hashlib.md5(b'a').hexdigest(),
+                              ('md5', 'hex'), hash_file)
+            hash_dicts[1].add('b', 'not a hash', ('md5', 'hex'), hash_file)
+            index = HashFileIndex(index_name)
+            index.put(hash_file, os.stat(hash_file), tmpdir, hash_dicts)
+            index.write()
+            with open(index_name, encoding='utf-8') as fd:
+                self.assertEqual(json.load(fd)['version'], 1)
+            index = HashFileIndex(index_name)
+            (directory, stored) = index.get(hash_file, os.stat(hash_file))
+            self.assertEqual(directory, tmpdir)
+            self.assertEqual([dict(hash_dict) for hash_dict in stored],
+                             [dict(hash_dict) for hash_dict in hash_dicts])
+            self.assertEqual(index.number_used, 1)
+            # changed hash file
+            os.utime(hash_file, ns=(0, 0))
+            self.assertIsNone(index.get(hash_file, os.stat(hash_file)))
+            # not json
+            with open(index_name, 'wb') as fd:
+                fd.write(b'\x80\x04\x95')
+            index = HashFileIndex(index_name)
+            self.assertIsNone(index.get(hash_file, os.stat(hash_file)))
+            # inconsistent
+            index.put(hash_file, os.stat(hash_file), tmpdir, hash_dicts)
+            index.write()
+            with open(index_name, encoding='utf-8') as fd:
+                data = json.load(fd)
+            for stored in data['hash files'].values():
+                stored[3][1]['index']['a'] = 42
+            with open(index_name, 'w', encoding='utf-8') as fd:
+                json.dump(data, fd)
+            index = HashFileIndex(index_name)
+            self.assertIsNone(index.get(hash_file, os.stat(hash_file)))
+            self.assertEqual(index.number_parsed, 1)
+
+
+class ModuleHashFileWriter(unittest.TestCase):
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+    """
+
+    def test_hash_file_writer(self):
+        """
+        tests, that HashFileWriter replaces an existing hash file, appends
+        to a hash file reopened after the least recently used one was
+        closed and leaves no temporary file after close
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            names = [os.path.join(tmpdir, f'{i}.sha512') for i in range(5)]
+            with open(names[0], 'w', encoding='utf-8') as fd:
+                fd.write('old hash\n')
+            writer = HashFileWriter(max_open_files=2)
+            for i in range(3):
+                for name in names:
+                    writer.write(name, [f'{name} {i}', f'{name} {i} chunk'])
+                # at most 2 are open, the others are already renamed
+                self.assertEqual(
+                    len([name for name in os.listdir(tmpdir)
+                         if name.endswith(TEMPORARY_EXTENSION)]), 2)
+            writer.close()
+            self.assertEqual(sorted(os.listdir(tmpdir)),
+                             sorted(os.path.basename(name)
+                                    for name in names))
+            self.assertEqual(writer.created, set(names))
+            for name in names:
+                with open(name, encoding='utf-8') as fd:
+                    self.assertEqual(
+                        fd.read(),
+                        ''.join(f'{name} {i}\n{name} {i} chunk\n'
+                                for i in range(3)))
+
+
+class ModuleJsonLinesSink(unittest.TestCase):
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+    """
+
+    def test_json_lines_sink(self):
+        """
+        tests writing records by JsonLinesSink
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        records = [{'file': f'file{i}', 'status': 'ok'} for i in range(42)]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_name = os.path.join(tmpdir, 'records.jsonl')
+            sink = JsonLinesSink(file_name, block_size=4, max_queued=2)
+            for record in records:
+                sink.write(record)
+            sink.close()
+            with open(file_name, encoding='utf-8') as records_file:
+                self.assertEqual(
+                    [json.loads(line) for line in records_file], records)
+
+    def test_json_lines_sink_error(self):
+        """
+        tests, that an exception in the thread of JsonLinesSink is raised
+        again by write and close
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_name = os.path.join(tmpdir, 'records.jsonl')
+            # a set is not serializable by json
+            sink = JsonLinesSink(file_name, block_size=1, max_queued=1)
+            sink.write({'bad_chunks': {(0, 1)}})
+            with self.assertRaises(TypeError):
+                # the bounded queue lets write wait for the thread
+                for _ in range(42):
+                    sink.write({'status': 'ok'})
+            with self.assertRaises(TypeError):
+                sink.close()
+            sink = JsonLinesSink(file_name)
+            sink.write({'bad_chunks': {(0, 1)}})
+            with self.assertRaises(TypeError):
+                sink.close()
+
+    def test_json_lines_sink_full_disk(self):
+        """
+        tests, that an error writing the output of JsonLinesSink is raised
+        by close
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        if not os.path.exists('/dev/full'):
+            self.skipTest('/dev/full not available')
+        sink = JsonLinesSink('/dev/full')
+        sink.write({'status': 'ok'})
+        with self.assertRaises(OSError):
+            sink.close()
+
+
+class ModuleRunJobs(unittest.TestCase):
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+    """
+
+    @staticmethod
+    def _recording_jobs(specs, events):
+        """
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+
+        :param specs: list of tuples (after, group) of the jobs
+        :param events: list to record (start, stop, index) of every job
+
+        :return: list of the jobs for run_jobs
+        """
+        lock = threading.Lock()
+
+        def function(index):
+            start = time.monotonic()
+            time.sleep(0.05)
+            with lock:
+                events.append((start, time.monotonic(), index))
+            return 0
+        return [{'cmd': f'job {index}', 'after': after, 'group': group,
+                 'step': 'copy',
+                 'function': lambda index=index: function(index)}
+                for (index, (after, group)) in enumerate(specs)]
+
+    def test_run_jobs_order(self):
+        """
+        tests, that run_jobs starts the jobs in the given order as far as
+        possible and a job only after the jobs it depends on
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        args = argparse.Namespace(
+            number_of_processes=1,
+            limit_number_of_processes_to_distinations=0,
+            extrasleeptime=0.0)
+        events = []
+        # job 1 waits for job 2, therefore job 2 is started before job 1
+        jobs = self._recording_jobs(
+            [([], None), ([2], None), ([], None), ([0, 1], None)], events)
+        (_, errors) = run_jobs(args, logging.getLogger('pfu.test'), jobs)
+        self.assertEqual(errors, {'copy': ""})
+        self.assertEqual([index for (_, _, index) in events], [0, 2, 1, 3])
+
+    def test_run_jobs_dependencies(self):
+        """
+        tests, that run_jobs runs jobs in parallel, but a job only after the
+        jobs it depends on and after the extra sleep time
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        args = argparse.Namespace(
+            number_of_processes=4,
+            limit_number_of_processes_to_distinations=0,
+            extrasleeptime=0.1)
+        events = []
+        specs = [([], None), ([], None), ([0], None), ([0, 1], None),
+                 ([2, 3], None)]
+        jobs = self._recording_jobs(specs, events)
+        (summary, _) = run_jobs(args, logging.getLogger('pfu.test'), jobs)
+        self.assertEqual(summary.count('terminated with 0'), len(jobs))
+        times = {index: (start, stop) for (start, stop, index) in events}
+        self.assertEqual(sorted(times), list(range(len(jobs))))
+        # the independent jobs 0 and 1 run in parallel
+        self.assertLess(times[1][0], times[0][1])
+        for (index, (after, _)) in enumerate(specs):
+            for k in after:
+                self.assertGreaterEqual(times[index][0] - times[k][1],
+                                        args.extrasleeptime)
+
+    def test_run_jobs_limit_to_destinations(self):
+        """
+        tests, that run_jobs runs at most one job of a group at a time, if
+        limit_number_of_processes_to_distinations is set
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        for limit in [0, 1]:
+            args = argparse.Namespace(
+                number_of_processes=4,
+                limit_number_of_processes_to_distinations=limit,
+                extrasleeptime=0.0)
+            events = []
+            specs = [([], 0), ([], 0), ([], 1), ([], 1), ([], None),
+                     ([], None)]
+            jobs = self._recording_jobs(specs, events)
+            run_jobs(args, logging.getLogger('pfu.test'), jobs)
+            times = {index: (start, stop) for (start, stop, index) in events}
+            self.assertEqual(sorted(times), list(range(len(jobs))))
+            overlapping = {
+                (i, j) for i in times for j in times
+                if (i < j) and (times[j][0] < times[i][1]) and
+                (times[i][0] < times[j][1])}
+            for group in [0, 1]:
+                same_group = tuple(i for (i, (_, g)) in enumerate(specs)
+                                   if g == group)
+                if limit == 0:
+                    self.assertIn(same_group, overlapping)
+                else:
+                    self.assertNotIn(same_group, overlapping)
+            # jobs without a group are not limited
+            self.assertIn((4, 5), overlapping)
+
+    def test_run_jobs_exception(self):
+        """
+        tests, that an exception of a function of a job is handled as
+        return code 1 by run_jobs
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        args = argparse.Namespace(
+            number_of_processes=2,
+            limit_number_of_processes_to_distinations=0,
+            extrasleeptime=0.0)
+
+        def raise_error():
+            raise OSError('no space left on device')
+        called = []
+        jobs = [{'cmd': 'raise', 'after': [], 'group': None,
+                 'step': 'create', 'function': raise_error},
+                {'cmd': 'after raise', 'after': [0], 'group': None,
+                 'step': 'check', 'function': lambda: called.append(1) or 0}]
+        with self.assertLogs('pfu.test', level='ERROR') as logs:
+            (summary, errors) = run_jobs(
+                args, logging.getLogger('pfu.test'), jobs)
+        self.assertIn('OSError: no space left on device', logs.output[0])
+        self.assertEqual(errors,
+                         {'create': "process 'raise' terminated with 1\n",
+                          'check': ""})
+        self.assertIn("process 'after raise' terminated with 0", summary)
+        self.assertEqual(called, [1])
+
+
+class ModuleScandirWalk(unittest.TestCase):
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+    """
+
+    def test_scandir_walk(self):
+        """
+        tests, that scandir_walk walks the same directories as os.walk and
+        gives the same files, also with symbolic links to directories and
+        files and with a broken symbolic link
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for dirpath in [os.path.join('a', 'b', 'c'), 'd', 'empty']:
+                os.makedirs(os.path.join(tmpdir, dirpath))
+            for filename in ['1', os.path.join('a', '2'),
+                             os.path.join('a', 'b', '3'),
+                             os.path.join('a', 'b', 'c', '4'),
+                             os.path.join('d', '5')]:
+                with open(os.path.join(tmpdir, filename), 'wb') as fd:
+                    fd.write(os.urandom(42))
+            os.symlink(os.path.join(tmpdir, 'a'),
+                       os.path.join(tmpdir, 'd', 'link_to_dir'))
+            os.symlink(os.path.join(tmpdir, '1'),
+                       os.path.join(tmpdir, 'a', 'link_to_file'))
+            os.symlink(os.path.join(tmpdir, 'missing'),
+                       os.path.join(tmpdir, 'broken_link'))
+            expected = [(dirpath, sorted(filenames))
+                        for (dirpath, _, filenames) in os.walk(tmpdir)]
+            walked = []
+            for (dirpath, entries) in scandir_walk(tmpdir):
+                for entry in entries:
+                    self.assertEqual(entry.path,
+                                     os.path.join(dirpath, entry.name))
+                walked.append(
+                    (dirpath, sorted(entry.name for entry in entries)))
+            self.assertEqual(walked, expected)
+            # the symbolic link to a directory is neither a file nor walked
+            self.assertIn((os.path.join(tmpdir, 'd'), ['5']), walked)
+            self.assertNotIn(os.path.join(tmpdir, 'd', 'link_to_dir'),
+                             [dirpath for (dirpath, _) in walked])
+            self.assertIn((tmpdir, ['1', 'broken_link']), walked)
+        # a not existing directory is skipped as by os.walk
+        self.assertEqual(list(scandir_walk(tmpdir)), [])
+
+
+class ModuleVerificationLedger(unittest.TestCase):
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+    """
+
+    def test_verification_ledger_write(self):
+        """
+        tests, that VerificationLedger.write removes only the data files in
+        the checked directories, which were not given to select, without
+        accessing a file
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ledger_name = os.path.join(tmpdir, 'archive.ledger')
+            names = [os.path.join(tmpdir, 'a', '1'),
+                     os.path.join(tmpdir, 'a', '2'),
+                     os.path.join(tmpdir, 'b', '1')]
+            for name in names:
+                os.makedirs(os.path.dirname(name), exist_ok=True)
+                with open(name, 'wb') as data_file:
+                    data_file.write(os.urandom(42))
+            ledger = VerificationLedger(ledger_name, 30)
+            self.assertEqual(ledger.select(names), set(names))
+            for name in names:
+                ledger.verified(name, True)
+            ledger.write([tmpdir])
+            for name in names[1:]:
+                os.remove(name)
+            ledger = VerificationLedger(ledger_name, 30)
+            ledger.select(names[0:1])
+            with unittest.mock.patch(
+                    'os.stat', side_effect=AssertionError('os.stat')):
+                # only the directory a is checked
+                ledger.write([os.path.join(tmpdir, 'a')])
+            with open(ledger_name, encoding='utf-8') as ledger_file:
+                self.assertEqual(sorted(json.load(ledger_file)['files']),
+                                 [names[0], names[2]])
+
+    def test_verification_ledger_stat_error(self):
+        """
+        tests, that VerificationLedger.select does not select a data file,
+        which cannot be accessed, and does not count it for the share
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ledger_name = os.path.join(tmpdir, 'archive.ledger')
+            names = [os.path.join(tmpdir, name) for name in 'abcde']
+            for name in names:
+                with open(name, 'wb') as data_file:
+                    data_file.write(os.urandom(42))
+            ledger = VerificationLedger(ledger_name, 30, now=0)
+            ledger.select(names)
+            for name in names:
+                ledger.verified(name, True)
+            ledger.write([tmpdir])
+            os.remove(names[0])
+            # a share of a quarter of the 4 existing data files
+            ledger = VerificationLedger(ledger_name, 30,
+                                        now=30 * 86400 / 4)
+            selected = ledger.select(names)
+            self.assertEqual(list(ledger.stat_errors), names[0:1])
+            self.assertIsInstance(ledger.stat_errors[names[0]],
+                                  FileNotFoundError)
+            self.assertNotIn(names[0], selected)
+            self.assertEqual(len(selected), 1)
+
+    def test_verification_ledger_sample(self):
+        """
+        tests, that a sample checked by CheckChecksumsClass does not write
+        the ledger (the time of the last run is kept)
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ledger_name = os.path.join(tmpdir, 'archive.ledger')
+            tree = os.path.join(tmpdir, 'tree')
+            os.mkdir(tree)
+            with open(os.path.join(tree, 'a'), 'wb') as data_file:
+                data_file.write(os.urandom(42))
+            CreateChecksumsClass(directories=[tree], chunk_size=7,
+                                 level=30).create_all()
+            for sample in [1.0, None]:
+                checker = CheckChecksumsClass(directories=[tree], level=30,
+                                              sample=sample,
+                                              ledger=ledger_name)
+                self.assertEqual(checker.check_all(), 0)
+                self.assertEqual(os.path.exists(ledger_name),
+                                 sample is None)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
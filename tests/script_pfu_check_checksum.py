@@ -399,6 +399,248 @@ class ScriptPfuCheckChecksum(unittest.TestCase):
                         timeout=42, check=True)
                     self.assertFalse(checkoutput(cpi.stderr))
 
+    def test_script_pfu_check_checksum_algorithms(self):
+        """
+        tests 'pfu check_checksum' with blake2 and sha3 hashes
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        for alg in ['blake2b', 'blake2s', 'sha3_224', 'sha3_256', 'sha3_384',
+                    'sha3_512']:
+            for coding in ['hex', 'base32', 'base64']:
+                with tempfile.TemporaryDirectory() as tmpdir:
+                    create_random_directory_tree(tmpdir, levels=1)
+                    param = '-algorithm ' + alg + ' -coding ' + coding
+                    param += ' -chunk_size 11 -dir ' + tmpdir
+                    subprocess.run(
+                        'pfu create_checksum ' + param,
+                        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                        shell=True,
+                        timeout=42, check=True)
+                    cpi = subprocess.run(
+                        'pfu check_checksum -loglevel 20 -dir ' + tmpdir,
+                        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                        shell=True,
+                        timeout=42, check=True)
+                    self.assertTrue(checkoutput(cpi.stderr), (alg, coding))
+
+    def test_script_pfu_check_checksum_b2sum(self):
+        """
+        tests 'pfu check_checksum' with hashes from b2sum
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        # check if b2sum is available
+        cpi = subprocess.run(
+            'b2sum --version',
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            shell=True,
+            timeout=42, check=False)
+        if cpi.returncode != 0:
+            self.skipTest('b2sum not available, skipping test')
+            return
+        # run test
+        for (option, hash_file_name) in [('', '.checksum.blake2b'),
+                                         ('--tag ', '.checksum')]:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                # create random data
+                create_random_directory_tree(tmpdir, levels=0)
+                # create checksums
+                param = '"' + '" "'.join(os.listdir(tmpdir)) + '"'
+                cpi = subprocess.run(
+                    'b2sum ' + option + '-- ' + param,
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    shell=True, cwd=tmpdir,
+                    timeout=42, check=True)
+                with open(os.path.join(tmpdir, hash_file_name),
+                          mode='w', encoding='utf-8') as fd:
+                    fd.write(cpi.stdout.decode())
+                # check checksums
+                cpi = subprocess.run(
+                    'pfu check_checksum -loglevel 20 -dir .',
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    shell=True, cwd=tmpdir,
+                    timeout=42, check=True)
+                self.assertTrue(checkoutput(cpi.stderr))
+
+    def test_script_pfu_check_checksum_use_mmap(self):
+        """
+        tests 'pfu check_checksum -use_mmap 1'
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            create_random_directory_tree(tmpdir, levels=2)
+            subprocess.run(
+                'pfu create_checksum -chunk_size 5 -dir ' + tmpdir,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True,
+                timeout=42, check=True)
+            param = '-loglevel 20 -use_mmap 1 -buf_size 3 -dir ' + tmpdir
+            cpi = subprocess.run(
+                'pfu check_checksum ' + param,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True,
+                timeout=42, check=True)
+            self.assertTrue(checkoutput(cpi.stderr))
+            for root, _, files in os.walk(tmpdir):
+                for filename in files:
+                    if not filename.startswith('.checksum'):
+                        create_random_file(os.path.join(root, filename))
+            cpi = subprocess.run(
+                'pfu check_checksum ' + param,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True,
+                timeout=42, check=True)
+            self.assertFalse(checkoutput(cpi.stderr))
+
+    def test_script_pfu_check_checksum_io_mode(self):
+        """
+        tests 'pfu check_checksum -io_mode'
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            create_random_directory_tree(tmpdir, levels=2)
+            # file larger than the buffer of DirectFile
+            with open(os.path.join(tmpdir, 'large'), 'wb') as fd:
+                fd.write(os.urandom(3 * 524288 + 4242))
+            subprocess.run(
+                'pfu create_checksum -chunk_size 100003 -dir ' + tmpdir,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True,
+                timeout=42, check=True)
+            for io_mode in ['buffered', 'sequential-dontneed', 'direct']:
+                param = '-loglevel 20 -io_mode ' + io_mode
+                param += ' -buf_size 4097 -dir ' + tmpdir
+                cpi = subprocess.run(
+                    'pfu check_checksum ' + param,
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    shell=True,
+                    timeout=42, check=True)
+                self.assertTrue(checkoutput(cpi.stderr))
+            with open(os.path.join(tmpdir, 'large'), 'r+b') as fd:
+                fd.seek(2 * 524288 + 23)
+                data = fd.read(1)
+                fd.seek(2 * 524288 + 23)
+                fd.write(bytes([255 - data[0]]))
+            cpi = subprocess.run(
+                'pfu check_checksum ' + param,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True,
+                timeout=42, check=True)
+            self.assertFalse(checkoutput(cpi.stderr))
+
+    def test_script_pfu_check_checksum_hardlinks(self):
+        """
+        tests 'pfu check_checksum' with hardlinked files
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.mkdir(os.path.join(tmpdir, 'sub'))
+            create_random_file(os.path.join(tmpdir, 'a'))
+            os.link(os.path.join(tmpdir, 'a'), os.path.join(tmpdir, 'b'))
+            os.link(os.path.join(tmpdir, 'a'),
+                    os.path.join(tmpdir, 'sub', 'c'))
+            subprocess.run(
+                'pfu create_checksum -chunk_size 7 -dir ' + tmpdir,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True,
+                timeout=42, check=True)
+            param = '-loglevel 20 -dir ' + tmpdir
+            cpi = subprocess.run(
+                'pfu check_checksum ' + param,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True,
+                timeout=42, check=True)
+            self.assertTrue(checkoutput(cpi.stderr))
+            self.assertIn(b'reads saved by hardlinks: 2', cpi.stderr)
+            # other hash for one hardlink
+            hash_file_name = os.path.join(tmpdir, 'sub', '.checksum.sha512')
+            with open(hash_file_name, encoding='utf-8') as fd:
+                lines = fd.readlines()
+            lines[0] = ('A' if lines[0][0] != 'A' else 'B') + lines[0][1:]
+            with open(hash_file_name, 'w', encoding='utf-8') as fd:
+                fd.writelines(lines)
+            cpi = subprocess.run(
+                'pfu check_checksum ' + param,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True,
+                timeout=42, check=True)
+            self.assertIn(b'data file with matching hash(es): 2', cpi.stderr)
+            self.assertIn(b'data file with not matching hash(es): 1',
+                          cpi.stderr)
+            # data of every hardlink changed
+            with open(os.path.join(tmpdir, 'b'), 'r+b') as fd:
+                data = fd.read(1)
+                fd.seek(0)
+                fd.write(bytes([255 - data[0]]))
+            cpi = subprocess.run(
+                'pfu check_checksum ' + param,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True,
+                timeout=42, check=True)
+            self.assertIn(b'data file with matching hash(es): 0', cpi.stderr)
+            self.assertIn(b'data file with not matching hash(es): 3',
+                          cpi.stderr)
+
+    def test_script_pfu_check_checksum_overlapping_chunks(self):
+        """
+        tests 'pfu check_checksum' with overlapping chunks of several hash
+        files
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, 'data'), 'wb') as fd:
+                fd.write(os.urandom(1000))
+            create_random_file(os.path.join(tmpdir, 'small'))
+            for (prefix, param) in [('.c7', '-chunk_size 7'),
+                                    ('.c13', '-chunk_size 13'),
+                                    ('.c7again', '-chunk_size 7'),
+                                    ('.c7b', '-chunk_size 7 -coding base16'),
+                                    ('.c100', '-chunk_size 100 '
+                                     '-algorithm sha256'),
+                                    ('.c999', '-chunk_size 999'),
+                                    ('.c1000', '-chunk_size 1000')]:
+                subprocess.run(
+                    'pfu create_checksum -hash_file_prefix ' + prefix +
+                    ' ' + param + ' -dir ' + tmpdir,
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    shell=True,
+                    timeout=42, check=True)
+            param = '-loglevel 20 -dir ' + tmpdir
+            cpi = subprocess.run(
+                'pfu check_checksum ' + param,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True,
+                timeout=42, check=True)
+            self.assertTrue(checkoutput(cpi.stderr))
+            for position in [0, 499, 999]:
+                with open(os.path.join(tmpdir, 'data'), 'r+b') as fd:
+                    fd.seek(position)
+                    data = fd.read(1)
+                    fd.seek(position)
+                    fd.write(bytes([255 - data[0]]))
+                cpi = subprocess.run(
+                    'pfu check_checksum ' + param,
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    shell=True,
+                    timeout=42, check=True)
+                self.assertFalse(checkoutput(cpi.stderr))
+                self.assertIn(b'data file with not matching hash(es): 1',
+                              cpi.stderr)
+                with open(os.path.join(tmpdir, 'data'), 'r+b') as fd:
+                    fd.seek(position)
+                    fd.write(data)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
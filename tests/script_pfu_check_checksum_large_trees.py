@@ -0,0 +1,266 @@
+"""
+:Author: Daniel Mohr
+:Email: daniel.mohr@dlr.de
+:Date: 2026-10-18
+:License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+tests the options of 'pfu check_checksum' for large directory trees
+(-jobs, -stream, -index and -hash_file)
+
+You can run this file directly::
+
+  env python3 script_pfu_check_checksum_large_trees.py
+
+  pytest-3 script_pfu_check_checksum_large_trees.py
+
+Or you can run only one test, e. g.::
+
+  env python3 script_pfu_check_checksum_large_trees.py \
+    ScriptPfuCheckChecksumLargeTrees.test_script_pfu_check_checksum_jobs
+
+  pytest-3 -k test_script_pfu_check_checksum_jobs \
+    script_pfu_check_checksum_large_trees.py
+"""
+
+import os
+import subprocess
+import tempfile
+import unittest
+
+try:
+    from .create_random_directory_tree import create_random_file
+    from .create_random_directory_tree import create_random_directory_tree
+    from .checkoutput_check_checksum import checkoutput
+except (ModuleNotFoundError, ImportError):
+    from create_random_directory_tree import create_random_file
+    from create_random_directory_tree import create_random_directory_tree
+    from checkoutput_check_checksum import checkoutput
+
+
+class ScriptPfuCheckChecksumLargeTrees(unittest.TestCase):
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+    """
+    # pylint: disable=invalid-name
+
+    def test_script_pfu_check_checksum_jobs(self):
+        """
+        tests 'pfu check_checksum -jobs'
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        def sorted_messages(output):
+            # log lines without time stamp and thread in sorted order
+            return sorted(line.split(' ', 3)[3]
+                          for line in output.decode().splitlines()
+                          if 'started as/with' not in line)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            create_random_directory_tree(tmpdir, levels=3)
+            for i in range(3):
+                with open(os.path.join(tmpdir, f'large{i}'), 'wb') as fd:
+                    fd.write(os.urandom(i * 100003))
+            os.link(os.path.join(tmpdir, 'large2'),
+                    os.path.join(tmpdir, 'large3'))
+            subprocess.run(
+                'pfu create_checksum -chunk_size 4242 -dir ' + tmpdir,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True,
+                timeout=42, check=True)
+            for change in [False, True]:
+                if change:
+                    with open(os.path.join(tmpdir, 'large1'), 'r+b') as fd:
+                        data = fd.read(1)
+                        fd.seek(0)
+                        fd.write(bytes([255 - data[0]]))
+                outputs = {}
+                for jobs in [1, 4, 0]:
+                    cpi = subprocess.run(
+                        'pfu check_checksum -loglevel 15 -jobs ' +
+                        str(jobs) + ' -dir ' + tmpdir,
+                        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                        shell=True,
+                        timeout=42, check=True)
+                    self.assertEqual(checkoutput(cpi.stderr), not change)
+                    outputs[jobs] = sorted_messages(cpi.stderr)
+                self.assertEqual(outputs[4], outputs[1])
+                self.assertEqual(outputs[0], outputs[1])
+
+    def test_script_pfu_check_checksum_stream(self):
+        """
+        tests 'pfu check_checksum -stream'
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        def sorted_messages(output):
+            # log lines without time stamp and thread in sorted order
+            return sorted(line.split(' ', 3)[3]
+                          for line in output.decode().splitlines()
+                          if 'started as/with' not in line)
+        for store in ['dir', 'single', 'many']:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                create_random_directory_tree(tmpdir, levels=3)
+                subprocess.run(
+                    'pfu create_checksum -chunk_size 23 -store ' + store +
+                    ' -dir .',
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    shell=True, cwd=tmpdir,
+                    timeout=42, check=True)
+                for change in [False, True]:
+                    if change:
+                        # changed, new and removed data files
+                        data_files = sorted(
+                            os.path.join(root, filename)
+                            for (root, _, files) in os.walk(tmpdir)
+                            for filename in files
+                            if not filename.startswith('.checksum') and
+                            not filename.endswith('.sha512'))
+                        create_random_file(data_files[0])
+                        os.remove(data_files[-1])
+                        create_random_file(os.path.join(tmpdir, 'new'))
+                    outputs = {}
+                    for stream in [0, 1]:
+                        cpi = subprocess.run(
+                            'pfu check_checksum -loglevel 15 -stream ' +
+                            str(stream) + ' -dir .',
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            shell=True, cwd=tmpdir,
+                            timeout=42, check=True)
+                        self.assertEqual(checkoutput(cpi.stderr), not change)
+                        outputs[stream] = sorted_messages(cpi.stderr)
+                    self.assertEqual(outputs[1], outputs[0])
+
+    def test_script_pfu_check_checksum_index(self):
+        """
+        tests 'pfu check_checksum -index'
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        def messages(output):
+            # log lines without time stamp, thread and index statistics
+            return sorted(line.split(' ', 3)[3]
+                          for line in output.decode().splitlines()
+                          if ('started as/with' not in line) and
+                          ('hash files from index' not in line))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            index = os.path.join(tmpdir, 'index.pfuidx')
+            tree = os.path.join(tmpdir, 'tree')
+            os.mkdir(tree)
+            create_random_directory_tree(tree, levels=2)
+            subprocess.run(
+                'pfu create_checksum -chunk_size 23 -store many -dir .',
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True, cwd=tree,
+                timeout=42, check=True)
+            hash_files = sorted(
+                os.path.join(root, filename)
+                for (root, _, files) in os.walk(tree)
+                for filename in files if filename.endswith('.sha512'))
+            cpi = subprocess.run(
+                'pfu check_checksum -loglevel 15 -dir .',
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True, cwd=tree,
+                timeout=42, check=True)
+            self.assertTrue(checkoutput(cpi.stderr))
+            expected = messages(cpi.stderr)
+            # parse, use the index and use it from another directory
+            for (cwd, directory, used) in [(tree, '.', 0),
+                                           (tree, '.', len(hash_files)),
+                                           (tmpdir, 'tree',
+                                            len(hash_files))]:
+                cpi = subprocess.run(
+                    'pfu check_checksum -loglevel 15 -dir ' + directory +
+                    ' -index ' + index,
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    shell=True, cwd=cwd,
+                    timeout=42, check=True)
+                self.assertTrue(checkoutput(cpi.stderr))
+                self.assertIn(
+                    f'hash files from index: {used}, hash files parsed: '
+                    f'{len(hash_files) - used}', cpi.stderr.decode())
+                if directory == '.':
+                    self.assertEqual(messages(cpi.stderr), expected)
+                else:
+                    # the same data files are checked
+                    self.assertEqual(
+                        [line for line in messages(cpi.stderr)
+                         if 'matching hash(es):' in line],
+                        [line for line in expected
+                         if 'matching hash(es):' in line])
+            # a changed hash file is parsed again
+            with open(hash_files[0], encoding='utf-8') as hash_file:
+                lines = hash_file.readlines()
+            lines[0] = '0' * 128 + lines[0][128:]
+            with open(hash_files[0], 'w', encoding='utf-8') as hash_file:
+                hash_file.writelines(lines)
+            cpi = subprocess.run(
+                'pfu check_checksum -loglevel 15 -dir . -index ' + index,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True, cwd=tree,
+                timeout=42, check=True)
+            self.assertFalse(checkoutput(cpi.stderr))
+            self.assertIn(
+                f'hash files from index: {len(hash_files) - 1}, '
+                'hash files parsed: 1', cpi.stderr.decode())
+
+    def test_script_pfu_check_checksum_hash_file(self):
+        """
+        tests 'pfu check_checksum -hash_file'
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        def messages(output):
+            # log lines without time stamp, thread and the listed directory
+            return sorted(line.split(' ', 3)[3]
+                          for line in output.decode().splitlines()
+                          if ('started as/with' not in line) and
+                          ('analyse' not in line))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            create_random_directory_tree(tmpdir, levels=2)
+            subprocess.run(
+                'pfu create_checksum -chunk_size 23 -store single -dir .',
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True, cwd=tmpdir,
+                timeout=42, check=True)
+            for change in [False, True]:
+                if change:
+                    # changed, new and removed data files
+                    data_files = sorted(
+                        os.path.join(root, filename)
+                        for (root, _, files) in os.walk(tmpdir)
+                        for filename in files
+                        if not filename.startswith('.checksum'))
+                    create_random_file(data_files[0])
+                    os.remove(data_files[-1])
+                    create_random_file(os.path.join(tmpdir, 'new'))
+                outputs = {}
+                for parameter in ['-dir .', '-hash_file .checksum.sha512',
+                                  '-hash_file .checksum.sha512 ' +
+                                  '-list_data_files 1']:
+                    cpi = subprocess.run(
+                        'pfu check_checksum -loglevel 15 ' + parameter,
+                        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                        shell=True, cwd=tmpdir,
+                        timeout=42, check=True)
+                    self.assertEqual(checkoutput(cpi.stderr), not change)
+                    outputs[parameter] = messages(cpi.stderr)
+                self.assertEqual(
+                    outputs['-hash_file .checksum.sha512 -list_data_files 1'],
+                    outputs['-dir .'])
+                # without listing the new file is not found
+                self.assertEqual(
+                    [line for line in outputs['-dir .']
+                     if ('"new"' not in line) and
+                     ('data file without hash' not in line)],
+                    [line for line in outputs['-hash_file .checksum.sha512']
+                     if 'data file without hash' not in line])
+                self.assertIn('INFO data file without hash: 0',
+                              outputs['-hash_file .checksum.sha512'])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
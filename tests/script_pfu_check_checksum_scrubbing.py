@@ -0,0 +1,329 @@
+"""
+:Author: Daniel Mohr
+:Email: daniel.mohr@dlr.de
+:Date: 2026-10-18
+:License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
+
+tests the options of 'pfu check_checksum' for regular scrubbing
+(-sample, -ledger, -jsonl and -repair)
+
+You can run this file directly::
+
+  env python3 script_pfu_check_checksum_scrubbing.py
+
+  pytest-3 script_pfu_check_checksum_scrubbing.py
+
+Or you can run only one test, e. g.::
+
+  env python3 script_pfu_check_checksum_scrubbing.py \
+    ScriptPfuCheckChecksumScrubbing.test_script_pfu_check_checksum_sample
+
+  pytest-3 -k test_script_pfu_check_checksum_sample \
+    script_pfu_check_checksum_scrubbing.py
+"""
+
+import json
+import math
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+try:
+    from .create_random_directory_tree import create_random_file
+    from .create_random_directory_tree import create_random_directory_tree
+    from .checkoutput_check_checksum import checkoutput
+except (ModuleNotFoundError, ImportError):
+    from create_random_directory_tree import create_random_file
+    from create_random_directory_tree import create_random_directory_tree
+    from checkoutput_check_checksum import checkoutput
+
+
+class ScriptPfuCheckChecksumScrubbing(unittest.TestCase):
+    """
+    :Author: Daniel Mohr
+    :Date: 2026-10-18
+    """
+    # pylint: disable=invalid-name
+
+    def test_script_pfu_check_checksum_sample(self):
+        """
+        tests 'pfu check_checksum -sample'
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        def sampled(output):
+            # log lines of the sampled chunks
+            return [line.split(' ', 3)[3]
+                    for line in output.decode().splitlines()
+                    if ' bytes ' in line]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            create_random_directory_tree(tmpdir, levels=2)
+            subprocess.run(
+                'pfu create_checksum -chunk_size 5 -store many -dir .',
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True, cwd=tmpdir,
+                timeout=42, check=True)
+            outputs = {}
+            for sample in ['1', '0.25', '0.25', '-sample_bytes 100']:
+                if not sample.startswith('-'):
+                    sample = '-sample ' + sample
+                cpi = subprocess.run(
+                    'pfu check_checksum -loglevel 15 -seed 42 ' + sample +
+                    ' -dir .',
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    shell=True, cwd=tmpdir,
+                    timeout=42, check=True)
+                self.assertIn('sampled chunks with not matching hash: 0',
+                              cpi.stderr.decode())
+                self.assertIn('with a confidence of 95 %',
+                              cpi.stderr.decode())
+                if sample in outputs:
+                    # reproducible by the seed
+                    self.assertEqual(sampled(cpi.stderr), outputs[sample])
+                outputs[sample] = sampled(cpi.stderr)
+            self.assertLess(len(outputs['-sample 0.25']),
+                            len(outputs['-sample 1']))
+            self.assertTrue(set(outputs['-sample 0.25']) <=
+                            set(outputs['-sample 1']))
+            # every chunk of a corrupted file is found with -sample 1
+            data_files = sorted(
+                os.path.join(root, filename)
+                for (root, _, files) in os.walk(tmpdir)
+                for filename in files if not filename.endswith('.sha512'))
+            with open(data_files[0], 'r+b') as data_file:
+                data = bytearray(data_file.read(7))
+                data[6] ^= 1
+                data_file.seek(0)
+                data_file.write(data)
+            cpi = subprocess.run(
+                'pfu check_checksum -loglevel 15 -sample 1 -dir .',
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True, cwd=tmpdir,
+                timeout=42, check=True)
+            self.assertIn('sampled chunks with not matching hash: 1',
+                          cpi.stderr.decode())
+            self.assertIn(
+                os.path.relpath(data_files[0], tmpdir) +
+                '" bytes 5 - 9: bad, hash mismatch', cpi.stderr.decode())
+
+    def test_script_pfu_check_checksum_ledger(self):
+        """
+        tests 'pfu check_checksum -ledger' with and without '-stream 1'
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        for stream in ['0', '1']:
+            with self.subTest(stream=stream):
+                self._check_ledger(stream)
+
+    def _check_ledger(self, stream):
+        """
+        tests 'pfu check_checksum -ledger' in a directory tree with
+        subdirectories; the share of a run is for all data files of the
+        tree (not for every directory)
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        def count(output, message):
+            # number given in the summary line with the message
+            for line in output.decode().splitlines():
+                if message + ':' in line:
+                    return int(line.rsplit(' ', 1)[1])
+            return None
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ledger = os.path.join(tmpdir, 'archive.ledger')
+            tree = os.path.join(tmpdir, 'tree')
+            os.mkdir(tree)
+            create_random_directory_tree(tree, number_dirs=3, levels=1)
+            subprocess.run(
+                'pfu create_checksum -store many -dir .',
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True, cwd=tree,
+                timeout=42, check=True)
+            data_files = sorted(
+                os.path.join(root, filename)
+                for (root, _, files) in os.walk(tree)
+                for filename in files if not filename.endswith('.sha512'))
+            command = 'pfu check_checksum -loglevel 15 -dir . -ledger ' + \
+                ledger + ' -reverify_days 3 -stream ' + stream
+            # first run: every data file, second run: at least 1
+            for expected in [len(data_files), 1]:
+                cpi = subprocess.run(
+                    command,
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    shell=True, cwd=tree,
+                    timeout=42, check=True)
+                self.assertTrue(checkoutput(cpi.stderr))
+                self.assertEqual(
+                    count(cpi.stderr, 'data file with matching hash(es)'),
+                    expected)
+                self.assertEqual(
+                    count(cpi.stderr,
+                          'data file verified recently (skipped)'),
+                    len(data_files) - expected)
+            # about one day after the last run: a third of the data files
+            with open(ledger, encoding='utf-8') as ledger_file:
+                content = json.load(ledger_file)
+            content['last run'] -= 86400 - 60
+            with open(ledger, 'w', encoding='utf-8') as ledger_file:
+                json.dump(content, ledger_file)
+            cpi = subprocess.run(
+                command,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True, cwd=tree,
+                timeout=42, check=True)
+            self.assertEqual(
+                count(cpi.stderr, 'data file with matching hash(es)'),
+                math.ceil(len(data_files) / 3))
+            # a changed data file is always verified
+            create_random_file(data_files[0])
+            for expected in [1, 1]:  # not matching, therefore again
+                cpi = subprocess.run(
+                    command,
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    shell=True, cwd=tree,
+                    timeout=42, check=True)
+                self.assertEqual(
+                    count(cpi.stderr, 'data file with not matching hash(es)'),
+                    expected)
+                self.assertIn(
+                    os.path.relpath(data_files[0], tree) + '" ',
+                    ''.join(line for line in cpi.stderr.decode().splitlines()
+                            if 'bad, hash mismatch' in line))
+
+    def test_script_pfu_check_checksum_jsonl(self):
+        """
+        tests 'pfu check_checksum -jsonl'
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            jsonl = os.path.join(tmpdir, 'results.jsonl')
+            tree = os.path.join(tmpdir, 'tree')
+            os.mkdir(tree)
+            create_random_directory_tree(tree, levels=1)
+            subprocess.run(
+                'pfu create_checksum -chunk_size 5 -store many -dir .',
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True, cwd=tree,
+                timeout=42, check=True)
+            data_files = sorted(
+                os.path.relpath(os.path.join(root, filename), tree)
+                for (root, _, files) in os.walk(tree)
+                for filename in files if not filename.endswith('.sha512'))
+            # a bad chunk, a new and a removed data file
+            with open(os.path.join(tree, data_files[0]), 'r+b') as data_file:
+                data = bytearray(data_file.read(12))
+                data[11] ^= 1
+                data_file.seek(0)
+                data_file.write(data)
+            create_random_file(os.path.join(tree, 'new'))
+            os.remove(os.path.join(tree, data_files[-1]))
+            for parameter in ['-jsonl ' + jsonl, '-jsonl - -jobs 2']:
+                cpi = subprocess.run(
+                    'pfu check_checksum -dir . ' + parameter,
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    shell=True, cwd=tree,
+                    timeout=42, check=True)
+                if parameter.startswith('-jsonl -'):
+                    lines = cpi.stdout.decode().splitlines()
+                else:
+                    with open(jsonl, encoding='utf-8') as jsonl_file:
+                        lines = jsonl_file.readlines()
+                records = {record['file']: record
+                           for record in map(json.loads, lines)}
+                self.assertEqual(len(records), len(lines))
+                self.assertEqual(
+                    sorted(records),
+                    sorted(data_files + ['new']))
+                self.assertEqual(records[data_files[0]]['status'], 'bad')
+                self.assertEqual(records[data_files[0]]['bad_chunks'],
+                                 [[10, 14]])
+                self.assertEqual(records[data_files[-1]]['status'],
+                                 'missing')
+                self.assertEqual(records['new']['status'], 'no hash')
+                for filename in data_files[1:-1]:
+                    self.assertEqual(records[filename]['status'], 'ok')
+                    self.assertEqual(records[filename]['bytes_read'],
+                                     records[filename]['size'])
+                    self.assertEqual(records[filename]['hashes'], 1)
+                    self.assertEqual(
+                        records[filename]['chunk_hashes'],
+                        math.ceil(records[filename]['size'] / 5))
+
+    def test_script_pfu_check_checksum_repair(self):
+        """
+        tests 'pfu check_checksum -repair'
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        def flip(filename, position):
+            # change one bit in the file
+            with open(filename, 'r+b') as data_file:
+                data_file.seek(position)
+                data = bytearray(data_file.read(1))
+                data[0] ^= 1
+                data_file.seek(position)
+                data_file.write(data)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tree = os.path.join(tmpdir, 'tree')
+            replica = os.path.join(tmpdir, 'replica')
+            os.mkdir(tree)
+            create_random_directory_tree(tree, levels=1)
+            subprocess.run(
+                'pfu create_checksum -chunk_size 5 -store many -dir tree',
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True, cwd=tmpdir,
+                timeout=42, check=True)
+            shutil.copytree(tree, replica)
+            data_files = sorted(
+                os.path.relpath(os.path.join(root, filename), tmpdir)
+                for (root, _, files) in os.walk(tree)
+                for filename in files if not filename.endswith('.sha512'))
+            flip(os.path.join(tmpdir, data_files[0]), 1)
+            flip(os.path.join(tmpdir, data_files[0]), 12)
+            # the replica is bad in the same chunk of the second file
+            flip(os.path.join(tmpdir, data_files[1]), 3)
+            flip(os.path.join(replica,
+                              os.path.relpath(data_files[1], 'tree')), 4)
+            cpi = subprocess.run(
+                'pfu check_checksum -loglevel 15 -dir tree -repair replica',
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True, cwd=tmpdir,
+                timeout=42, check=True)
+            output = cpi.stderr.decode()
+            for (start, stop) in [(0, 4), (10, 14)]:
+                self.assertIn(
+                    f'file "{data_files[0]}" bytes {start} - {stop}: bad, '
+                    'hash mismatch', output)
+            self.assertIn(f'file "{data_files[0]}" bytes 0 - 4: copied',
+                          output)
+            self.assertIn(f'file "{data_files[1]}" bytes 0 - 4: cannot '
+                          'repair, hash mismatch in replica', output)
+            self.assertIn('data file repaired: 1', output)
+            self.assertIn('data file with not matching hash(es): 1', output)
+            with open(os.path.join(tmpdir, data_files[0]), 'rb') as data, \
+                    open(os.path.join(replica, os.path.relpath(
+                        data_files[0], 'tree')), 'rb') as replica_data:
+                self.assertEqual(data.read(), replica_data.read())
+            cpi = subprocess.run(
+                'pfu check_checksum -loglevel 15 -dir tree',
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True, cwd=tmpdir,
+                timeout=42, check=True)
+            self.assertIn('data file with not matching hash(es): 1',
+                          cpi.stderr.decode())
+            self.assertIn(f'file "{data_files[1]}"', ''.join(
+                line for line in cpi.stderr.decode().splitlines()
+                if 'bad, hash mismatch' in line))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -23,10 +23,16 @@ Or you can run only one test, e. g.::
 
 import os.path
 import random
+import shutil
 import subprocess
 import tempfile
 import unittest
 
+try:
+    from .create_random_directory_tree import create_random_directory_tree
+except (ModuleNotFoundError, ImportError):
+    from create_random_directory_tree import create_random_directory_tree
+
 
 def create_random_file(filename):
     # pylint: disable=missing-docstring
@@ -184,6 +190,301 @@ class ScriptPfuCreateChecksum(unittest.TestCase):
                 'qILwrISLC2tMp7Qr+h0mav0N3rqSBK5XqYSmk3bVmBax7z9NRC6opwOWBn/'
                 '1tw4K6Oqzk1the442bY41w7/hTA==  foo (bytes 2 - 2)\n')
 
+    def test_script_pfu_create_checksum_jobs(self):
+        """
+        tests 'pfu create_checksum -jobs' and 'pfu create_checksum -chunk_jobs'
+        and other parameters, which should not change the hash files
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_dir = os.path.join(tmpdir, 'data')
+            os.mkdir(data_dir)
+            create_random_directory_tree(data_dir, levels=3)
+            dirs = []
+            for param in ['-jobs 1', '-jobs 4', '-jobs 0',
+                          '-jobs 4 -pool process', '-chunk_jobs 3',
+                          '-jobs 2 -chunk_jobs 4', '-use_mmap 1',
+                          '-io_mode sequential-dontneed', '-io_mode direct',
+                          '-io_mode direct -chunk_jobs 3']:
+                dirs.append(os.path.join(tmpdir, str(len(dirs))))
+                shutil.copytree(data_dir, dirs[-1])
+                param += ' -chunk_size 7 -buf_size 3 -dir ' + dirs[-1]
+                subprocess.run(
+                    'pfu create_checksum ' + param,
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    shell=True,
+                    timeout=42, check=True)
+            for root, _, files in os.walk(dirs[0]):
+                for filename in files:
+                    if not filename.endswith('.sha512'):
+                        continue
+                    with open(os.path.join(root, filename), 'rb') as fd:
+                        expected = fd.read()
+                    self.assertGreater(len(expected), 0)
+                    relpath = os.path.relpath(root, dirs[0])
+                    for other in dirs[1:]:
+                        with open(os.path.join(other, relpath, filename),
+                                  'rb') as fd:
+                            self.assertEqual(fd.read(), expected)
+
+    def test_script_pfu_create_checksum_chunk_jobs(self):
+        """
+        tests, that 'pfu create_checksum -chunk_jobs n' creates the same hash
+        files as 'pfu create_checksum -chunk_jobs 1' for files with a partial
+        last chunk
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_dir = os.path.join(tmpdir, 'data')
+            os.mkdir(data_dir)
+            # chunk size 7: the last chunk has 1 to 6 Bytes or is complete
+            sizes = [8, 13, 14, 15, 7 * 42 + 1, 7 * 42 + 6, 1000]
+            for size in sizes:
+                with open(os.path.join(data_dir, str(size)), 'wb') as fd:
+                    fd.write(os.urandom(size))
+            dirs = []
+            for param in ['-chunk_jobs 1', '-chunk_jobs 2', '-chunk_jobs 3',
+                          '-chunk_jobs 5 -buf_size 3',
+                          '-chunk_jobs 4 -io_mode direct']:
+                dirs.append(os.path.join(tmpdir, str(len(dirs))))
+                shutil.copytree(data_dir, dirs[-1])
+                param += ' -chunk_size 7 -dir ' + dirs[-1]
+                subprocess.run(
+                    'pfu create_checksum ' + param,
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    shell=True,
+                    timeout=42, check=True)
+            with open(os.path.join(dirs[0], '.checksum.sha512'), 'rb') as fd:
+                expected = fd.read()
+            for size in sizes:
+                # last chunk
+                self.assertIn(
+                    f'  {size} (bytes {7 * ((size - 1) // 7)} - '
+                    f'{size - 1})\n'.encode(), expected)
+            for other in dirs[1:]:
+                with open(os.path.join(other, '.checksum.sha512'),
+                          'rb') as fd:
+                    self.assertEqual(fd.read(), expected)
+
+    def test_script_pfu_create_checksum_algorithms(self):
+        """
+        tests 'pfu create_checksum' with more than one algorithm
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_dir = os.path.join(tmpdir, 'data')
+            os.mkdir(data_dir)
+            create_random_directory_tree(data_dir, levels=2)
+            dirs = []
+            for param in ['-algorithm md5 sha256 sha512',
+                          '-algorithm md5 sha256 sha512 -chunk_jobs 2',
+                          '-algorithm md5', '-algorithm sha256',
+                          '-algorithm sha512']:
+                if len(dirs) < 3:
+                    dirs.append(os.path.join(tmpdir, str(len(dirs))))
+                    shutil.copytree(data_dir, dirs[-1])
+                param += ' -chunk_size 7 -dir ' + dirs[-1]
+                subprocess.run(
+                    'pfu create_checksum ' + param,
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    shell=True,
+                    timeout=42, check=True)
+            for root, _, files in os.walk(dirs[2]):
+                for filename in files:
+                    if not filename.startswith('.checksum.'):
+                        continue
+                    with open(os.path.join(root, filename), 'rb') as fd:
+                        expected = fd.read()
+                    self.assertGreater(len(expected), 0)
+                    relpath = os.path.relpath(root, dirs[2])
+                    for other in dirs[:2]:
+                        with open(os.path.join(other, relpath, filename),
+                                  'rb') as fd:
+                            self.assertEqual(fd.read(), expected)
+
+    def test_script_pfu_create_checksum_algorithm_auto(self):
+        """
+        tests 'pfu create_checksum -algorithm auto'
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            create_random_directory_tree(tmpdir, levels=1)
+            for security_floor in ['128', '256']:
+                subprocess.run(
+                    'pfu create_checksum -algorithm auto -security_floor ' +
+                    security_floor + ' -create_only_missing 0 -dir ' + tmpdir,
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    shell=True,
+                    timeout=42, check=True)
+                hash_files = [filename for filename in os.listdir(tmpdir)
+                              if filename.startswith('.checksum.')]
+                self.assertEqual(len(hash_files), 1)
+                algorithm = hash_files[0].split('.')[-1]
+                if security_floor == '128':
+                    self.assertIn(algorithm, ['sha256', 'sha512', 'blake2b',
+                                              'blake2s', 'sha3_256',
+                                              'sha3_384', 'sha3_512'])
+                else:
+                    self.assertIn(algorithm,
+                                  ['sha512', 'blake2b', 'sha3_512'])
+                os.remove(os.path.join(tmpdir, hash_files[0]))
+
+    def test_script_pfu_create_checksum_update(self):
+        """
+        tests 'pfu create_checksum -create_only_missing 2'
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        def read_hash_files(root_dir):
+            hashes = {}
+            for root, _, files in os.walk(root_dir):
+                for filename in files:
+                    # .checksum.<alg> or <data file>.<alg>
+                    if os.path.splitext(filename)[1] in ['.md5', '.sha512']:
+                        with open(os.path.join(root, filename),
+                                  encoding='utf-8') as fd:
+                            hashes[os.path.join(
+                                os.path.relpath(root, root_dir),
+                                filename)] = sorted(fd.readlines())
+            return hashes
+        for param in ['-store dir', '-store single', '-store dir -jobs 2',
+                      '-store dir -algorithm md5 sha512', '-store many',
+                      '-store many -jobs 2']:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                data_dir = os.path.join(tmpdir, 'data')
+                os.mkdir(data_dir)
+                os.mkdir(os.path.join(data_dir, 'sub'))
+                for filename in ['a', 'b', 'c', os.path.join('sub', 'd')]:
+                    create_random_file(os.path.join(data_dir, filename))
+                cmd = 'cd ' + data_dir + ' && pfu create_checksum -dir . '
+                cmd += param + ' -chunk_size 7'
+                subprocess.run(
+                    cmd + ' -create_only_missing 2',
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    shell=True,
+                    timeout=42, check=True)
+                first = read_hash_files(data_dir)
+                self.assertGreater(len(first), 0)
+                # change data
+                with open(os.path.join(data_dir, 'a'), 'ab') as fd:
+                    fd.write(b'changed')
+                os.remove(os.path.join(data_dir, 'b'))
+                os.remove(os.path.join(data_dir, 'sub', 'd'))
+                create_random_file(os.path.join(data_dir, 'e'))
+                subprocess.run(
+                    cmd + ' -create_only_missing 2',
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    shell=True,
+                    timeout=42, check=True)
+                updated = read_hash_files(data_dir)
+                self.assertNotEqual(first, updated)
+                # no hash file or manifest of a deleted data file is left
+                for root, _, files in os.walk(data_dir):
+                    for filename in files:
+                        self.assertFalse(
+                            filename.startswith(('b.', 'd.')),
+                            os.path.join(root, filename))
+                # compare with complete new hashes
+                subprocess.run(
+                    cmd + ' -create_only_missing 0',
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    shell=True,
+                    timeout=42, check=True)
+                self.assertEqual(updated, read_hash_files(data_dir))
+                cpi = subprocess.run(
+                    'pfu check_checksum -loglevel 20 -dir ' + data_dir,
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    shell=True,
+                    timeout=42, check=True)
+                self.assertIn(b'data file without hash: 0', cpi.stderr)
+                self.assertIn(b'hash without data file: 0', cpi.stderr)
+                self.assertIn(b'data file with not matching hash(es): 0',
+                              cpi.stderr)
+
+    def test_script_pfu_create_checksum_hardlinks(self):
+        """
+        tests 'pfu create_checksum' with hardlinked files
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_dir = os.path.join(tmpdir, 'data')
+            os.makedirs(os.path.join(data_dir, 'sub'))
+            create_random_file(os.path.join(data_dir, 'a'))
+            create_random_file(os.path.join(data_dir, 'd'))
+            # copy without hardlinks as reference
+            shutil.copytree(data_dir, os.path.join(tmpdir, 'ref'))
+            shutil.copy(os.path.join(data_dir, 'a'),
+                        os.path.join(tmpdir, 'ref', 'b'))
+            shutil.copy(os.path.join(data_dir, 'a'),
+                        os.path.join(tmpdir, 'ref', 'sub', 'c'))
+            os.link(os.path.join(data_dir, 'a'), os.path.join(data_dir, 'b'))
+            os.link(os.path.join(data_dir, 'a'),
+                    os.path.join(data_dir, 'sub', 'c'))
+            dirs = [os.path.join(tmpdir, 'ref')]
+            for param in ['-jobs 1', '-jobs 4', '-jobs 4 -pool process',
+                          '-store many', '-create_only_missing 2']:
+                dirs.append(os.path.join(tmpdir, str(len(dirs))))
+                # copy with hardlinks
+                os.mkdir(dirs[-1])
+                for root, _, files in os.walk(data_dir):
+                    relpath = os.path.relpath(root, data_dir)
+                    os.makedirs(os.path.join(dirs[-1], relpath),
+                                exist_ok=True)
+                    for filename in files:
+                        os.link(os.path.join(root, filename),
+                                os.path.join(dirs[-1], relpath, filename))
+                param += ' -loglevel 20 -chunk_size 7 -buf_size 3 -dir '
+                param += dirs[-1]
+                cpi = subprocess.run(
+                    'pfu create_checksum ' + param,
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    shell=True,
+                    timeout=42, check=True)
+                if param.startswith('-jobs 4 -pool process'):
+                    # every worker process has its own cache
+                    self.assertIn(b'reads saved by hardlinks: ', cpi.stderr)
+                else:
+                    # 'a' is read once for 'a', 'b' and 'sub/c'
+                    self.assertIn(b'reads saved by hardlinks: 2',
+                                  cpi.stderr)
+            subprocess.run(
+                'pfu create_checksum -chunk_size 7 -buf_size 3 -dir ' +
+                dirs[0],
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True,
+                timeout=42, check=True)
+            for other in dirs[1:4]:
+                for relpath in ['.checksum.sha512',
+                                os.path.join('sub', '.checksum.sha512')]:
+                    with open(os.path.join(dirs[0], relpath), 'rb') as fd:
+                        expected = fd.read()
+                    with open(os.path.join(other, relpath), 'rb') as fd:
+                        self.assertEqual(fd.read(), expected)
+            cpi = subprocess.run(
+                'pfu check_checksum -loglevel 20 -dir ' +
+                ' '.join(dirs[4:]),
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True,
+                timeout=42, check=True)
+            self.assertIn(b'data file with not matching hash(es): 0',
+                          cpi.stderr)
+            self.assertEqual(
+                cpi.stderr.count(b'data file with matching hash(es): 4'), 2)
+            # the second directory is not read at all (hardlinks of the first)
+            self.assertIn(b'reads saved by hardlinks: 2', cpi.stderr)
+            self.assertIn(b'reads saved by hardlinks: 4', cpi.stderr)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -1,7 +1,7 @@
 """
 :Author: Daniel Mohr
 :Email: daniel.mohr@dlr.de
-:Date: 2021-05-25, 2021-08-31
+:Date: 2021-05-25, 2021-08-31, 2026-10-18
 :License: GNU GENERAL PUBLIC LICENSE, Version 3, 29 June 2007.
 
 tests the script 'pfu replicate'
@@ -22,6 +22,7 @@ Or you can run only one test, e. g.::
 
 import os
 import subprocess
+import sys
 import tempfile
 import unittest
 
@@ -36,7 +37,7 @@ except (ModuleNotFoundError, ImportError):
 class ScriptPfuReplicate(unittest.TestCase):
     """
     :Author: Daniel Mohr
-    :Date: 2021-05-25, 2021-08-31
+    :Date: 2021-05-25, 2021-08-31, 2026-10-18
     """
 
     def test_script_pfu_replicate_1(self):
@@ -103,6 +104,89 @@ class ScriptPfuReplicate(unittest.TestCase):
                     timeout=42, check=False)
                 self.assertTrue(checkoutput(cpi.stderr))
 
+    def test_script_pfu_replicate_in_process(self):
+        """
+        tests the script 'pfu replicate' with checksums in process
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        if not os.name == 'posix':
+            self.skipTest('"pfu replicate" is only working on posix systems')
+            return
+        cpi = subprocess.run(
+            'rsync --version',
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            shell=True,
+            timeout=42, check=False)
+        extraparam = ''
+        if cpi.returncode != 0:
+            if not sys.platform.startswith('linux'):
+                self.skipTest('rsync not available, skipping test')
+                return
+            # GNU cp is available
+            extraparam = ' -copy_program1 cp -copy_parameter1=-aT'
+            extraparam += ' -copy_program2 cp -copy_parameter2=-aT'
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src_dir = os.path.join(tmpdir, 'src')
+            dest_dirs = [os.path.join(tmpdir, 'dest1'),
+                         os.path.join(tmpdir, 'dest2')]
+            os.mkdir(src_dir)
+            for dest_dir in dest_dirs:
+                os.mkdir(dest_dir)
+            # create random data
+            create_random_directory_tree(src_dir, levels=3)
+            # create destinations
+            param = '-source ' + src_dir
+            param += ' -destination ' + ' '.join(dest_dirs)
+            param += ' -checksum_in_process 1 -extrasleeptime 0'
+            param += ' -checksum_program /nonexisting/sha256sum'
+            param += ' -sleeptime 1'  # deprecated
+            param += extraparam
+            cpi = subprocess.run(
+                'pfu replicate ' + param,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True,
+                timeout=28, check=True)
+            self.assertIn(b'-sleeptime is deprecated and ignored',
+                          cpi.stderr)
+            self._check_bsd_checksum_files(src_dir, dest_dirs)
+            # check checksums
+            for dest_dir in dest_dirs:
+                param = '-loglevel 20 -ignore_extension log status'
+                param += ' -dir ' + dest_dir
+                cpi = subprocess.run(
+                    'pfu check_checksum ' + param,
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    shell=True,
+                    timeout=42, check=False)
+                self.assertTrue(checkoutput(cpi.stderr))
+
+    def _check_bsd_checksum_files(self, src_dir, dest_dirs):
+        """
+        checks the checksum files (BSD-style) in the source and the status
+        files of the check in the destinations
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        for (dirpath, _, filenames) in os.walk(src_dir):
+            names = sorted(set(filenames) - {'.checksum'})
+            if not bool(names):
+                continue
+            with open(os.path.join(dirpath, '.checksum'),
+                      encoding='utf-8') as checksum_file:
+                lines = checksum_file.read().splitlines()
+            self.assertEqual(len(lines), len(names))
+            for (line, name) in zip(lines, names):
+                self.assertTrue(line.startswith(f'SHA256 ({name}) = '))
+            for dest_dir in dest_dirs:
+                path = os.path.join(dest_dir,
+                                    os.path.relpath(dirpath, src_dir))
+                self.assertEqual(
+                    os.path.getsize(os.path.join(path, '.checksum.status')),
+                    0)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -190,6 +190,47 @@ class ScriptPfuSimscrub(unittest.TestCase):
                 data = pickle.load(fd)
             self.assertEqual(data, 0)
 
+    def test_script_pfu_simscrub_io_mode(self):
+        """
+        tests 'pfu simscrub -io_mode'
+
+        :Author: Daniel Mohr
+        :Date: 2026-10-18
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            conf_dir = os.path.join(tmpdir, 'conf')
+            data_dir = os.path.join(tmpdir, 'data')
+            os.mkdir(data_dir)
+            for i in range(9):
+                create_random_file(os.path.join(data_dir, str(i)))
+            with open(os.path.join(data_dir, 'large'), 'wb') as fd:
+                fd.write(os.urandom(42424))
+            param = '-dir ' + data_dir
+            param += ' -config_data_directory ' + conf_dir
+            subprocess.run(
+                'pfu simscrub ' + param,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                shell=True,
+                timeout=42, check=True)
+            start_point = os.path.join(conf_dir, os.listdir(conf_dir)[0])
+            for io_mode in ['buffered', 'sequential-dontneed', 'direct']:
+                param = '-config_data_directory ' + conf_dir
+                param += ' -fileloglevel 1 -chunk_size 1000'
+                param += ' -io_mode ' + io_mode
+                cpi = subprocess.run(
+                    'pfu simscrub ' + param,
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    shell=True,
+                    timeout=42, check=True)
+                self.assertEqual(cpi.stdout,
+                                 b'do_scrubbing' + os.linesep.encode())
+                with open(os.path.join(start_point, 'log'),
+                          mode='r', encoding='utf-8') as fd:
+                    data = fd.readlines()
+                self.assertTrue(data[-1].endswith(
+                    'INFO finished scrubbing at 0/10\n'))
+                self.assertFalse(any('WARNING' in line for line in data))
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)